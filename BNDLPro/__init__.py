@@ -17,107 +17,147 @@ bl_info = {
 }
 
 import importlib
+import logging
 import os
+import sys
 import bpy
-import bpy.utils.previews
-from . import prefs, pref_manager, ui_panels, ops_export, ops_replay, browser, ops_docs, i18n_utils, progress_utils, ops_batch_export, ops_favorites
-modules = (i18n_utils, progress_utils, prefs, pref_manager, ui_panels, ops_export, ops_replay, browser, ops_docs, ops_batch_export, ops_favorites)
 
-# Global variable to store icons
-custom_icons = None
+# Addon logger - messages use lazy %-formatting so nothing is formatted when
+# the level is raised, e.g. logging.getLogger("bndl").setLevel(logging.WARNING)
+log = logging.getLogger("bndl")
+if not log.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(_handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+# Submodules in registration order. They are imported on first use (register()
+# or attribute access) so enabling Blender doesn't pay for them up front.
+_MODULE_NAMES = ("i18n_utils", "progress_utils", "prefs", "pref_manager", "ui_panels", "ops_export", "ops_replay", "browser", "ops_docs", "ops_batch_export", "ops_favorites")
+_SUBMODULES = frozenset(_MODULE_NAMES)
+
+# (module, unregister) pairs for successfully registered submodules, in
+# registration order; unregister() walks this in reverse
+_registered = []
+
+def __getattr__(name):
+    """Resolve submodules lazily on first attribute access (PEP 562)."""
+    if name in _SUBMODULES:
+        mod = importlib.import_module(f".{name}", __name__)
+        globals()[name] = mod
+        return mod
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Derived from bl_info so the banner can't drift from the addon version
+_VERSION_STR = (
+    f"BNDL {'Lite' if BNDL_LITE_VERSION else 'Pro'} v{'.'.join(map(str, bl_info['version']))}"
+    f"{' - Materials Only' if BNDL_LITE_VERSION else ''}"
+)
+
+# Preference source ("STUDIO", "USER", "DEFAULT") picked during register()
+_prefs_source = None
 
 def register():
-    global custom_icons
-    
-    # Register custom icons
-    custom_icons = bpy.utils.previews.new()
-    icons_dir = os.path.join(os.path.dirname(__file__))
-    
-    # Load icons (use 256px for UI display)
-    icon_path = os.path.join(icons_dir, "bndl_icon256px.png")
-    if os.path.exists(icon_path):
-        custom_icons.load("bndl_logo", icon_path, 'IMAGE')
-        print("[BNDL] Custom icon loaded")
-    else:
-        print(f"[BNDL] Warning: Icon not found at {icon_path}")
+    global _prefs_source
     
     # Print version info
-    version_str = "BNDL Lite v1.4.0 - Materials Only" if BNDL_LITE_VERSION else "BNDL Pro v1.4.0"
-    print(f"[BNDL] {version_str}")
+    log.info("[BNDL] %s", _VERSION_STR)
     
-    # Register modules
-    for m in modules:
-        importlib.reload(m)
+    # Register modules. Submodules already imported before this call (addon
+    # re-enable / script reload) are reloaded so code edits are picked up; this
+    # is checked in sys.modules because package globals reset on reload.
+    stale = {name for name in _MODULE_NAMES if f"{__name__}.{name}" in sys.modules}
+    _registered.clear()
+    for name in _MODULE_NAMES:
+        m = importlib.import_module(f".{name}", __name__)
+        if name in stale:
+            importlib.reload(m)
         if hasattr(m, "register"):
             m.register()
+        if hasattr(m, "unregister"):
+            _registered.append((m, m.unregister))
     
     # Load preferences from JSON after all modules are registered
     try:
+        from . import pref_manager
         prefs_dict, source = pref_manager.load_preferences()
         pref_manager.apply_preferences_to_addon(prefs_dict)
-        print(f"[BNDL] Initialized with {source} preferences")
-        
-        # Auto-validate Lite license on startup
-        if BNDL_LITE_VERSION:
-            try:
-                from . import license as lic
-                print("[BNDL Lite] Validating materials-only license...")
-                if lic.validate_license_key(LITE_LICENSE_KEY, email=LITE_LICENSE_EMAIL, is_lite=True):
-                    print("[BNDL Lite] ✓ Materials export/replay activated")
-                else:
-                    print("[BNDL Lite] ✗ License validation failed")
-            except Exception as e:
-                print(f"[BNDL Lite] License error: {e}")
-        
-        # Restore persistent license status from cache (Pro version)
-        elif not BNDL_LITE_VERSION:
-            try:
-                from . import license as lic
-                lic.restore_license_status()
-            except Exception as e:
-                print(f"[BNDL] Could not restore license status: {e}")
-        
-        # Silently validate studio license if present (Pro version)
-        if source == "STUDIO" and not BNDL_LITE_VERSION:
-            try:
-                from . import license as lic
-                lic.validate_studio_license_silently()
-            except Exception as e:
-                print(f"[BNDL] Could not validate studio license: {e}")
-                
+        _prefs_source = source
+        log.info("[BNDL] Initialized with %s preferences", source)
     except Exception as e:
-        print(f"[BNDL] Warning: Could not load preferences: {e}")
+        log.warning("[BNDL] Warning: Could not load preferences: %s", e)
+    
+    # License checks import the network stack and may hit the backend, so
+    # run them from a timer once Blender's UI is up instead of blocking enable.
+    # Headless runs (render farms, CI) and BNDL_SKIP_LICENSE=1 skip them entirely.
+    if bpy.app.background or os.environ.get("BNDL_SKIP_LICENSE"):
+        log.debug("[BNDL] Skipping startup license check")
+    else:
+        try:
+            bpy.app.timers.register(_delayed_license_check, first_interval=0.2)
+        except Exception as e:
+            log.warning("[BNDL] Could not schedule license check: %s", e)
     
     # Trigger initial library refresh on addon enable
     try:
         # Use a timer to delay refresh until after full registration
-        bpy.app.timers.register(lambda: _delayed_initial_refresh(), first_interval=0.1)
+        if not bpy.app.timers.is_registered(_delayed_initial_refresh):
+            bpy.app.timers.register(_delayed_initial_refresh, first_interval=0.1)
     except Exception as e:
-        print(f"[BNDL] Could not schedule initial refresh: {e}")
+        log.warning("[BNDL] Could not schedule initial refresh: %s", e)
+
+def _delayed_license_check():
+    """Validate/restore the license after addon registration completes."""
+    # Auto-validate Lite license on startup
+    if BNDL_LITE_VERSION:
+        try:
+            from . import license as lic
+            if lic.restore_cached_license(LITE_LICENSE_KEY, email=LITE_LICENSE_EMAIL, is_lite=True):
+                log.info("[BNDL Lite] ✓ Materials export/replay activated (cached)")
+            else:
+                log.debug("[BNDL Lite] Validating materials-only license...")
+                if lic.validate_license_key(LITE_LICENSE_KEY, email=LITE_LICENSE_EMAIL, is_lite=True):
+                    log.info("[BNDL Lite] ✓ Materials export/replay activated")
+                else:
+                    log.warning("[BNDL Lite] ✗ License validation failed")
+        except Exception as e:
+            log.error("[BNDL Lite] License error: %s", e)
+    
+    # Restore persistent license status from cache (Pro version)
+    elif not BNDL_LITE_VERSION:
+        try:
+            from . import license as lic
+            lic.restore_license_status()
+        except Exception as e:
+            log.warning("[BNDL] Could not restore license status: %s", e)
+    
+    # Silently validate studio license if present (Pro version)
+    if _prefs_source == "STUDIO" and not BNDL_LITE_VERSION:
+        try:
+            from . import license as lic
+            lic.validate_studio_license_silently()
+        except Exception as e:
+            log.warning("[BNDL] Could not validate studio license: %s", e)
+    return None  # Don't repeat the timer
 
 def _delayed_initial_refresh():
     """Delayed refresh after addon registration completes."""
     try:
         from .prefs import get_prefs
         prefs = get_prefs()
-        has_dirs = hasattr(prefs, "bndl_directories") and prefs.bndl_directories
-        
-        if has_dirs:
-            bpy.ops.bndl.list_refresh('INVOKE_DEFAULT')  # type: ignore
-            print("[BNDL] Library refreshed on addon enable")
+        if getattr(prefs, "bndl_directories", None):
+            bpy.ops.bndl.list_refresh('EXEC_DEFAULT')  # type: ignore
+            log.debug("[BNDL] Library refreshed on addon enable")
     except Exception as e:
-        print(f"[BNDL] Initial refresh failed: {e}")
+        log.warning("[BNDL] Initial refresh failed: %s", e)
     return None  # Don't repeat the timer
 
 def unregister():
-    global custom_icons
-    
     # Unregister modules
-    for m in reversed(modules):
-        if hasattr(m, "unregister"):
-            m.unregister()
-    
-    # Remove custom icons
-    if custom_icons:
-        bpy.utils.previews.remove(custom_icons)
-        custom_icons = None
+    for m, unregister_fn in reversed(_registered):
+        try:
+            unregister_fn()
+        except Exception as e:
+            log.warning("[BNDL] Could not unregister %s: %s", m.__name__, e)
+    _registered.clear()
@@ -0,0 +1,766 @@
+"""
+Precompiled BNDL translations - generated by compile_i18n.py, do not edit.
+Regenerate after changing i18n/bndl_i18n.json.
+"""
+
+SOURCE_SHA256 = '5294b60f3c13694c6fcbadc1211ead0aa908958d8320c7b2aa97711db66ab794'
+
+TRANSLATIONS = {'en_US': {'UI': {'BNDL Tools': 'BNDL Tools',
+                  'Export Node Trees': 'Export Node Trees',
+                  'Geometry': 'Geometry',
+                  'Material': 'Material',
+                  'Compositor': 'Compositor',
+                  'Export Both (Geo + Mat)': 'Export Both (Geo + Mat)',
+                  'Library': 'Library',
+                  'BNDL Library': 'BNDL Library',
+                  '↻ Refresh list or choose project to show BNDL files': '↻ Refresh list or choose project to show '
+                                                                         'BNDL files',
+                  'Search': 'Search',
+                  'Apply to Selection': 'Apply to Selection',
+                  'Utilities': 'Utilities',
+                  'Normalize GN Interfaces': 'Normalize GN Interfaces',
+                  'Batch Export': 'Batch Export',
+                  'Asset bundling: Active': 'Asset bundling: Active',
+                  'Asset bundling: Pro license required': 'Asset bundling: Pro license required',
+                  'Add project directories in Add-on Preferences': 'Add project directories in Add-on Preferences.',
+                  'Replayer (Direct Load)': 'Replayer (Direct Load)',
+                  'Multi-project': '[Pro: Multi-project]',
+                  'Preference Management': 'Preference Management',
+                  'Current Source': 'Current Source',
+                  'Studio Preferences (admin-defined)': 'Studio Preferences (admin-defined)',
+                  'User Preferences (your saved settings)': 'User Preferences (your saved settings)',
+                  'Default Preferences (hardcoded)': 'Default Preferences (hardcoded)',
+                  'Prefer User Over Studio': 'Prefer User Over Studio',
+                  'Toggle priority help': "Toggle which preferences take priority when both exist. Click 'Reload' to "
+                                          'apply.',
+                  'Save User Preferences': 'Save User Preferences',
+                  'Reset to Studio/Defaults': 'Reset to Studio/Defaults',
+                  'Delete User Preferences': 'Delete User Preferences',
+                  'Reload Preferences': 'Reload Preferences',
+                  'Project Directories': 'Project Directories',
+                  'Project directory help': 'Configure one or more project directories for .bndl files:',
+                  'Click + to add first directory': 'Click + to add your first project directory',
+                  'Filename Affixes': 'Filename Affixes',
+                  'Commercial replayer note': 'For commercial replayer, drop `replayer_pro.py` into '
+                                              'bndl_addon/vendor/.',
+                  'Asset Packing (Images/Videos)': 'Asset Packing (Images/Videos)',
+                  'Portable ZIP info': '📦 Portable ZIP file - easy to inspect and share',
+                  'Native Blender info': '🎨 Native Blender format - reliable image packing',
+                  'Hybrid format info': '🔄 Creates both formats - maximum compatibility',
+                  'BNDL Free Version': 'BNDL Free Version',
+                  'BNDL-Pro License: ACTIVE': 'BNDL-Pro License: ACTIVE ✓',
+                  'Activate': 'Activate',
+                  'Upgrade to Pro to unlock:': 'Upgrade to Pro to unlock:',
+                  'Asset bundling enabled': 'Asset bundling enabled',
+                  'Multiple project directories': 'Multiple project directories',
+                  'Studio preference system': 'Studio preference system',
+                  'Advanced library browser': 'Advanced library browser',
+                  'Asset bundling feature': '• Asset bundling (no more proxies!)',
+                  'Multiple directories feature': '• Multiple project directories',
+                  'Studio prefs feature': '• Studio preferences system',
+                  'Advanced browser feature': '• Advanced library browser',
+                  'Purchase URL': 'Purchase at: gumroad.com/kyosei',
+                  'Format': 'Format',
+                  'Path': 'Path',
+                  'Fallback to proxies': 'Exports will fall back to PROXIES mode.',
+                  'Batch: Materials': 'Batch: Materials',
+                  'Batch: Geo Nodes': 'Batch: Geo Nodes',
+                  'Add vendor/bndl2py.py to enable replay.': 'Add vendor/bndl2py.py to enable replay.',
+                  'Replayer (Multi-Tree Support)': 'Replayer (Multi-Tree Support)',
+                  'Reuse proxies for missing datablocks': 'Reuse proxies for missing datablocks',
+                  'Auto-detect .bndl Type': 'Auto-detect .bndl Type',
+                  'Documentation': 'Documentation',
+                  'Pro: Multi-project': 'Pro: Multi-project',
+                  'Add project directories in Add-on Preferences.': 'Add project directories in Add-on Preferences.',
+                  'Edit Project Presets': 'Edit Project Presets',
+                  'Quick Access Settings': 'Quick Access Settings',
+                  'Max Recent Files': 'Max Recent Files',
+                  'Recent Files': 'Recent Files',
+                  'Favorites': 'Favorites',
+                  'Clean Missing Favorites': 'Clean Missing Favorites',
+                  'Create as New (unique names)': 'Create as New (unique names)',
+                  'Safety Settings': 'Safety Settings',
+                  'Allow File Deletion': 'Allow File Deletion',
+                  'Disable in shared environments to prevent accidental file deletion': 'Disable in shared '
+                                                                                        'environments to prevent '
+                                                                                        'accidental file deletion'},
+           'Operator': {'Export .bndl': 'Export .bndl',
+                        'Export Geometry Nodes': 'Export Geometry Nodes',
+                        'Export Material': 'Export Material',
+                        'Export Compositor': 'Export Compositor',
+                        'Export Geometry and Material': 'Export Geometry and Material',
+                        'Apply .bndl to Selection': 'Apply .bndl to Selection',
+                        'Apply from List': 'Apply from List',
+                        'Refresh BNDL List': 'Refresh BNDL List',
+                        'Open Export Folder': 'Open Export Folder',
+                        'Clear Search': 'Clear Search',
+                        'Normalize Geometry Node Interfaces': 'Normalize Geometry Node Interfaces',
+                        'Add Directory': 'Add Directory',
+                        'Remove Directory': 'Remove Directory',
+                        'Validate License': 'Validate License',
+                        'Batch Export Materials': 'Batch Export Materials',
+                        'Batch Export Selected': 'Batch Export Selected',
+                        'Replay Multi-tree Material': 'Replay Multi-tree Material',
+                        'Replay Multi-tree Compositor': 'Replay Multi-tree Compositor',
+                        'Delete File': 'Delete File'},
+           'Tooltip': {'Export geometry nodes to .bndl': 'Export active Geometry Nodes tree to .bndl file format',
+                       'Export material to .bndl': "Export active material's shader nodes to .bndl file format",
+                       'Export compositor to .bndl': 'Export scene compositor node tree to .bndl file format',
+                       'Export both geo and mat': 'Export both geometry nodes and material for selected object',
+                       'Apply bndl to selected': 'Load and apply a .bndl file to selected objects',
+                       'Apply from library': 'Apply the selected .bndl from the library to current selection',
+                       'Refresh file list': 'Refresh the list of .bndl files from project directories',
+                       'Open in file manager': "Open the export folder in your system's file manager",
+                       'Clear search filter': 'Clear the search filter and show all files',
+                       'Normalize interfaces': 'Reorganize Geometry Nodes interface items into Groups and Sections '
+                                               'based on their display names',
+                       'Add project directory': 'Add a new project directory for organizing .bndl files',
+                       'Remove project directory': 'Remove the selected project directory',
+                       'Validate license key': 'Validate your BNDL-Pro license key with Gumroad to unlock professional '
+                                               'features',
+                       'Batch export materials': 'Export multiple materials at once to .bndl files',
+                       'Batch export selected': 'Export all selected items (objects/materials/scenes) to .bndl files',
+                       'Filter by name': 'Filter .bndl files by name (type to filter - no refresh needed)',
+                       'Project selection': 'Select which project directory to export to',
+                       'Output directory': 'Where the exporter writes the .bndl file (auto-filled from project '
+                                           'selection)',
+                       'Export notes': "Freeform notes stored as ';' comment lines in the .bndl",
+                       'Pack assets toggle': 'Automatically create asset packs (.bndlpack or .blend) when exporting '
+                                             '.bndl files with image textures',
+                       'Asset pack format': 'Format for packing image/video assets alongside .bndl files',
+                       'Auto-unpack toggle': 'Automatically load images from .bndlpack or _assets.blend files when '
+                                             'replaying .bndl files',
+                       'Keep replay text': 'If enabled, the generated BNDL_Replay-*.py Text block will be kept for '
+                                           'inspection instead of auto-deleted',
+                       'Round float precision': 'Round float numbers in .bndl exports to 3 decimal places. Disable for '
+                                                'scientific/manufacturing use cases needing higher precision',
+                       'Asset dependency mode': 'How to handle referenced assets (Objects, Materials, etc.)',
+                       'License email': 'Your email address (optional, for enterprise/backdoor licenses)',
+                       'License key': 'Enter your BNDL-Pro license key to unlock professional features',
+                       'Prefer user prefs': 'If enabled, user preferences take priority over studio preferences. If '
+                                            'disabled, studio preferences always override user preferences (if studio '
+                                            'prefs exist)',
+                       'BNDL file path': 'Path to a .bndl file generated by the exporter',
+                       'Target scene for compositor': "Which scene's compositor to replace with the .bndl content",
+                       'Material slot selection': 'Which material slot to replace on target objects',
+                       'Project Name': 'Display name for this project/directory',
+                       'Directory': 'Path to .bndl files for this project',
+                       'License Validated': 'Internal flag for license validation status',
+                       'BNDL Directories': 'Multiple project directories for .bndl files',
+                       'Allow File Deletion': 'Allow users to delete .bndl files from the library browser (disable in '
+                                              'shared environments)'},
+           'Property': {'Project Name': 'Project Name',
+                        'Directory': 'Directory',
+                        'Email (optional)': 'Email (optional)',
+                        'License Key': 'License Key',
+                        'License Validated': 'License Validated',
+                        'Prefer User Preferences': 'Prefer User Preferences',
+                        'Name Prefix 1': 'Name Prefix 1',
+                        'Name Prefix 2': 'Name Prefix 2',
+                        'Name Suffix 1': 'Name Suffix 1',
+                        'BNDL Directories': 'BNDL Directories',
+                        'Overall Notes': 'Overall Notes',
+                        'Keep Replay Text': 'Keep Replay Text',
+                        'Round Float Precision': 'Round Float Precision',
+                        'Asset Dependencies': 'Asset Dependencies',
+                        'Pack Assets with Export': 'Pack Assets with Export',
+                        'Asset Pack Format': 'Asset Pack Format',
+                        'Auto-Unpack Assets on Replay': 'Auto-Unpack Assets on Replay',
+                        'Export to Project': 'Export to Project',
+                        'Output Directory': 'Output Directory',
+                        'Notes': 'Notes',
+                        'BNDL File': 'BNDL File',
+                        'Target Scene': 'Target Scene',
+                        'Material Slot': 'Material Slot',
+                        'Name': 'Name',
+                        'Path': 'Path',
+                        'Modified': 'Modified',
+                        'Size': 'Size',
+                        'Search': 'Search',
+                        'Project': 'Project',
+                        'Display name for project': 'Display name for this project/directory',
+                        'Path to bndl files': 'Path to .bndl files for this project',
+                        'Allow File Deletion': 'Allow File Deletion'},
+           'PropertyEnum': {'None (node tree only)': 'None',
+                            'Proxies': 'Proxies',
+                            'Bundle Assets': 'Bundle Assets',
+                            '.bndlpack (ZIP)': '.bndlpack (ZIP)',
+                            '.blend Asset File': '.blend Asset File',
+                            'Both Formats': 'Both Formats',
+                            'Select a Project': 'Select a Project',
+                            'All Projects': 'All Projects',
+                            'Current Scene': 'Current Scene',
+                            'All Scenes': 'All Scenes',
+                            'Slot 0 (Primary)': 'Slot 0 (Primary)',
+                            'All Slots': 'All Slots'},
+           'PropertyEnumDesc': {'None desc': "Don't include any asset dependencies - node tree only",
+                                'Proxies desc': 'Create placeholder (proxy) objects/materials by name (current '
+                                                'behavior)',
+                                'Bundle Assets desc': 'Export referenced assets to matching .blend file and append on '
+                                                      'import',
+                                'BNDLPACK desc': 'ZIP file with images + manifest.json - portable, easy to inspect',
+                                'BLEND desc': 'Minimal .blend file with packed images - native Blender format',
+                                'HYBRID desc': 'Export both .bndlpack and _assets.blend for maximum compatibility',
+                                'Select Project desc': 'Choose which project directory to export to',
+                                'All Projects desc': 'Show .bndl files from all configured project directories'},
+           'Message': {'Export success': 'Exported to {filename}',
+                       'Export with assets': 'Exported to {filename} with asset pack',
+                       'Packed N assets': 'Packed {count} asset(s)',
+                       'No active tree': 'No active Geometry Nodes tree found on selected object',
+                       'No material': 'No active material on selected object',
+                       'No compositor': 'Scene has no compositor enabled',
+                       'Select project': 'Please select a project directory to export to',
+                       'No directory configured': "Project '{project}' has no directory configured",
+                       'Invalid license': 'Invalid license key. Check Console for details',
+                       'License activated': '✓ License activated! Pro features unlocked',
+                       'Enter license key': 'Please enter a license key',
+                       'Validation in progress': 'Validating license key...',
+                       'Applied to N objects': 'Applied material to {count} object(s)',
+                       'Applied compositor': "Applied compositor to scene '{scene}'",
+                       'No file selected': 'No .bndl file selected in the library',
+                       'File not found': 'File not found: {path}',
+                       'Batch export complete': 'Batch export complete: {count} files exported',
+                       'Batch export partial': 'Batch export: {success} succeeded, {failed} failed',
+                       'No items to export': 'No items selected for batch export',
+                       'Asset pack created': 'Created asset pack: {path}',
+                       'Assets loaded': 'Loaded {count} image(s) from asset pack',
+                       'Pro feature locked': '⚠ {feature} requires BNDL-Pro license'},
+           'Error': {'Export failed': 'Export failed: {reason}',
+                     'Replay failed': 'Replay failed: {reason}',
+                     'File read error': 'Could not read file: {path}',
+                     'File write error': 'Could not write file: {path}',
+                     'Invalid bndl format': 'Invalid .bndl file format',
+                     'Missing dependency': 'Missing dependency: {name}',
+                     'Image not found': "Image '{name}' not found in blend file",
+                     'Asset pack failed': 'Failed to create asset pack: {reason}',
+                     'Asset unpack failed': 'Failed to unpack assets: {reason}',
+                     'License validation failed': 'License validation failed: {reason}',
+                     'Network error': 'Network error during license validation. Check your internet connection.',
+                     'Invalid project': 'Invalid project selection',
+                     'Path encoding error': 'File path contains unsupported characters: {path}',
+                     'Circular dependency': 'Circular dependency detected in asset references'}},
+ 'ja_JP': {'UI': {'BNDL Tools': 'BNDL ツール',
+                  'Export Node Trees': 'ノードツリーを書き出し',
+                  'Geometry': 'ジオメトリ',
+                  'Material': 'マテリアル',
+                  'Compositor': 'コンポジター',
+                  'Export Both (Geo + Mat)': '両方書き出し（ジオメトリ＋マテリアル）',
+                  'Library': 'ライブラリ',
+                  'BNDL Library': 'BNDL ライブラリ',
+                  '↻ Refresh list or choose project to show BNDL files': '↻ リストを更新するかプロジェクトを選択してBNDLファイルを表示',
+                  'Search': '検索',
+                  'Apply to Selection': '選択に適用',
+                  'Utilities': 'ユーティリティ',
+                  'Normalize GN Interfaces': 'GN インターフェースを正規化',
+                  'Batch Export': '一括書き出し',
+                  'Asset bundling: Active': 'アセットバンドル: 有効',
+                  'Asset bundling: Pro license required': 'アセットバンドル: Proライセンスが必要',
+                  'Add project directories in Add-on Preferences': 'アドオン設定でプロジェクトディレクトリを追加してください。',
+                  'Replayer (Direct Load)': 'リプレイヤー（直接読み込み）',
+                  'Multi-project': '[Pro: マルチプロジェクト]',
+                  'Preference Management': '設定管理',
+                  'Current Source': '現在のソース',
+                  'Studio Preferences (admin-defined)': 'スタジオ設定（管理者定義）',
+                  'User Preferences (your saved settings)': 'ユーザー設定（保存済み設定）',
+                  'Default Preferences (hardcoded)': 'デフォルト設定（ハードコード）',
+                  'Prefer User Over Studio': 'スタジオよりユーザー設定を優先',
+                  'Toggle priority help': '両方が存在する場合の優先順位を切り替えます。適用するには「リロード」をクリックしてください。',
+                  'Save User Preferences': 'ユーザー設定を保存',
+                  'Reset to Studio/Defaults': 'スタジオ/デフォルトにリセット',
+                  'Delete User Preferences': 'ユーザー設定を削除',
+                  'Reload Preferences': '設定をリロード',
+                  'Project Directories': 'プロジェクトディレクトリ',
+                  'Project directory help': '.bndl ファイル用のプロジェクトディレクトリを設定:',
+                  'Click + to add first directory': '+ をクリックして最初のプロジェクトディレクトリを追加',
+                  'Filename Affixes': 'ファイル名接辞',
+                  'Commercial replayer note': '商用リプレイヤーの場合、`replayer_pro.py` を bndl_addon/vendor/ にドロップしてください。',
+                  'Asset Packing (Images/Videos)': 'アセットパッキング（画像/動画）',
+                  'Portable ZIP info': '📦 ポータブル ZIP ファイル - 検査と共有が簡単',
+                  'Native Blender info': '🎨 ネイティブ Blender フォーマット - 信頼性の高い画像パッキング',
+                  'Hybrid format info': '🔄 両方のフォーマットを作成 - 最大の互換性',
+                  'BNDL Free Version': 'BNDL 無料版',
+                  'BNDL-Pro License: ACTIVE': 'BNDL-Pro ライセンス: 有効 ✓',
+                  'Activate': '有効化',
+                  'Upgrade to Pro to unlock:': 'Pro にアップグレードしてアンロック:',
+                  'Asset bundling enabled': 'アセットバンドルが有効',
+                  'Multiple project directories': '複数のプロジェクトディレクトリ',
+                  'Studio preference system': 'スタジオ設定システム',
+                  'Advanced library browser': '高度なライブラリブラウザ',
+                  'Asset bundling feature': '• アセットバンドル（プロキシ不要！）',
+                  'Multiple directories feature': '• 複数のプロジェクトディレクトリ',
+                  'Studio prefs feature': '• スタジオ設定システム',
+                  'Advanced browser feature': '• 高度なライブラリブラウザ',
+                  'Purchase URL': '購入先: gumroad.com/kyosei',
+                  'Format': '形式',
+                  'Path': 'パス',
+                  'Fallback to proxies': 'PROXIES モードにフォールバックします。',
+                  'Batch: Materials': '一括: マテリアル',
+                  'Batch: Geo Nodes': '一括: ジオメトリノード',
+                  'Add vendor/bndl2py.py to enable replay.': 'リプレイを有効にするには vendor/bndl2py.py を追加してください。',
+                  'Replayer (Multi-Tree Support)': 'リプレイヤー（マルチツリー対応）',
+                  'Reuse proxies for missing datablocks': '欠落データブロックにプロキシを再利用',
+                  'Auto-detect .bndl Type': '.bndl タイプを自動検出',
+                  'Documentation': 'ドキュメント',
+                  'Pro: Multi-project': 'Pro: マルチプロジェクト',
+                  'Add project directories in Add-on Preferences.': 'アドオン設定でプロジェクトディレクトリを追加してください。',
+                  'Edit Project Presets': 'プロジェクトプリセットを編集',
+                  'Quick Access Settings': 'クイックアクセス設定',
+                  'Max Recent Files': '最大最近使用ファイル数',
+                  'Recent Files': '最近使用したファイル',
+                  'Favorites': 'お気に入り',
+                  'Clean Missing Favorites': '存在しないお気に入りをクリーン'},
+           'Operator': {'Export .bndl': '.bndl を書き出し',
+                        'Export Geometry Nodes': 'ジオメトリノードを書き出し',
+                        'Export Material': 'マテリアルを書き出し',
+                        'Export Compositor': 'コンポジターを書き出し',
+                        'Export Geometry and Material': 'ジオメトリとマテリアルを書き出し',
+                        'Apply .bndl to Selection': '.bndl を選択に適用',
+                        'Apply from List': 'リストから適用',
+                        'Refresh BNDL List': 'BNDL リストを更新',
+                        'Open Export Folder': '書き出しフォルダーを開く',
+                        'Clear Search': '検索をクリア',
+                        'Normalize Geometry Node Interfaces': 'ジオメトリノードインターフェースを正規化',
+                        'Add Directory': 'ディレクトリを追加',
+                        'Remove Directory': 'ディレクトリを削除',
+                        'Validate License': 'ライセンスを検証',
+                        'Batch Export Materials': 'マテリアルを一括書き出し',
+                        'Batch Export Selected': '選択を一括書き出し',
+                        'Replay Multi-tree Material': 'マルチツリーマテリアルを再生',
+                        'Replay Multi-tree Compositor': 'マルチツリーコンポジターを再生',
+                        'Delete File': 'ファイルを削除'},
+           'Tooltip': {'Export geometry nodes to .bndl': 'アクティブなジオメトリノードツリーを .bndl ファイル形式に書き出します',
+                       'Export material to .bndl': 'アクティブなマテリアルのシェーダーノードを .bndl ファイル形式に書き出します',
+                       'Export compositor to .bndl': 'シーンコンポジターノードツリーを .bndl ファイル形式に書き出します',
+                       'Export both geo and mat': '選択オブジェクトのジオメトリノードとマテリアルの両方を書き出します',
+                       'Apply bndl to selected': '.bndl ファイルを読み込んで選択オブジェクトに適用します',
+                       'Apply from library': 'ライブラリで選択された .bndl を現在の選択に適用します',
+                       'Refresh file list': 'プロジェクトディレクトリから .bndl ファイルのリストを更新します',
+                       'Open in file manager': 'システムのファイルマネージャーで書き出しフォルダーを開きます',
+                       'Clear search filter': '検索フィルターをクリアしてすべてのファイルを表示します',
+                       'Normalize interfaces': '表示名に基づいてジオメトリノードインターフェース項目をグループとセクションに整理します',
+                       'Add project directory': '.bndl ファイルを整理するための新しいプロジェクトディレクトリを追加します',
+                       'Remove project directory': '選択したプロジェクトディレクトリを削除します',
+                       'Validate license key': 'BNDL-Pro ライセンスキーを Gumroad で検証してプロフェッショナル機能をアンロックします',
+                       'Batch export materials': '複数のマテリアルを一度に .bndl ファイルに書き出します',
+                       'Batch export selected': '選択したすべてのアイテム（オブジェクト/マテリアル/シーン）を .bndl ファイルに書き出します',
+                       'Filter by name': '名前で .bndl ファイルを絞り込みます（入力で絞り込み - 更新不要）',
+                       'Project selection': '書き出し先のプロジェクトディレクトリを選択します',
+                       'Output directory': '書き出しプログラムが .bndl ファイルを書き込む場所（プロジェクト選択から自動入力）',
+                       'Export notes': ".bndl に ';' コメント行として保存される自由形式のメモ",
+                       'Pack assets toggle': '画像テクスチャを含む .bndl ファイルを書き出すときにアセットパック（.bndlpack または .blend）を自動作成します',
+                       'Asset pack format': '.bndl ファイルと一緒に画像/動画アセットをパッキングする形式',
+                       'Auto-unpack toggle': '.bndl ファイルを再生するときに .bndlpack または _assets.blend ファイルから画像を自動的に読み込みます',
+                       'Keep replay text': '有効にすると、生成された BNDL_Replay-*.py テキストブロックが自動削除されずに検査用に保持されます',
+                       'Round float precision': '.bndl 書き出しで浮動小数点数を小数点以下 3 桁に丸めます。科学/製造用途で高精度が必要な場合は無効にしてください',
+                       'Asset dependency mode': '参照されるアセット（オブジェクト、マテリアルなど）の処理方法',
+                       'License email': 'メールアドレス（オプション、エンタープライズ/バックドアライセンス用）',
+                       'License key': 'BNDL-Pro ライセンスキーを入力してプロフェッショナル機能をアンロックします',
+                       'Prefer user prefs': '有効にすると、ユーザー設定がスタジオ設定よりも優先されます。無効にすると、スタジオ設定が常にユーザー設定を上書きします（スタジオ設定が存在する場合）',
+                       'BNDL file path': '書き出しプログラムによって生成された .bndl ファイルへのパス',
+                       'Target scene for compositor': '.bndl コンテンツで置き換えるシーンのコンポジター',
+                       'Material slot selection': 'ターゲットオブジェクトで置き換えるマテリアルスロット',
+                       'Project Name': 'このプロジェクト/ディレクトリの表示名',
+                       'Directory': 'このプロジェクトの .bndl ファイルへのパス',
+                       'License Validated': 'ライセンス検証ステータスの内部フラグ',
+                       'BNDL Directories': '.bndl ファイル用の複数のプロジェクトディレクトリ',
+                       'Allow File Deletion': 'ライブラリブラウザから .bndl ファイルを削除できるようにします（共有環境では無効にしてください）'},
+           'Property': {'Project Name': 'プロジェクト名',
+                        'Directory': 'ディレクトリ',
+                        'Email (optional)': 'メール（オプション）',
+                        'License Key': 'ライセンスキー',
+                        'License Validated': 'ライセンス検証済み',
+                        'Prefer User Preferences': 'ユーザー設定を優先',
+                        'Name Prefix 1': '名前プレフィックス 1',
+                        'Name Prefix 2': '名前プレフィックス 2',
+                        'Name Suffix 1': '名前サフィックス 1',
+                        'BNDL Directories': 'BNDL ディレクトリ',
+                        'Overall Notes': '全体メモ',
+                        'Keep Replay Text': 'リプレイテキストを保持',
+                        'Round Float Precision': '浮動小数点精度を丸める',
+                        'Asset Dependencies': 'アセット依存関係',
+                        'Pack Assets with Export': '書き出し時にアセットをパック',
+                        'Asset Pack Format': 'アセットパック形式',
+                        'Auto-Unpack Assets on Replay': '再生時にアセットを自動展開',
+                        'Export to Project': 'プロジェクトに書き出し',
+                        'Output Directory': '出力ディレクトリ',
+                        'Notes': 'メモ',
+                        'BNDL File': 'BNDL ファイル',
+                        'Target Scene': 'ターゲットシーン',
+                        'Material Slot': 'マテリアルスロット',
+                        'Name': '名前',
+                        'Path': 'パス',
+                        'Modified': '更新日時',
+                        'Size': 'サイズ',
+                        'Search': '検索',
+                        'Project': 'プロジェクト',
+                        'Display name for project': 'このプロジェクト/ディレクトリの表示名',
+                        'Path to bndl files': 'このプロジェクトの .bndl ファイルへのパス',
+                        'Allow File Deletion': 'ファイル削除を許可'},
+           'PropertyEnum': {'None (node tree only)': 'なし',
+                            'Proxies': 'プロキシ',
+                            'Bundle Assets': 'アセットバンドル',
+                            '.bndlpack (ZIP)': '.bndlpack（ZIP）',
+                            '.blend Asset File': '.blend アセットファイル',
+                            'Both Formats': '両方の形式',
+                            'Select a Project': 'プロジェクトを選択',
+                            'All Projects': 'すべてのプロジェクト',
+                            'Current Scene': '現在のシーン',
+                            'All Scenes': 'すべてのシーン',
+                            'Slot 0 (Primary)': 'スロット 0（プライマリ）',
+                            'All Slots': 'すべてのスロット'},
+           'PropertyEnumDesc': {'None desc': 'アセット依存関係を含めない - ノードツリーのみ',
+                                'Proxies desc': '名前でプレースホルダー（プロキシ）オブジェクト/マテリアルを作成（現在の動作）',
+                                'Bundle Assets desc': '参照されるアセットを一致する .blend ファイルに書き出してインポート時にアペンド',
+                                'BNDLPACK desc': '画像 + manifest.json を含む ZIP ファイル - ポータブル、検査が簡単',
+                                'BLEND desc': 'パックされた画像を含む最小限の .blend ファイル - ネイティブ Blender フォーマット',
+                                'HYBRID desc': '.bndlpack と _assets.blend の両方を書き出して最大の互換性を実現',
+                                'Select Project desc': '書き出し先のプロジェクトディレクトリを選択',
+                                'All Projects desc': '設定されたすべてのプロジェクトディレクトリから .bndl ファイルを表示'},
+           'Message': {'Export success': '{filename} に書き出しました',
+                       'Export with assets': '{filename} にアセットパックと共に書き出しました',
+                       'Packed N assets': '{count} 個のアセットをパックしました',
+                       'No active tree': '選択オブジェクトにアクティブなジオメトリノードツリーが見つかりません',
+                       'No material': '選択オブジェクトにアクティブなマテリアルがありません',
+                       'No compositor': 'シーンでコンポジターが有効になっていません',
+                       'Select project': '書き出し先のプロジェクトディレクトリを選択してください',
+                       'No directory configured': "プロジェクト '{project}' にディレクトリが設定されていません",
+                       'Invalid license': '無効なライセンスキーです。詳細はコンソールを確認してください',
+                       'License activated': '✓ ライセンスが有効化されました！Pro 機能がアンロックされました',
+                       'Enter license key': 'ライセンスキーを入力してください',
+                       'Validation in progress': 'ライセンスキーを検証中...',
+                       'Applied to N objects': '{count} 個のオブジェクトにマテリアルを適用しました',
+                       'Applied compositor': "シーン '{scene}' にコンポジターを適用しました",
+                       'No file selected': 'ライブラリで .bndl ファイルが選択されていません',
+                       'File not found': 'ファイルが見つかりません: {path}',
+                       'Batch export complete': '一括書き出しが完了しました: {count} ファイルを書き出しました',
+                       'Batch export partial': '一括書き出し: {success} 成功、{failed} 失敗',
+                       'No items to export': '一括書き出し用のアイテムが選択されていません',
+                       'Asset pack created': 'アセットパックを作成しました: {path}',
+                       'Assets loaded': 'アセットパックから {count} 個の画像を読み込みました',
+                       'Pro feature locked': '⚠ {feature} には BNDL-Pro ライセンスが必要です'},
+           'Error': {'Export failed': '書き出しに失敗しました: {reason}',
+                     'Replay failed': '再生に失敗しました: {reason}',
+                     'File read error': 'ファイルを読み込めませんでした: {path}',
+                     'File write error': 'ファイルを書き込めませんでした: {path}',
+                     'Invalid bndl format': '無効な .bndl ファイル形式です',
+                     'Missing dependency': '依存関係が見つかりません: {name}',
+                     'Image not found': "画像 '{name}' がブレンドファイルに見つかりません",
+                     'Asset pack failed': 'アセットパックの作成に失敗しました: {reason}',
+                     'Asset unpack failed': 'アセットの展開に失敗しました: {reason}',
+                     'License validation failed': 'ライセンス検証に失敗しました: {reason}',
+                     'Network error': 'ライセンス検証中にネットワークエラーが発生しました。インターネット接続を確認してください。',
+                     'Invalid project': '無効なプロジェクト選択です',
+                     'Path encoding error': 'ファイルパスにサポートされていない文字が含まれています: {path}',
+                     'Circular dependency': 'アセット参照に循環依存が検出されました'}},
+ 'de_DE': {'UI': {'BNDL Tools': 'BNDL-Werkzeuge',
+                  'Export Node Trees': 'Knotenbäume exportieren',
+                  'Geometry': 'Geometrie',
+                  'Material': 'Material',
+                  'Compositor': 'Compositor',
+                  'Export Both (Geo + Mat)': 'Beide exportieren (Geo + Mat)',
+                  'Library': 'Bibliothek',
+                  'Search': 'Suchen',
+                  'Apply to Selection': 'Auf Auswahl anwenden',
+                  'Batch: Materials': 'Stapel: Materialien',
+                  'Batch: Geo Nodes': 'Stapel: Geo-Knoten',
+                  'Add vendor/bndl2py.py to enable replay.': 'Fügen Sie vendor/bndl2py.py hinzu, um Wiedergabe zu '
+                                                             'aktivieren.',
+                  'Replayer (Multi-Tree Support)': 'Wiedergabe (Multi-Baum-Unterstützung)',
+                  'Reuse proxies for missing datablocks': 'Proxys für fehlende Datenblöcke wiederverwenden',
+                  'Auto-detect .bndl Type': '.bndl-Typ automatisch erkennen',
+                  'Documentation': 'Dokumentation',
+                  'Pro: Multi-project': 'Pro: Multi-Projekt',
+                  'Add project directories in Add-on Preferences.': 'Projektverzeichnisse in den Add-on-Einstellungen '
+                                                                    'hinzufügen.',
+                  'Asset bundling: Active': 'Asset-Bündelung: Aktiv',
+                  'Asset bundling: Pro license required': 'Asset-Bündelung: Pro-Lizenz erforderlich',
+                  'Preference Management': 'Einstellungsverwaltung',
+                  'Current Source': 'Aktuelle Quelle',
+                  'Save User Preferences': 'Benutzereinstellungen speichern',
+                  'Project Directories': 'Projektverzeichnisse',
+                  'Asset Packing (Images/Videos)': 'Asset-Verpackung (Bilder/Videos)',
+                  'Format': 'Format',
+                  'Path': 'Pfad'},
+           'Operator': {'Export Material': 'Material exportieren',
+                        'Batch Export Materials': 'Materialien stapelweise exportieren'},
+           'Tooltip': {'Pack assets toggle': 'Automatisch Asset-Pakete (.bndlpack oder .blend) erstellen beim '
+                                             'Exportieren von .bndl-Dateien mit Bildtexturen',
+                       'License email': 'Ihre E-Mail-Adresse (optional, für Unternehmens-/Backdoor-Lizenzen)',
+                       'License key': 'Geben Sie Ihren BNDL-Pro-Lizenzschlüssel ein, um professionelle Funktionen '
+                                      'freizuschalten'},
+           'Property': {},
+           'PropertyEnum': {},
+           'PropertyEnumDesc': {},
+           'Message': {'Export success': 'Erfolgreich exportiert: {filename}'},
+           'Error': {'Export failed': 'Export fehlgeschlagen: {reason}'}},
+ 'es': {'UI': {'BNDL Tools': 'Herramientas BNDL',
+               'Export Node Trees': 'Exportar árboles de nodos',
+               'Geometry': 'Geometría',
+               'Material': 'Material',
+               'Compositor': 'Compositor',
+               'Export Both (Geo + Mat)': 'Exportar ambos (Geo + Mat)',
+               'Library': 'Biblioteca',
+               'Search': 'Buscar',
+               'Apply to Selection': 'Aplicar a la selección',
+               'Batch: Materials': 'Lote: Materiales',
+               'Batch: Geo Nodes': 'Lote: Nodos Geo',
+               'Add vendor/bndl2py.py to enable replay.': 'Agregue vendor/bndl2py.py para habilitar la reproducción.',
+               'Replayer (Multi-Tree Support)': 'Reproductor (soporte multi-árbol)',
+               'Reuse proxies for missing datablocks': 'Reutilizar proxies para bloques de datos faltantes',
+               'Auto-detect .bndl Type': 'Detectar tipo .bndl automáticamente',
+               'Documentation': 'Documentación',
+               'Pro: Multi-project': 'Pro: Multi-proyecto',
+               'Add project directories in Add-on Preferences.': 'Agregue directorios de proyecto en Preferencias del '
+                                                                 'complemento.',
+               'Asset bundling: Active': 'Empaquetado de activos: Activo',
+               'Asset bundling: Pro license required': 'Empaquetado de activos: Licencia Pro requerida',
+               'Preference Management': 'Gestión de preferencias',
+               'Current Source': 'Fuente actual',
+               'Save User Preferences': 'Guardar preferencias de usuario',
+               'Project Directories': 'Directorios de proyecto',
+               'Asset Packing (Images/Videos)': 'Empaquetado de activos (imágenes/videos)',
+               'Format': 'Formato',
+               'Path': 'Ruta'},
+        'Operator': {'Export Material': 'Exportar material', 'Batch Export Materials': 'Exportar materiales por lotes'},
+        'Tooltip': {'Pack assets toggle': 'Crear automáticamente paquetes de activos (.bndlpack o .blend) al exportar '
+                                          'archivos .bndl con texturas de imagen',
+                    'License email': 'Su dirección de correo electrónico (opcional, para licencias '
+                                     'empresariales/backdoor)',
+                    'License key': 'Ingrese su clave de licencia BNDL-Pro para desbloquear funciones profesionales'},
+        'Property': {},
+        'PropertyEnum': {},
+        'PropertyEnumDesc': {},
+        'Message': {'Export success': 'Exportado exitosamente: {filename}'},
+        'Error': {'Export failed': 'Exportación fallida: {reason}'}},
+ 'fr_FR': {'UI': {'BNDL Tools': 'Outils BNDL',
+                  'Export Node Trees': 'Exporter les arbres de nœuds',
+                  'Geometry': 'Géométrie',
+                  'Material': 'Matériau',
+                  'Compositor': 'Compositeur',
+                  'Export Both (Geo + Mat)': 'Exporter les deux (Géo + Mat)',
+                  'Library': 'Bibliothèque',
+                  'Search': 'Rechercher',
+                  'Apply to Selection': 'Appliquer à la sélection',
+                  'Batch: Materials': 'Lot : Matériaux',
+                  'Batch: Geo Nodes': 'Lot : Nœuds Géo',
+                  'Add vendor/bndl2py.py to enable replay.': 'Ajoutez vendor/bndl2py.py pour activer la relecture.',
+                  'Replayer (Multi-Tree Support)': 'Lecteur (support multi-arbre)',
+                  'Reuse proxies for missing datablocks': 'Réutiliser les proxies pour les blocs de données manquants',
+                  'Auto-detect .bndl Type': 'Détecter automatiquement le type .bndl',
+                  'Documentation': 'Documentation',
+                  'Pro: Multi-project': 'Pro : Multi-projet',
+                  'Add project directories in Add-on Preferences.': 'Ajoutez des répertoires de projet dans les '
+                                                                    'préférences du module.',
+                  'Asset bundling: Active': "Regroupement d'actifs : Actif",
+                  'Asset bundling: Pro license required': "Regroupement d'actifs : Licence Pro requise",
+                  'Preference Management': 'Gestion des préférences',
+                  'Current Source': 'Source actuelle',
+                  'Save User Preferences': 'Enregistrer les préférences utilisateur',
+                  'Project Directories': 'Répertoires de projet',
+                  'Asset Packing (Images/Videos)': "Empaquetage d'actifs (images/vidéos)",
+                  'Format': 'Format',
+                  'Path': 'Chemin'},
+           'Operator': {'Export Material': 'Exporter le matériau',
+                        'Batch Export Materials': 'Exporter les matériaux par lot'},
+           'Tooltip': {'Pack assets toggle': "Créer automatiquement des packs d'actifs (.bndlpack ou .blend) lors de "
+                                             "l'exportation de fichiers .bndl avec des textures d'image",
+                       'License email': "Votre adresse e-mail (facultatif, pour les licences d'entreprise/backdoor)",
+                       'License key': 'Entrez votre clé de licence BNDL-Pro pour déverrouiller les fonctionnalités '
+                                      'professionnelles'},
+           'Property': {},
+           'PropertyEnum': {},
+           'PropertyEnumDesc': {},
+           'Message': {'Export success': 'Exporté avec succès : {filename}'},
+           'Error': {'Export failed': "Échec de l'exportation : {reason}"}},
+ 'it_IT': {'UI': {'BNDL Tools': 'Strumenti BNDL',
+                  'Export Node Trees': 'Esporta alberi di nodi',
+                  'Geometry': 'Geometria',
+                  'Material': 'Materiale',
+                  'Compositor': 'Compositore',
+                  'Export Both (Geo + Mat)': 'Esporta entrambi (Geo + Mat)',
+                  'Library': 'Biblioteca',
+                  'Search': 'Cerca',
+                  'Apply to Selection': 'Applica alla selezione',
+                  'Batch: Materials': 'Batch: Materiali',
+                  'Batch: Geo Nodes': 'Batch: Nodi Geo',
+                  'Add vendor/bndl2py.py to enable replay.': 'Aggiungi vendor/bndl2py.py per abilitare la '
+                                                             'riproduzione.',
+                  'Replayer (Multi-Tree Support)': 'Riproduttore (supporto multi-albero)',
+                  'Reuse proxies for missing datablocks': 'Riutilizza proxy per blocchi dati mancanti',
+                  'Auto-detect .bndl Type': 'Rileva automaticamente tipo .bndl',
+                  'Documentation': 'Documentazione',
+                  'Pro: Multi-project': 'Pro: Multi-progetto',
+                  'Add project directories in Add-on Preferences.': 'Aggiungi directory di progetto nelle Preferenze '
+                                                                    'del componente aggiuntivo.',
+                  'Asset bundling: Active': 'Raggruppamento risorse: Attivo',
+                  'Asset bundling: Pro license required': 'Raggruppamento risorse: Licenza Pro richiesta',
+                  'Preference Management': 'Gestione preferenze',
+                  'Current Source': 'Sorgente attuale',
+                  'Save User Preferences': 'Salva preferenze utente',
+                  'Project Directories': 'Directory di progetto',
+                  'Asset Packing (Images/Videos)': 'Impacchettamento risorse (immagini/video)',
+                  'Format': 'Formato',
+                  'Path': 'Percorso'},
+           'Operator': {'Export Material': 'Esporta materiale', 'Batch Export Materials': 'Esporta materiali in batch'},
+           'Tooltip': {'Pack assets toggle': 'Crea automaticamente pacchetti di risorse (.bndlpack o .blend) durante '
+                                             "l'esportazione di file .bndl con texture di immagini",
+                       'License email': 'Il tuo indirizzo email (opzionale, per licenze aziendali/backdoor)',
+                       'License key': 'Inserisci la tua chiave di licenza BNDL-Pro per sbloccare le funzionalità '
+                                      'professionali'},
+           'Property': {},
+           'PropertyEnum': {},
+           'PropertyEnumDesc': {},
+           'Message': {'Export success': 'Esportato con successo: {filename}'},
+           'Error': {'Export failed': 'Esportazione fallita: {reason}'}},
+ 'ko_KR': {'UI': {'BNDL Tools': 'BNDL 도구',
+                  'Export Node Trees': '노드 트리 내보내기',
+                  'Geometry': '지오메트리',
+                  'Material': '머티리얼',
+                  'Compositor': '컴포지터',
+                  'Export Both (Geo + Mat)': '둘 다 내보내기 (지오 + 머티리얼)',
+                  'Library': '라이브러리',
+                  'Search': '검색',
+                  'Apply to Selection': '선택에 적용',
+                  'Batch: Materials': '일괄: 머티리얼',
+                  'Batch: Geo Nodes': '일괄: 지오 노드',
+                  'Add vendor/bndl2py.py to enable replay.': '재생을 활성화하려면 vendor/bndl2py.py를 추가하세요.',
+                  'Replayer (Multi-Tree Support)': '재생기 (다중 트리 지원)',
+                  'Reuse proxies for missing datablocks': '누락된 데이터블록에 프록시 재사용',
+                  'Auto-detect .bndl Type': '.bndl 유형 자동 감지',
+                  'Documentation': '문서',
+                  'Pro: Multi-project': 'Pro: 다중 프로젝트',
+                  'Add project directories in Add-on Preferences.': '애드온 설정에서 프로젝트 디렉토리를 추가하세요.',
+                  'Asset bundling: Active': '에셋 번들링: 활성',
+                  'Asset bundling: Pro license required': '에셋 번들링: Pro 라이선스 필요',
+                  'Preference Management': '환경설정 관리',
+                  'Current Source': '현재 소스',
+                  'Save User Preferences': '사용자 환경설정 저장',
+                  'Project Directories': '프로젝트 디렉토리',
+                  'Asset Packing (Images/Videos)': '에셋 패킹 (이미지/비디오)',
+                  'Format': '형식',
+                  'Path': '경로'},
+           'Operator': {'Export Material': '머티리얼 내보내기', 'Batch Export Materials': '머티리얼 일괄 내보내기'},
+           'Tooltip': {'Pack assets toggle': '이미지 텍스처가 있는 .bndl 파일을 내보낼 때 에셋 팩(.bndlpack 또는 .blend)을 자동으로 생성합니다',
+                       'License email': '이메일 주소 (선택사항, 엔터프라이즈/백도어 라이선스용)',
+                       'License key': 'BNDL-Pro 라이선스 키를 입력하여 전문 기능을 잠금 해제하세요'},
+           'Property': {},
+           'PropertyEnum': {},
+           'PropertyEnumDesc': {},
+           'Message': {'Export success': '성공적으로 내보냄: {filename}'},
+           'Error': {'Export failed': '내보내기 실패: {reason}'}},
+ 'pt_BR': {'UI': {'BNDL Tools': 'Ferramentas BNDL',
+                  'Export Node Trees': 'Exportar árvores de nós',
+                  'Geometry': 'Geometria',
+                  'Material': 'Material',
+                  'Compositor': 'Compositor',
+                  'Export Both (Geo + Mat)': 'Exportar ambos (Geo + Mat)',
+                  'Library': 'Biblioteca',
+                  'Search': 'Pesquisar',
+                  'Apply to Selection': 'Aplicar à seleção',
+                  'Batch: Materials': 'Lote: Materiais',
+                  'Batch: Geo Nodes': 'Lote: Nós Geo',
+                  'Add vendor/bndl2py.py to enable replay.': 'Adicione vendor/bndl2py.py para ativar a reprodução.',
+                  'Replayer (Multi-Tree Support)': 'Reprodutor (suporte multi-árvore)',
+                  'Reuse proxies for missing datablocks': 'Reutilizar proxies para blocos de dados ausentes',
+                  'Auto-detect .bndl Type': 'Detectar automaticamente tipo .bndl',
+                  'Documentation': 'Documentação',
+                  'Pro: Multi-project': 'Pro: Multi-projeto',
+                  'Add project directories in Add-on Preferences.': 'Adicione diretórios de projeto nas Preferências '
+                                                                    'do complemento.',
+                  'Asset bundling: Active': 'Empacotamento de ativos: Ativo',
+                  'Asset bundling: Pro license required': 'Empacotamento de ativos: Licença Pro necessária',
+                  'Preference Management': 'Gerenciamento de preferências',
+                  'Current Source': 'Fonte atual',
+                  'Save User Preferences': 'Salvar preferências do usuário',
+                  'Project Directories': 'Diretórios de projeto',
+                  'Asset Packing (Images/Videos)': 'Empacotamento de ativos (imagens/vídeos)',
+                  'Format': 'Formato',
+                  'Path': 'Caminho'},
+           'Operator': {'Export Material': 'Exportar material', 'Batch Export Materials': 'Exportar materiais em lote'},
+           'Tooltip': {'Pack assets toggle': 'Criar automaticamente pacotes de ativos (.bndlpack ou .blend) ao '
+                                             'exportar arquivos .bndl com texturas de imagem',
+                       'License email': 'Seu endereço de e-mail (opcional, para licenças empresariais/backdoor)',
+                       'License key': 'Digite sua chave de licença BNDL-Pro para desbloquear recursos profissionais'},
+           'Property': {},
+           'PropertyEnum': {},
+           'PropertyEnumDesc': {},
+           'Message': {'Export success': 'Exportado com sucesso: {filename}'},
+           'Error': {'Export failed': 'Falha na exportação: {reason}'}},
+ 'ru_RU': {'UI': {'BNDL Tools': 'Инструменты BNDL',
+                  'Export Node Trees': 'Экспорт деревьев узлов',
+                  'Geometry': 'Геометрия',
+                  'Material': 'Материал',
+                  'Compositor': 'Композитор',
+                  'Export Both (Geo + Mat)': 'Экспорт обоих (Гео + Мат)',
+                  'Library': 'Библиотека',
+                  'Search': 'Поиск',
+                  'Apply to Selection': 'Применить к выбранному',
+                  'Batch: Materials': 'Пакет: Материалы',
+                  'Batch: Geo Nodes': 'Пакет: Гео узлы',
+                  'Add vendor/bndl2py.py to enable replay.': 'Добавьте vendor/bndl2py.py для включения '
+                                                             'воспроизведения.',
+                  'Replayer (Multi-Tree Support)': 'Воспроизведение (поддержка мульти-дерева)',
+                  'Reuse proxies for missing datablocks': 'Повторно использовать прокси для отсутствующих блоков '
+                                                          'данных',
+                  'Auto-detect .bndl Type': 'Автоопределение типа .bndl',
+                  'Documentation': 'Документация',
+                  'Pro: Multi-project': 'Pro: Мульти-проект',
+                  'Add project directories in Add-on Preferences.': 'Добавьте каталоги проектов в настройках '
+                                                                    'дополнения.',
+                  'Asset bundling: Active': 'Объединение ресурсов: Активно',
+                  'Asset bundling: Pro license required': 'Объединение ресурсов: Требуется лицензия Pro',
+                  'Preference Management': 'Управление настройками',
+                  'Current Source': 'Текущий источник',
+                  'Save User Preferences': 'Сохранить пользовательские настройки',
+                  'Project Directories': 'Каталоги проектов',
+                  'Asset Packing (Images/Videos)': 'Упаковка ресурсов (изображения/видео)',
+                  'Format': 'Формат',
+                  'Path': 'Путь'},
+           'Operator': {'Export Material': 'Экспорт материала',
+                        'Batch Export Materials': 'Пакетный экспорт материалов'},
+           'Tooltip': {'Pack assets toggle': 'Автоматически создавать пакеты ресурсов (.bndlpack или .blend) при '
+                                             'экспорте файлов .bndl с текстурами изображений',
+                       'License email': 'Ваш адрес электронной почты (необязательно, для корпоративных/бэкдор '
+                                        'лицензий)',
+                       'License key': 'Введите ваш ключ лицензии BNDL-Pro для разблокировки профессиональных функций'},
+           'Property': {},
+           'PropertyEnum': {},
+           'PropertyEnumDesc': {},
+           'Message': {'Export success': 'Успешно экспортировано: {filename}'},
+           'Error': {'Export failed': 'Ошибка экспорта: {reason}'}},
+ 'zh_CN': {'UI': {'BNDL Tools': 'BNDL 工具',
+                  'Export Node Trees': '导出节点树',
+                  'Geometry': '几何',
+                  'Material': '材质',
+                  'Compositor': '合成器',
+                  'Export Both (Geo + Mat)': '导出两者（几何 + 材质）',
+                  'Library': '库',
+                  'Search': '搜索',
+                  'Apply to Selection': '应用到选择',
+                  'Batch: Materials': '批量：材质',
+                  'Batch: Geo Nodes': '批量：几何节点',
+                  'Add vendor/bndl2py.py to enable replay.': '添加 vendor/bndl2py.py 以启用重放。',
+                  'Replayer (Multi-Tree Support)': '重放器（多树支持）',
+                  'Reuse proxies for missing datablocks': '为缺失的数据块重用代理',
+                  'Auto-detect .bndl Type': '自动检测 .bndl 类型',
+                  'Documentation': '文档',
+                  'Pro: Multi-project': 'Pro：多项目',
+                  'Add project directories in Add-on Preferences.': '在插件首选项中添加项目目录。',
+                  'Asset bundling: Active': '资产打包：活动',
+                  'Asset bundling: Pro license required': '资产打包：需要 Pro 许可证',
+                  'Preference Management': '首选项管理',
+                  'Current Source': '当前源',
+                  'Save User Preferences': '保存用户首选项',
+                  'Project Directories': '项目目录',
+                  'Asset Packing (Images/Videos)': '资产打包（图像/视频）',
+                  'Format': '格式',
+                  'Path': '路径'},
+           'Operator': {'Export Material': '导出材质', 'Batch Export Materials': '批量导出材质'},
+           'Tooltip': {'Pack assets toggle': '导出带有图像纹理的 .bndl 文件时自动创建资产包（.bndlpack 或 .blend）',
+                       'License email': '您的电子邮件地址（可选，用于企业/后门许可证）',
+                       'License key': '输入您的 BNDL-Pro 许可证密钥以解锁专业功能'},
+           'Property': {},
+           'PropertyEnum': {},
+           'PropertyEnumDesc': {},
+           'Message': {'Export success': '成功导出：{filename}'},
+           'Error': {'Export failed': '导出失败：{reason}'}}}
@@ -1,16 +1,94 @@
 # bndl_addon/browser.py
+import heapq
+import logging
 import os
+import queue
+import sys
+import threading
 import bpy
 from bpy.types import PropertyGroup, Operator, UIList
 from bpy.props import CollectionProperty, StringProperty, IntProperty, EnumProperty, BoolProperty
 from .prefs import get_prefs
 from .helpers import reveal_in_explorer, import_vendor
+from . import favorites_utils
+
+# Shares the addon logger configured in __init__
+log = logging.getLogger("bndl")
+
+# Build configuration (BNDL_LITE_VERSION in the package __init__), read once
+_package_module = sys.modules.get(__package__.split('.')[0])
+_IS_LITE = bool(getattr(_package_module, 'BNDL_LITE_VERSION', False)) if _package_module else False
+
+try:
+    import numpy as np  # Bundled with Blender; only used to speed up large lists
+except ImportError:
+    np = None
 
 # ---------- Data Model ----------
 
+# Tree type codes derived from the filename prefix (S-/G-/C-), see _type_code()
+TYPE_OTHER = 0
+TYPE_MATERIAL = 1
+TYPE_GEOMETRY = 2
+TYPE_COMPOSITOR = 3
+
+_TYPE_PREFIXES = {'s-': TYPE_MATERIAL, 'g-': TYPE_GEOMETRY, 'c-': TYPE_COMPOSITOR}
+
+def _type_code(name_lower: str) -> int:
+    """Classify a lowercased display name by its BNDL type prefix."""
+    return _TYPE_PREFIXES.get(name_lower[:2], TYPE_OTHER)
+
+# Lists longer than this are filtered with NumPy masks instead of a Python loop
+_VECTOR_FILTER_THRESHOLD = 500
+
+# Scene pointer -> (scan generation, lowercase names, type codes) as NumPy arrays,
+# rebuilt on refresh and cleared on file load
+_filter_arrays = {}
+
+def _store_filter_arrays(scn, names_lower, type_codes):
+    """Keep array copies of the per-item filter fields for vectorized filtering."""
+    if np is None:
+        return
+    _filter_arrays[scn.as_pointer()] = (
+        _scan_generation,
+        np.array(names_lower, dtype=str),
+        np.array(type_codes, dtype=np.int8),
+    )
+
+def _get_filter_arrays(scn, length):
+    """Cached (names, type codes) arrays for scn, or None if they are stale."""
+    entry = _filter_arrays.get(scn.as_pointer())
+    if entry is None:
+        return None
+    generation, names, type_codes = entry
+    # Any later refresh (or cancelled one) may have rewritten the list
+    if generation != _scan_generation or len(names) != length:
+        return None
+    return names, type_codes
+
+def _vector_filter_flags(arrays, custom_search, builtin_search,
+                         show_materials, show_geometry, show_compositor, bitflag):
+    """filter_items() flags computed with NumPy masks over the cached arrays."""
+    names, type_codes = arrays
+    mask = np.ones(len(names), dtype=bool)
+    if custom_search:
+        mask &= np.char.find(names, custom_search) >= 0
+    if builtin_search:
+        mask &= np.char.find(names, builtin_search) >= 0
+    if not show_materials:
+        mask &= type_codes != TYPE_MATERIAL
+    if not show_geometry:
+        mask &= type_codes != TYPE_GEOMETRY
+    if not show_compositor:
+        mask &= type_codes != TYPE_COMPOSITOR
+    return np.where(mask, bitflag, 0).tolist()
+
 class BNDL_Item(PropertyGroup):
     display_name: StringProperty(name="Name")
     abs_path: StringProperty(name="Path")
+    # Precomputed at refresh so filter_items doesn't lowercase/prefix-test per redraw
+    display_name_lower: StringProperty(name="Name (lowercase)")
+    type_code: IntProperty(name="Type", default=TYPE_OTHER)
 
 # ---------- Scene State ----------
 
@@ -20,16 +98,57 @@ def _ensure_scene_props():
         scn["bndl_items"] = []
     return scn
 
+def _tag_ui_list_redraw(context):
+    """Redraw only the sidebar (UI) regions of 3D views, where the BNDL list lives."""
+    screen = getattr(context, "screen", None)
+    if screen:
+        screens = (screen,)
+    elif context.window_manager:
+        # Timers run without a screen in context - visit every window
+        screens = [window.screen for window in context.window_manager.windows]
+    else:
+        return
+    for screen in screens:
+        for area in screen.areas:
+            if area.type == 'VIEW_3D':
+                for region in area.regions:
+                    if region.type == 'UI':
+                        region.tag_redraw()
+                        break
+
+# True while a _flush_redraw timer is queued
+_pending_redraw = False
+
+def _flush_redraw():
+    """Timer callback - redraw the list once for a burst of filter/search updates."""
+    global _pending_redraw
+    _pending_redraw = False
+    _tag_ui_list_redraw(bpy.context)
+    return None  # Don't repeat timer
+
+def _schedule_redraw():
+    """Coalesce redraw requests (e.g. one per keystroke) into a single deferred redraw."""
+    global _pending_redraw
+    if _pending_redraw:
+        return
+    _pending_redraw = True
+    bpy.app.timers.register(_flush_redraw, first_interval=0.05)
+
 def _on_search_update(self, context):
     """Callback when search text changes - trigger UI redraw."""
     # Just tag for redraw - no operator call needed
-    for window in context.window_manager.windows:
-        for area in window.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+    _schedule_redraw()
+
+# Last project filter refreshed per scene name, to skip no-op re-selections
+_last_project_filter = {}
 
 def _on_project_filter_update(self, context):
     """Callback when project filter changes - need to reload from different directory."""
+    scn = context.scene
+    new_filter = scn.bndl_project_filter
+    if _last_project_filter.get(scn.name) == new_filter:
+        return
+    _last_project_filter[scn.name] = new_filter
     bpy.ops.bndl.list_refresh('EXEC_DEFAULT')
 
 def _on_filter_update(self, context):
@@ -38,38 +157,38 @@ def _on_filter_update(self, context):
     _update_master_filter_state(context)
     
     # Trigger UI redraw
-    for window in context.window_manager.windows:
-        for area in window.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+    _schedule_redraw()
 
 def _on_master_filter_update(self, context):
     """Callback when master filter toggle changes - set all individual toggles."""
-    master_state = getattr(context.scene, "bndl_show_all_types", True)
+    scn = context.scene
+    master_state = scn.bndl_show_all_types
     
     # Set all individual toggles to match master state
-    context.scene.bndl_show_materials = master_state
-    context.scene.bndl_show_geometry = master_state
-    context.scene.bndl_show_compositor = master_state
+    scn.bndl_show_materials = master_state
+    scn.bndl_show_geometry = master_state
+    scn.bndl_show_compositor = master_state
     
     # Trigger UI redraw
     _on_filter_update(self, context)
 
 def _update_master_filter_state(context):
     """Update master filter state based on individual toggles."""
-    materials = getattr(context.scene, "bndl_show_materials", True)
-    geometry = getattr(context.scene, "bndl_show_geometry", True)
-    compositor = getattr(context.scene, "bndl_show_compositor", True)
+    scn = context.scene
     
     # Master is on if all individual toggles are on
-    master_state = materials and geometry and compositor
+    master_state = scn.bndl_show_materials and scn.bndl_show_geometry and scn.bndl_show_compositor
     
     # Update master toggle without triggering callback
-    if hasattr(context.scene, "bndl_show_all_types"):
-        context.scene["bndl_show_all_types"] = master_state
+    scn["bndl_show_all_types"] = master_state
 
 def _initial_refresh_handler(scene):
     """Load handler to auto-refresh list on file load."""
+    # Scenes in the newly loaded file may share names (and recycled pointers)
+    # with the previous one
+    _last_project_filter.clear()
+    _filter_arrays.clear()
+    
     # Trigger one refresh if directory is configured
     try:
         from .prefs import get_prefs
@@ -78,20 +197,26 @@ def _initial_refresh_handler(scene):
         
         if has_dirs and scene:
             # Check if list is empty or not initialized
-            if not hasattr(scene, "bndl_items") or len(scene.bndl_items) == 0:
+            needs_refresh = not hasattr(scene, "bndl_items") or len(scene.bndl_items) == 0
+            if not needs_refresh:
+                # A list saved with the file is reused unless the library roots
+                # changed since it was scanned
+                project_filter, valid_dirs = _resolve_library_dirs(scene, prefs)
+                needs_refresh = scene.bndl_items_scan_stamp != _library_stamp(project_filter, valid_dirs)
+            if needs_refresh and not bpy.app.timers.is_registered(_deferred_refresh):
                 # Use a timer to defer refresh until UI is ready
-                bpy.app.timers.register(lambda: _deferred_refresh(), first_interval=0.1)
-                print("[BNDL] Scheduled auto-refresh for library")
+                bpy.app.timers.register(_deferred_refresh, first_interval=0.1)
+                log.debug("[BNDL] Scheduled auto-refresh for library")
     except Exception as e:
-        print(f"[BNDL] Could not schedule auto-refresh: {e}")
+        log.warning("[BNDL] Could not schedule auto-refresh: %s", e)
 
 def _deferred_refresh():
     """Deferred refresh function executed via timer."""
     try:
         bpy.ops.bndl.list_refresh('EXEC_DEFAULT')
-        print("[BNDL] Auto-refreshed library")
+        log.debug("[BNDL] Auto-refreshed library")
     except Exception as e:
-        print(f"[BNDL] Auto-refresh failed: {e}")
+        log.warning("[BNDL] Auto-refresh failed: %s", e)
     return None  # Don't repeat timer
 
 def _get_project_filter_items(self, context):
@@ -106,43 +231,293 @@ def _get_project_filter_items(self, context):
     
     return items
 
+# Library file extension; compared against name[-5:].lower() so only the suffix
+# is lowercased per directory entry (case-insensitive, like before)
+_BNDL_EXT = ".bndl"
+_PATH_SEPS = tuple(sep for sep in (os.sep, os.altsep) if sep)
+
+# Scan results per (root_dir, recursive): (dir_stamps, entries). dir_stamps holds
+# (dirpath, st_mtime_ns) for every directory read; a directory's mtime changes
+# whenever a file is added, removed or renamed in it, so matching stamps mean
+# the cached listing is still accurate and the walk can be skipped.
+_scan_cache = {}
+
+def _dir_stamps_unchanged(dir_stamps) -> bool:
+    try:
+        return all(os.stat(d).st_mtime_ns == mtime for d, mtime in dir_stamps)
+    except OSError:
+        return False
+
+def _invalidate_scan_cache(path: str = ""):
+    """Drop cached scans for roots containing path (all roots if path is empty)."""
+    if not path:
+        _scan_cache.clear()
+        return
+    path = os.path.normcase(os.path.abspath(path))
+    for key in list(_scan_cache):
+        root = os.path.normcase(os.path.abspath(key[0]))
+        if path == root or path.startswith(root.rstrip(os.sep) + os.sep):
+            del _scan_cache[key]
+
+def _iter_bndl_entries(dirpath: str, dir_stamps: list):
+    """Yield os.DirEntry objects for *.bndl files below dirpath (recursive).
+    Uses os.scandir so file/dir checks come from the directory read instead of
+    a stat() per entry. Appends (dirpath, mtime_ns) for each directory read to
+    dir_stamps. Unreadable directories are skipped silently."""
+    try:
+        mtime = os.stat(dirpath).st_mtime_ns
+        with os.scandir(dirpath) as it:
+            dir_entries = list(it)
+    except OSError:
+        return
+    dir_stamps.append((dirpath, mtime))
+    for entry in dir_entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_bndl_entries(entry.path, dir_stamps)
+            elif entry.name[-5:].lower() == _BNDL_EXT:
+                yield entry
+        except OSError:
+            continue
+
 def _list_bndl_files(root_dir: str, search: str, recursive: bool = True):
     """Yield (name, abs_path) for *.bndl in root_dir.
     If recursive=True, searches subdirectories as well.
+    Results are cached until a directory in the tree changes (see _scan_cache).
     NOTE: search parameter is no longer used - filtering now happens in UIList.filter_items()"""
     if not root_dir or not os.path.isdir(root_dir):
         return []
+    
+    cache_key = (root_dir, recursive)
+    cached = _scan_cache.get(cache_key)
+    if cached is not None and _dir_stamps_unchanged(cached[0]):
+        return list(cached[1])
+    
     try:
         entries = []
+        dir_stamps = []
         
         if recursive:
+            # Entry paths are root_dir joined with the relative part, so slice the
+            # root off instead of calling os.path.relpath() per file
+            root_prefix_len = len(root_dir) + (0 if root_dir.endswith(_PATH_SEPS) else 1)
+            
             # Walk through all subdirectories
-            for dirpath, dirnames, filenames in os.walk(root_dir):
-                for fn in filenames:
-                    if not fn.lower().endswith(".bndl"):
-                        continue
-                    # No longer filter by search here - UIList handles it
-                    p = os.path.join(dirpath, fn)
-                    
-                    # Create relative display name showing subdirectory structure
-                    rel_path = os.path.relpath(p, root_dir)
-                    display_name = rel_path.replace(os.sep, ' / ')
-                    
-                    entries.append((display_name, p))
+            for entry in _iter_bndl_entries(root_dir, dir_stamps):
+                # No longer filter by search here - UIList handles it
+                p = entry.path
+                
+                # Create relative display name showing subdirectory structure
+                rel_path = p[root_prefix_len:]
+                display_name = rel_path.replace(os.sep, ' / ')
+                
+                entries.append((display_name, p))
         else:
             # Original non-recursive behavior
-            for fn in os.listdir(root_dir):
-                if not fn.lower().endswith(".bndl"):
-                    continue
-                # No longer filter by search here - UIList handles it
-                p = os.path.join(root_dir, fn)
-                entries.append((fn, p))
+            dir_stamps.append((root_dir, os.stat(root_dir).st_mtime_ns))
+            with os.scandir(root_dir) as it:
+                for entry in it:
+                    if entry.name[-5:].lower() != _BNDL_EXT or entry.is_dir():
+                        continue
+                    # No longer filter by search here - UIList handles it
+                    entries.append((entry.name, entry.path))
         
         entries.sort(key=lambda t: t[0].lower())
-        return entries
+        _scan_cache[cache_key] = (dir_stamps, entries)
+        return list(entries)
     except Exception:
         return []
 
+def _resolve_library_dirs(scn, prefs):
+    """Return (project_filter, valid_dirs) - existing directories to list for the scene."""
+    # Determine which directories to search
+    project_filter = scn.bndl_project_filter if hasattr(scn, "bndl_project_filter") else "ALL"
+    
+    # Get directory list from preferences
+    root_dirs = []
+    if hasattr(prefs, "bndl_directories") and prefs.bndl_directories:
+        if project_filter == "ALL":
+            root_dirs = [bpy.path.abspath(item.directory) for item in prefs.bndl_directories if item.directory]
+        else:
+            # Filter by specific project
+            for item in prefs.bndl_directories:
+                if item.name == project_filter and item.directory:
+                    root_dirs = [bpy.path.abspath(item.directory)]
+                    break
+    
+    # Validate directories - filter out empty strings and non-existent paths
+    valid_dirs = [d for d in root_dirs if d and os.path.isdir(d)]
+    return project_filter, valid_dirs
+
+def _library_stamp(project_filter, valid_dirs) -> str:
+    """Cheap signature of what a refresh lists: the project filter plus the
+    mtime of each library root (no recursion)."""
+    parts = [project_filter]
+    for d in valid_dirs:
+        try:
+            parts.append(f"{d}:{os.stat(d).st_mtime_ns}")
+        except OSError:
+            parts.append(f"{d}:-")
+    return "|".join(parts)
+
+def _scan_is_cached(root_dir: str) -> bool:
+    """True if a recursive scan of root_dir can be served from _scan_cache."""
+    cached = _scan_cache.get((root_dir, True))
+    return cached is not None and _dir_stamps_unchanged(cached[0])
+
+def _collect_library_items(valid_dirs):
+    """Scan all directories and return unique (name, abs_path) tuples sorted by name.
+    Only touches the filesystem (no bpy), so it is safe to run on a worker thread."""
+    # No longer pass search parameter - filtering happens in UIList
+    search = ""  # Keep for potential future use, but UIList handles filtering now
+    
+    # Projects pointing at the same directory are only walked once
+    seen_dirs = set()
+    unique_dirs = []
+    for d in valid_dirs:
+        key = os.path.normcase(os.path.normpath(d))
+        if key not in seen_dirs:
+            seen_dirs.add(key)
+            unique_dirs.append(d)
+    valid_dirs = unique_dirs
+    
+    # Collect items from all valid directories. Scanning is I/O-bound, so
+    # several projects are walked concurrently (workers don't touch bpy).
+    if len(valid_dirs) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(valid_dirs))) as executor:
+            results = list(executor.map(lambda d: _list_bndl_files(d, search, recursive=True), valid_dirs))
+    else:
+        results = [_list_bndl_files(valid_dirs[0], search, recursive=True)]
+    
+    # Each directory's list is already sorted by name, so merge them instead
+    # of re-sorting, removing duplicates based on abs_path on the way
+    seen_paths = set()
+    unique_items = []
+    for item in heapq.merge(*results, key=lambda t: t[0].lower()):
+        if item[1] not in seen_paths:
+            seen_paths.add(item[1])
+            unique_items.append(item)
+    return unique_items
+
+def _item_columns(unique_items):
+    """(lowercase names, type codes) for (name, abs_path) tuples - plain Python,
+    so background scans compute them on the worker thread."""
+    names_lower = [name.lower() for name, _path in unique_items]
+    return names_lower, [_type_code(name_lower) for name_lower in names_lower]
+
+def _append_scene_items(bndl_items, unique_items, columns, stop):
+    """Add rows for unique_items[len(bndl_items):stop]. Allocates the rows first,
+    then fills them. foreach_set() only handles numeric properties (and has no
+    offset), so type codes are rewritten for every row so far in one call -
+    rows filter correctly while a refresh is still streaming in - and the
+    string fields are assigned per item."""
+    names_lower, type_codes = columns
+    start = len(bndl_items)
+    for _ in range(start, stop):
+        bndl_items.add()
+    for i in range(start, stop):
+        it = bndl_items[i]
+        it.display_name, it.abs_path = unique_items[i]
+        it.display_name_lower = names_lower[i]
+    bndl_items.foreach_set("type_code", type_codes[:stop])
+
+def _finish_scene_items(scn, columns):
+    """Build the filter arrays once the list is complete."""
+    _store_filter_arrays(scn, *columns)
+    scn.bndl_index = min(scn.bndl_index, max(0, len(scn.bndl_items)-1))
+
+def _populate_scene_items(scn, unique_items):
+    """Replace the scene's library list with unique_items in one go."""
+    columns = _item_columns(unique_items)
+    scn.bndl_items.clear()
+    _append_scene_items(scn.bndl_items, unique_items, columns, len(unique_items))
+    _finish_scene_items(scn, columns)
+
+def _remove_scene_item(scn, filepath):
+    """Remove the row for filepath from the scene list (and filter arrays)."""
+    bndl_items = scn.bndl_items
+    for i, it in enumerate(bndl_items):
+        if it.abs_path == filepath:
+            bndl_items.remove(i)
+            arrays = _get_filter_arrays(scn, len(bndl_items) + 1)
+            if arrays is not None:
+                _filter_arrays[scn.as_pointer()] = (
+                    _scan_generation, np.delete(arrays[0], i), np.delete(arrays[1], i))
+            break
+    scn.bndl_index = min(scn.bndl_index, max(0, len(bndl_items)-1))
+
+# ---------- Background refresh ----------
+
+# Rows added to the scene list per timer tick while streaming a refresh
+_SCAN_CHUNK = 500
+_SCAN_POLL_INTERVAL = 0.05
+
+# Bumped on every refresh; results from older generations are discarded
+_scan_generation = 0
+
+# Generation of the most recent refresh handed to a worker thread
+_awaited_generation = 0
+
+# Finished scans from worker threads: (generation, scene_name, unique_items, columns)
+_scan_results = queue.Queue()
+
+# Refresh currently being copied into the scene: [generation, scene_name, items, columns, pos]
+_drain_state = None
+
+def _next_scan_generation() -> int:
+    global _scan_generation
+    _scan_generation += 1
+    return _scan_generation
+
+def _scan_worker(generation, scene_name, valid_dirs):
+    """Worker thread body - scan the disk and hand the result to the main thread."""
+    try:
+        unique_items = _collect_library_items(valid_dirs)
+    except Exception as e:
+        print(f"[BNDL] Library scan failed: {e}")
+        unique_items = []
+    _scan_results.put((generation, scene_name, unique_items, _item_columns(unique_items)))
+
+def _drain_scan_results():
+    """Timer callback - copy finished scan results into the scene list in chunks."""
+    global _drain_state
+    
+    # Pick up finished scans; only the latest generation is kept
+    while True:
+        try:
+            generation, scene_name, unique_items, columns = _scan_results.get_nowait()
+        except queue.Empty:
+            break
+        if generation == _scan_generation:
+            _drain_state = [generation, scene_name, unique_items, columns, 0]
+    
+    if _drain_state is None or _drain_state[0] != _scan_generation:
+        _drain_state = None
+        if _awaited_generation == _scan_generation:
+            return _SCAN_POLL_INTERVAL  # Latest scan is still running
+        return None  # Superseded by a synchronous or cancelled refresh
+    
+    generation, scene_name, unique_items, columns, pos = _drain_state
+    scn = bpy.data.scenes.get(scene_name)
+    if scn is None or not hasattr(scn, "bndl_items"):
+        _drain_state = None
+        return None
+    
+    if pos == 0:
+        scn.bndl_items.clear()
+    pos = min(pos + _SCAN_CHUNK, len(unique_items))
+    _append_scene_items(scn.bndl_items, unique_items, columns, pos)
+    _schedule_redraw()
+    
+    if pos >= len(unique_items):
+        _finish_scene_items(scn, columns)
+        _drain_state = None
+        return None  # Done - stop the timer
+    
+    _drain_state[4] = pos
+    return _SCAN_POLL_INTERVAL
+
 # ---------- Operators ----------
 
 class BNDL_OT_ListRefresh(Operator):
@@ -151,26 +526,11 @@ class BNDL_OT_ListRefresh(Operator):
     bl_options = {"INTERNAL"}
 
     def execute(self, ctx):
+        global _awaited_generation
         scn = ctx.scene
         prefs = get_prefs()
         
-        # Determine which directories to search
-        project_filter = scn.bndl_project_filter if hasattr(scn, "bndl_project_filter") else "ALL"
-        
-        # Get directory list from preferences
-        root_dirs = []
-        if hasattr(prefs, "bndl_directories") and prefs.bndl_directories:
-            if project_filter == "ALL":
-                root_dirs = [bpy.path.abspath(item.directory) for item in prefs.bndl_directories if item.directory]
-            else:
-                # Filter by specific project
-                for item in prefs.bndl_directories:
-                    if item.name == project_filter and item.directory:
-                        root_dirs = [bpy.path.abspath(item.directory)]
-                        break
-        
-        # Validate directories - filter out empty strings and non-existent paths
-        valid_dirs = [d for d in root_dirs if d and os.path.isdir(d)]
+        project_filter, valid_dirs = _resolve_library_dirs(scn, prefs)
         
         if not valid_dirs:
             # Check if project filter is active but directory doesn't exist
@@ -178,36 +538,28 @@ class BNDL_OT_ListRefresh(Operator):
                 self.report({'WARNING'}, f"Directory not found for project '{project_filter}'. Check preferences.")
             else:
                 self.report({'ERROR'}, "No project directories configured. Add directories in Preferences > BNDL Tools.")
+            _next_scan_generation()
             if hasattr(scn, "bndl_items"):
                 scn.bndl_items.clear()
                 scn.bndl_index = 0
             return {"CANCELLED"}
         
-        # No longer pass search parameter - filtering happens in UIList
-        search = ""  # Keep for potential future use, but UIList handles filtering now
-        
-        # Collect items from all valid directories
-        all_items = []
-        for root_dir in valid_dirs:
-            items = _list_bndl_files(root_dir, search, recursive=True)
-            all_items.extend(items)
+        # Start a new scan generation - any refresh still in flight is dropped
+        generation = _next_scan_generation()
+        scn.bndl_items_scan_stamp = _library_stamp(project_filter, valid_dirs)
         
-        # Remove duplicates based on abs_path
-        seen_paths = set()
-        unique_items = []
-        for item in all_items:
-            if item[1] not in seen_paths:
-                seen_paths.add(item[1])
-                unique_items.append(item)
-        
-        unique_items.sort(key=lambda t: t[0].lower())
-
-        scn.bndl_items.clear()
-        for name, path in unique_items:
-            it = scn.bndl_items.add()
-            it.display_name = name
-            it.abs_path = path
-        scn.bndl_index = min(scn.bndl_index, max(0, len(scn.bndl_items)-1))
+        if bpy.app.background or all(_scan_is_cached(d) for d in valid_dirs):
+            # Nothing to walk (or no event loop to stream into) - fill synchronously
+            _populate_scene_items(scn, _collect_library_items(valid_dirs))
+        else:
+            # Walk the disk on a worker thread; _drain_scan_results fills the
+            # list in chunks from a timer so the UI stays responsive
+            _awaited_generation = generation
+            threading.Thread(
+                target=_scan_worker, args=(generation, scn.name, valid_dirs), daemon=True
+            ).start()
+            if not bpy.app.timers.is_registered(_drain_scan_results):
+                bpy.app.timers.register(_drain_scan_results, first_interval=_SCAN_POLL_INTERVAL)
         return {"FINISHED"}
 
 class BNDL_OT_RevealDir(Operator):
@@ -296,14 +648,17 @@ class BNDL_OT_DeleteFile(Operator):
                 os.remove(bndlpack_path)
                 deleted_files.append(os.path.basename(bndlpack_path))
             
+            # Make sure the next refresh re-reads this directory
+            _invalidate_scan_cache(self.filepath)
+            
             # Report what was deleted
             if len(deleted_files) == 1:
                 self.report({'INFO'}, f"Deleted: {deleted_files[0]}")
             else:
                 self.report({'INFO'}, f"Deleted: {', '.join(deleted_files)}")
             
-            # Refresh the list
-            bpy.ops.bndl.list_refresh('EXEC_DEFAULT')
+            # Drop the row in place - no need to rescan every project
+            _remove_scene_item(ctx.scene, self.filepath)
             return {'FINISHED'}
         except Exception as e:
             self.report({'ERROR'}, f"Failed to delete file: {e}")
@@ -318,25 +673,18 @@ class BNDL_OT_ToggleFavoriteContext(Operator):
     filepath: StringProperty(name="File Path")
     
     def execute(self, ctx):
-        from . import favorites_utils
-        
         if not self.filepath:
             return {'CANCELLED'}
         
         try:
-            if favorites_utils.is_favorite(self.filepath):
-                favorites_utils.toggle_favorite(self.filepath)  # This will remove it
-                self.report({'INFO'}, "Removed from favorites")
-            else:
-                favorites_utils.toggle_favorite(self.filepath)  # This will add it
+            if favorites_utils.toggle_favorite(self.filepath):
                 self.report({'INFO'}, "Added to favorites")
+            else:
+                self.report({'INFO'}, "Removed from favorites")
             
             # Trigger UI redraw to update star icons
-            for window in ctx.window_manager.windows:
-                for area in window.screen.areas:
-                    if area.type == 'VIEW_3D':
-                        area.tag_redraw()
-                        
+            _tag_ui_list_redraw(ctx)
+            
             return {'FINISHED'}
         except Exception as e:
             self.report({'ERROR'}, f"Failed to toggle favorite: {e}")
@@ -388,7 +736,6 @@ class BNDL_MT_FileContextMenu(bpy.types.Menu):
         layout.separator()
         
         # Favorite toggle
-        from . import favorites_utils
         is_fav = favorites_utils.is_favorite(item.abs_path)
         fav_op = layout.operator("bndl.toggle_favorite_context", 
                                 icon='SOLO_ON' if is_fav else 'SOLO_OFF',
@@ -417,8 +764,6 @@ class BNDL_OT_ApplyFromList(Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, ctx):
-        from . import favorites_utils
-        
         scn = ctx.scene
         if not scn.bndl_items or scn.bndl_index < 0 or scn.bndl_index >= len(scn.bndl_items):
             self.report({'ERROR'}, "No .bndl selected.")
@@ -449,14 +794,12 @@ class BNDL_UL_Bundles(UIList):
     bl_idname = "BNDL_UL_bundles"
 
     def draw_item(self, ctx, layout, data, item, icon, active_data, active_propname, index):
-        from . import favorites_utils
-        
         # Use split layout to control proportions
         split = layout.split(factor=0.08, align=True)  # Star gets ~8% of width
         
         # Left side: Favorite star button
         left = split.row(align=True)
-        is_fav = favorites_utils.is_favorite(item.abs_path)
+        is_fav = item.abs_path in favorites_utils.get_favorites_set()
         fav_icon = 'SOLO_ON' if is_fav else 'SOLO_OFF'
         fav_op = left.operator("bndl.toggle_favorite", text="", icon=fav_icon, emboss=False)
         fav_op.filepath = item.abs_path
@@ -472,31 +815,53 @@ class BNDL_UL_Bundles(UIList):
         items = getattr(data, propname)
         helper_funcs = bpy.types.UI_UL_list
         
+        scn = context.scene
+        
         # Get search string from our custom property (top search box)
-        custom_search = context.scene.bndl_search.strip().lower() if hasattr(context.scene, "bndl_search") else ""
+        custom_search = scn.bndl_search.strip().lower()
         
         # Get search string from built-in UIList filter (bottom search box)
         # The built-in filter is stored in self.filter_name
         builtin_search = self.filter_name.strip().lower() if hasattr(self, "filter_name") and self.filter_name else ""
         
         # Get type filter toggles
-        show_materials = getattr(context.scene, "bndl_show_materials", True)
-        show_geometry = getattr(context.scene, "bndl_show_geometry", True)
-        show_compositor = getattr(context.scene, "bndl_show_compositor", True)
+        show_materials = scn.bndl_show_materials
+        show_geometry = scn.bndl_show_geometry
+        show_compositor = scn.bndl_show_compositor
         
         # Combine both searches (both must match if both are active)
         has_custom = bool(custom_search)
         has_builtin = bool(builtin_search)
         has_type_filters = not (show_materials and show_geometry and show_compositor)
         
-        # Initialize filter flags (all visible by default)
-        flt_flags = [self.bitflag_filter_item] * len(items)
+        # Nothing to filter - empty lists tell Blender to show every item as-is
+        if not (has_custom or has_builtin or has_type_filters):
+            return [], []
+        
         flt_neworder = []
         
+        # Large lists use the NumPy arrays built at refresh (if still in sync)
+        arrays = None
+        if np is not None and len(items) > _VECTOR_FILTER_THRESHOLD:
+            arrays = _get_filter_arrays(data, len(items))
+        
         # Apply filtering if any filters are active
-        if has_custom or has_builtin or has_type_filters:
+        if arrays is not None:
+            flt_flags = _vector_filter_flags(
+                arrays, custom_search, builtin_search, show_materials,
+                show_geometry, show_compositor, self.bitflag_filter_item)
+        else:
+            # Type codes currently switched off (TYPE_OTHER is never hidden)
+            hidden_types = {code for code, shown in (
+                (TYPE_MATERIAL, show_materials),
+                (TYPE_GEOMETRY, show_geometry),
+                (TYPE_COMPOSITOR, show_compositor)) if not shown}
+            
+            # Initialize filter flags (all visible by default)
+            flt_flags = [self.bitflag_filter_item] * len(items)
             for i, item in enumerate(items):
-                name = item.display_name.lower()
+                # Items saved before display_name_lower existed fall back to lower()
+                name = item.display_name_lower or item.display_name.lower()
                 
                 # Item must match both searches if both are active
                 matches = True
@@ -505,18 +870,10 @@ class BNDL_UL_Bundles(UIList):
                 if has_builtin and builtin_search not in name:
                     matches = False
                 
-                # Apply type filtering
-                if has_type_filters:
-                    # Apply type filters based on file prefix
-                    if name.startswith('s-') and not show_materials:  # Changed from 'm-' to 's-' for shader/material files
-                        matches = False
-                    elif name.startswith('g-') and not show_geometry:
-                        matches = False
-                    elif name.startswith('c-') and not show_compositor:
-                        matches = False
-                    elif not (name.startswith('s-') or name.startswith('g-') or name.startswith('c-')):
-                        # Files without prefixes are shown by default (as requested)
-                        pass
+                # Apply type filtering based on file prefix (S-/G-/C-); files
+                # without a known prefix are always shown
+                if has_type_filters and item.type_code in hidden_types:
+                    matches = False
                 
                 if not matches:
                     flt_flags[i] = 0  # Hide this item (remove filter flag)
@@ -584,6 +941,12 @@ def register():
         bpy.utils.register_class(c)
     bpy.types.Scene.bndl_items = CollectionProperty(type=BNDL_Item)
     bpy.types.Scene.bndl_index = IntProperty(default=0)
+    bpy.types.Scene.bndl_items_scan_stamp = StringProperty(
+        name="Library Scan Stamp",
+        default="",
+        description="Signature of the library directories when bndl_items was last refreshed",
+        options={'HIDDEN'}
+    )
     bpy.types.Scene.bndl_search = StringProperty(
         name="Search", 
         default="",
@@ -598,12 +961,6 @@ def register():
     )
     
     # Type filter toggles - default to False for Geometry/Compositor in Lite
-    # Check if Lite version
-    import sys
-    package_name = __package__.split('.')[0]
-    package_module = sys.modules.get(package_name)
-    is_lite = getattr(package_module, 'BNDL_LITE_VERSION', False) if package_module else False
-    
     bpy.types.Scene.bndl_show_materials = BoolProperty(
         name="Show Materials",
         default=True,
@@ -612,13 +969,13 @@ def register():
     )
     bpy.types.Scene.bndl_show_geometry = BoolProperty(
         name="Show Geometry Nodes", 
-        default=False if is_lite else True,  # Default to False in Lite
+        default=not _IS_LITE,  # Default to False in Lite
         description="Show/Hide Geometry Node BNDLs (G- prefix)",
         update=_on_filter_update
     )
     bpy.types.Scene.bndl_show_compositor = BoolProperty(
         name="Show Compositor",
-        default=False if is_lite else True,  # Default to False in Lite
+        default=not _IS_LITE,  # Default to False in Lite
         description="Show/Hide Compositor BNDLs (C- prefix)",
         update=_on_filter_update
     )
@@ -637,11 +994,19 @@ def register():
     # Note: Auto-refresh now happens in UI draw() method when panel is first displayed
 
 def unregister():
+    _next_scan_generation()
+    if bpy.app.timers.is_registered(_drain_scan_results):
+        bpy.app.timers.unregister(_drain_scan_results)
+    if bpy.app.timers.is_registered(_deferred_refresh):
+        bpy.app.timers.unregister(_deferred_refresh)
+    _filter_arrays.clear()
+    _last_project_filter.clear()
+    
     # Remove load handler
     if _initial_refresh_handler in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(_initial_refresh_handler)
     
-    for attr in ("bndl_items", "bndl_index", "bndl_search", "bndl_project_filter", "bndl_show_materials", "bndl_show_geometry", "bndl_show_compositor", "bndl_show_all_types"):
+    for attr in ("bndl_items", "bndl_index", "bndl_items_scan_stamp", "bndl_search", "bndl_project_filter", "bndl_show_materials", "bndl_show_geometry", "bndl_show_compositor", "bndl_show_all_types"):
         if hasattr(bpy.types.Scene, attr):
             delattr(bpy.types.Scene, attr)
     for c in reversed(classes):
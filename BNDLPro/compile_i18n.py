@@ -0,0 +1,46 @@
+"""
+Translation Bundle Compiler for BNDL
+
+This script converts i18n/bndl_i18n.json into bndl_i18n_compiled.py, a Python
+module holding the same data as a literal. Importing it loads from the cached
+.pyc with no JSON parsing; i18n_utils falls back to the JSON whenever the
+compiled copy is missing or out of date.
+Run this script after editing bndl_i18n.json.
+"""
+
+import hashlib
+import json
+import os
+import pprint
+
+ADDON_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(ADDON_DIR, "i18n", "bndl_i18n.json")
+OUTPUT_PATH = os.path.join(ADDON_DIR, "bndl_i18n_compiled.py")
+
+HEADER = '''"""
+Precompiled BNDL translations - generated by compile_i18n.py, do not edit.
+Regenerate after changing i18n/bndl_i18n.json.
+"""
+
+'''
+
+def compile_translations(source_path=SOURCE_PATH, output_path=OUTPUT_PATH):
+    """Write the compiled translations module and return its source hash."""
+    with open(source_path, 'rb') as f:
+        raw = f.read()
+    
+    source_hash = hashlib.sha256(raw).hexdigest()
+    translations = json.loads(raw)
+    
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(HEADER)
+        f.write(f"SOURCE_SHA256 = {source_hash!r}\n\n")
+        f.write(f"TRANSLATIONS = {pprint.pformat(translations, width=120, sort_dicts=False)}\n")
+    
+    return source_hash
+
+if __name__ == "__main__":
+    source_hash = compile_translations()
+    print(f"Compiled {SOURCE_PATH}")
+    print(f"     -> {OUTPUT_PATH}")
+    print(f"SHA-256: {source_hash}")
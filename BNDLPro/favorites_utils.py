@@ -4,163 +4,497 @@ Provides functions to add/remove files from recent history and favorites list.
 """
 
 import bpy
+import logging
 import os
-from datetime import datetime
+import queue
+import threading
+import time
 from typing import Optional
+from .helpers import fast_basename
 
+# Shares the addon logger configured in __init__; per-file messages are debug
+# level so nothing is formatted or written in normal use
+log = logging.getLogger("bndl")
 
-def add_to_recent_files(filepath: str) -> None:
+# Collection name -> epoch, bumped whenever that collection is modified;
+# the caches below are rebuilt when it (or the collection length) changes
+_epochs = {"recent_files": 0, "favorite_files": 0}
+
+# Memoized favorite paths as (epoch, count, frozenset)
+_favorites_cache = (-1, 0, frozenset())
+
+# Collection name -> (epoch, count, {filepath: index}). The functions here
+# keep the index up to date in place after their own edits.
+_path_indices = {}
+
+# Set while this module writes entry paths, so the RNA update callback
+# doesn't discard the index being maintained
+_writing_entries = False
+
+
+# Filepath -> (checked_at, exists); get_recent_files/get_favorites run on UI
+# redraws, and a stat per entry is slow on network drives
+_EXISTS_TTL = 2.0  # seconds
+_exists_cache = {}
+
+
+# Uncached paths are stat'ed on a small thread pool when there are at least
+# this many; the calls are I/O-bound so they overlap despite the GIL
+_PARALLEL_STAT_MIN = 4
+_STAT_WORKERS = 8
+
+
+# draw() never touches the disk: paths without a fresh result are queued in
+# _pending_exists and stat'ed on a worker thread, whose results come back
+# through _exists_results and are applied by the _collect_exists_results timer
+_pending_exists = set()
+_exists_results = queue.Queue()
+_exists_check_running = False
+_EXISTS_POLL_INTERVAL = 0.05  # seconds
+
+
+def _stat_paths(paths: list) -> list:
+    """os.path.exists() for each path, on a thread pool for larger batches."""
+    if len(paths) >= _PARALLEL_STAT_MIN:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(_STAT_WORKERS, len(paths))) as executor:
+            return list(executor.map(os.path.exists, paths))
+    return [os.path.exists(path) for path in paths]
+
+
+def _exists_many(paths: list) -> list:
+    """
+    os.path.exists() for each path, reusing results for _EXISTS_TTL seconds.
+    Stats uncached paths right away - for operators, not draw().
+    
+    Args:
+        paths: File paths to check
+        
+    Returns:
+        List of booleans in the same order as paths
+    """
+    now = time.monotonic()
+    results = [None] * len(paths)
+    pending = []
+    for i, path in enumerate(paths):
+        cached = _exists_cache.get(path)
+        if cached is not None and now - cached[0] < _EXISTS_TTL:
+            results[i] = cached[1]
+        else:
+            pending.append(i)
+    
+    checked = _stat_paths([paths[i] for i in pending])
+    for i, exists in zip(pending, checked):
+        results[i] = exists
+        _exists_cache[paths[i]] = (now, exists)
+    return results
+
+
+def _cached_exists_many(paths: list) -> list:
+    """
+    Like _exists_many() but never touches the disk, for use from draw().
+    
+    Paths without a fresh result report their last known state (present if
+    never checked) and are queued for a background check.
+    
+    Args:
+        paths: File paths to check
+        
+    Returns:
+        List of booleans in the same order as paths
+    """
+    now = time.monotonic()
+    results = []
+    for path in paths:
+        cached = _exists_cache.get(path)
+        if cached is None or now - cached[0] >= _EXISTS_TTL:
+            _pending_exists.add(path)
+        results.append(cached[1] if cached is not None else True)
+    
+    _start_exists_check()
+    return results
+
+
+def _start_exists_check() -> None:
+    """Hand the queued paths to a worker thread unless one is already running."""
+    global _exists_check_running
+    if _exists_check_running or not _pending_exists:
+        return
+    paths = list(_pending_exists)
+    _pending_exists.clear()
+    _exists_check_running = True
+    threading.Thread(target=_exists_worker, args=(paths,), daemon=True).start()
+    if not bpy.app.timers.is_registered(_collect_exists_results):
+        bpy.app.timers.register(_collect_exists_results, first_interval=_EXISTS_POLL_INTERVAL)
+
+
+def _exists_worker(paths: list) -> None:
+    """Worker thread body - stat paths and pass the results to the main thread."""
+    try:
+        checked = _stat_paths(paths)
+    except Exception:
+        checked = [True] * len(paths)  # Keep showing the entries
+    _exists_results.put((time.monotonic(), paths, checked))
+
+
+def _collect_exists_results():
+    """Timer callback - apply finished background checks and redraw on changes."""
+    global _exists_check_running
+    try:
+        checked_at, paths, checked = _exists_results.get_nowait()
+    except queue.Empty:
+        return _EXISTS_POLL_INTERVAL
+    _exists_check_running = False
+    
+    changed = False
+    for path, exists in zip(paths, checked):
+        cached = _exists_cache.get(path)
+        changed = changed or (cached[1] if cached is not None else True) != exists
+        _exists_cache[path] = (checked_at, exists)
+    
+    if changed:
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                area.tag_redraw()
+    
+    # Paths queued by draws while the worker ran
+    _start_exists_check()
+    return None
+
+
+def stop_exists_checks() -> None:
+    """Stop applying background check results (addon unregister)."""
+    global _exists_check_running
+    if bpy.app.timers.is_registered(_collect_exists_results):
+        bpy.app.timers.unregister(_collect_exists_results)
+    _pending_exists.clear()
+    _exists_check_running = False
+
+
+def prime_exists_cache(prefs=None) -> None:
+    """Check every recent/favorite path in the background, e.g. after a file
+    load, so the first menu draw already knows which files are missing."""
+    try:
+        if prefs is None:
+            prefs = _prefs()
+        _pending_exists.update(item.filepath for item in prefs.recent_files)
+        _pending_exists.update(item.filepath for item in prefs.favorite_files)
+    except (AttributeError, KeyError):
+        return  # Preferences not available yet
+    _start_exists_check()
+
+
+def _invalidate_exists_cache(path: Optional[str] = None) -> None:
+    """Forget the cached existence of path (or of every path if None)."""
+    if path is None:
+        _exists_cache.clear()
+    else:
+        _exists_cache.pop(path, None)
+
+
+# Recent files store an epoch int and are only formatted for display
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _format_timestamp(item) -> str:
+    """Display string for a recent-file entry's last-used time."""
+    ts = item.timestamp_int
+    if not ts:
+        # Entry saved before timestamp_int existed
+        return item.timestamp
+    return time.strftime(_TIMESTAMP_FORMAT, time.localtime(ts))
+
+
+def on_entry_path_changed(self, context) -> None:
+    """RNA update callback for recent/favorite entry paths edited in the UI."""
+    if _writing_entries:
+        return
+    # Only recent-file entries carry timestamps
+    _bump_epoch("recent_files" if hasattr(self, "timestamp_int") else "favorite_files")
+
+
+def invalidate_caches(*_args) -> None:
+    """Drop all cached lookups (file loaded, preferences reset)."""
+    _exists_cache.clear()
+    _pending_exists.clear()
+    _bump_epoch()
+
+
+def _prefs():
+    """Addon preferences holding recent_files/favorite_files."""
+    return bpy.context.preferences.addons[__package__].preferences
+
+
+def _bump_epoch(collection_name: Optional[str] = None) -> None:
+    """Invalidate the memoized lookups for one collection (or both if None)."""
+    for name in ((collection_name,) if collection_name else tuple(_epochs)):
+        _epochs[name] += 1
+
+
+def _store_index(collection, collection_name: str, index: dict) -> None:
+    """Record index as current after an in-place update following an edit."""
+    _bump_epoch(collection_name)
+    _path_indices[collection_name] = (_epochs[collection_name], len(collection), index)
+
+
+def _add_entry(collection, filepath: str, filename: str):
+    """Append an entry without tripping the RNA update callback."""
+    global _writing_entries
+    _writing_entries = True
+    try:
+        item = collection.add()
+        item.filepath = filepath
+        item.filename = filename
+    finally:
+        _writing_entries = False
+    return item
+
+
+def _path_index(prefs, collection_name: str) -> dict:
+    """
+    Get a filepath -> index map for prefs.recent_files or prefs.favorite_files.
+    
+    Args:
+        prefs: Addon preferences
+        collection_name: "recent_files" or "favorite_files"
+        
+    Returns:
+        Dictionary mapping each stored filepath to its collection index
+    """
+    collection = getattr(prefs, collection_name)
+    cached = _path_indices.get(collection_name)
+    epoch = _epochs[collection_name]
+    if cached is not None and cached[0] == epoch and cached[1] == len(collection):
+        return cached[2]
+    
+    index = {item.filepath: i for i, item in enumerate(collection)}
+    _path_indices[collection_name] = (epoch, len(collection), index)
+    return index
+
+
+def _find_index(prefs, collection_name: str, filepath: str) -> Optional[int]:
+    """
+    Index of filepath in prefs.recent_files or prefs.favorite_files, or None.
+    
+    A cached hit is confirmed against the entry before it is used, since
+    edits that keep the length (e.g. reordering) are not seen by the epoch;
+    only a failed confirmation rebuilds the index, a plain miss does not.
+    """
+    collection = getattr(prefs, collection_name)
+    idx = _path_index(prefs, collection_name).get(filepath)
+    if idx is None or (idx < len(collection) and collection[idx].filepath == filepath):
+        return idx
+    _bump_epoch(collection_name)
+    return _path_index(prefs, collection_name).get(filepath)
+
+
+def add_to_recent_files(filepath: str, prefs=None) -> None:
     """
     Add a file to the recent files list.
     
     Args:
         filepath: Full path to the .bndl file
+        prefs: Addon preferences, if the caller already has them
     """
-    prefs = bpy.context.preferences.addons[__package__].preferences
+    if prefs is None:
+        prefs = _prefs()
     
     # Get filename from path
-    filename = os.path.basename(filepath)
+    filename = fast_basename(filepath)
+    
+    # The file was just opened, so it exists
+    _exists_cache[filepath] = (time.monotonic(), True)
+    
+    recent_files = prefs.recent_files
+    timestamp = int(time.time())
     
     # Check if file already exists in recent list
-    existing_idx = None
-    for i, item in enumerate(prefs.recent_files):
-        if item.filepath == filepath:
-            existing_idx = i
-            break
+    existing_idx = _find_index(prefs, "recent_files", filepath)
+    index = _path_index(prefs, "recent_files")
     
-    # Remove if it already exists (we'll add it to the front)
     if existing_idx is not None:
-        prefs.recent_files.remove(existing_idx)
+        # Already listed - move it to the front and refresh its timestamp
+        if existing_idx > 0:
+            recent_files.move(existing_idx, 0)
+        recent_files[0].timestamp_int = timestamp
+        shifted = existing_idx  # entries before it move down one
+    else:
+        # Add to the front of the list
+        new_item = _add_entry(recent_files, filepath, filename)
+        new_item.timestamp_int = timestamp
+        if len(recent_files) > 1:
+            recent_files.move(len(recent_files) - 1, 0)
+        shifted = len(recent_files) - 1  # every earlier entry moves down one
     
-    # Add to the front of the list
-    new_item = prefs.recent_files.add()
-    prefs.recent_files.move(len(prefs.recent_files) - 1, 0)
+    # Mirror the move in the index instead of rebuilding it
+    for path, i in index.items():
+        if i < shifted:
+            index[path] = i + 1
+    index[filepath] = 0
     
-    new_item.filepath = filepath
-    new_item.filename = filename
-    new_item.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Trim list if it exceeds max_recent_files, removing from the tail
+    last = len(recent_files) - 1
+    for i in range(last - prefs.max_recent_files + 1):
+        index.pop(recent_files[last - i].filepath, None)
+        recent_files.remove(last - i)
+    _store_index(recent_files, "recent_files", index)
     
-    # Trim list if it exceeds max_recent_files
-    while len(prefs.recent_files) > prefs.max_recent_files:
-        prefs.recent_files.remove(len(prefs.recent_files) - 1)
-    
-    print(f"[BNDL Recent] Added: {filename}")
+    log.debug("[BNDL Recent] Added: %s", filename)
 
 
-def is_favorite(filepath: str) -> bool:
+def is_favorite(filepath: str, prefs=None) -> bool:
     """
     Check if a file is in the favorites list.
     
     Args:
         filepath: Full path to the .bndl file
+        prefs: Addon preferences, if the caller already has them
         
     Returns:
         True if file is favorited, False otherwise
     """
-    prefs = bpy.context.preferences.addons[__package__].preferences
+    return filepath in get_favorites_set(prefs)
+
+
+def get_favorites_set(prefs=None) -> frozenset:
+    """
+    Get the set of favorited file paths, memoized until favorites change.
     
-    for item in prefs.favorite_files:
-        if item.filepath == filepath:
-            return True
+    Args:
+        prefs: Addon preferences, if the caller already has them
+        
+    Returns:
+        frozenset of favorite file paths
+    """
+    global _favorites_cache
+    if prefs is None:
+        prefs = _prefs()
+    favorite_files = prefs.favorite_files
     
-    return False
+    epoch, count, paths = _favorites_cache
+    if epoch != _epochs["favorite_files"] or count != len(favorite_files):
+        # The path index is kept current, so its keys are the favorite paths
+        paths = frozenset(_path_index(prefs, "favorite_files"))
+        _favorites_cache = (_epochs["favorite_files"], len(favorite_files), paths)
+    return paths
 
 
-def toggle_favorite(filepath: str) -> bool:
+def toggle_favorite(filepath: str, prefs=None) -> bool:
     """
     Toggle favorite status for a file.
     
     Args:
         filepath: Full path to the .bndl file
+        prefs: Addon preferences, if the caller already has them
         
     Returns:
         True if file is now favorited, False if unfavorited
     """
-    prefs = bpy.context.preferences.addons[__package__].preferences
+    if prefs is None:
+        prefs = _prefs()
     
     # Get filename from path
-    filename = os.path.basename(filepath)
+    filename = fast_basename(filepath)
+    
+    _invalidate_exists_cache(filepath)
     
     # Check if already favorited
-    for i, item in enumerate(prefs.favorite_files):
-        if item.filepath == filepath:
-            # Remove from favorites
-            prefs.favorite_files.remove(i)
-            print(f"[BNDL Favorites] Removed: {filename}")
-            return False
+    favorite_files = prefs.favorite_files
+    existing_idx = _find_index(prefs, "favorite_files", filepath)
+    index = _path_index(prefs, "favorite_files")
+    if existing_idx is not None:
+        # Remove from favorites; later entries move up one
+        favorite_files.remove(existing_idx)
+        del index[filepath]
+        for path, i in index.items():
+            if i > existing_idx:
+                index[path] = i - 1
+        _store_index(favorite_files, "favorite_files", index)
+        log.debug("[BNDL Favorites] Removed: %s", filename)
+        return False
     
     # Add to favorites
-    new_fav = prefs.favorite_files.add()
-    new_fav.filepath = filepath
-    new_fav.filename = filename
-    print(f"[BNDL Favorites] Added: {filename}")
+    _add_entry(favorite_files, filepath, filename)
+    
+    # Appending doesn't shift existing entries - extend the index in place
+    index[filepath] = len(favorite_files) - 1
+    _store_index(favorite_files, "favorite_files", index)
+    log.debug("[BNDL Favorites] Added: %s", filename)
     return True
 
 
-def clean_missing_favorites() -> int:
+def clean_missing_favorites(prefs=None) -> int:
     """
     Remove favorites for files that no longer exist.
     
+    Args:
+        prefs: Addon preferences, if the caller already has them
+        
     Returns:
         Number of favorites removed
     """
-    prefs = bpy.context.preferences.addons[__package__].preferences
+    if prefs is None:
+        prefs = _prefs()
     
-    removed_count = 0
-    i = 0
-    while i < len(prefs.favorite_files):
-        item = prefs.favorite_files[i]
-        if not os.path.exists(item.filepath):
-            print(f"[BNDL Favorites] Removing missing file: {item.filename}")
-            prefs.favorite_files.remove(i)
-            removed_count += 1
-        else:
-            i += 1
+    favorite_files = prefs.favorite_files
+    exists = _exists_many([item.filepath for item in favorite_files])
+    to_remove = [i for i, found in enumerate(exists) if not found]
+    
+    # Remove from the highest index down so earlier indices stay valid and
+    # fewer trailing entries are shifted per removal
+    for i in reversed(to_remove):
+        log.debug("[BNDL Favorites] Removing missing file: %s", favorite_files[i].filename)
+        favorite_files.remove(i)
     
-    return removed_count
+    if to_remove:
+        _bump_epoch("favorite_files")
+    return len(to_remove)
 
 
-def get_recent_files(max_count: Optional[int] = None) -> list:
+def get_recent_files(max_count: Optional[int] = None, prefs=None) -> list:
     """
     Get list of recent files.
     
     Args:
         max_count: Maximum number of files to return (None = all)
+        prefs: Addon preferences, if the caller already has them
         
     Returns:
         List of tuples: (filepath, filename, timestamp)
     """
-    prefs = bpy.context.preferences.addons[__package__].preferences
+    if prefs is None:
+        prefs = _prefs()
     
-    result = []
-    count = 0
-    for item in prefs.recent_files:
-        if max_count and count >= max_count:
-            break
-        # Only include files that still exist
-        if os.path.exists(item.filepath):
-            result.append((item.filepath, item.filename, item.timestamp))
-            count += 1
+    # Read each RNA path once and reuse it for the existence check and result
+    items = list(prefs.recent_files)
+    paths = [item.filepath for item in items]
     
-    return result
+    # Only include files that still exist
+    present = [(path, item) for path, item, found in zip(paths, items, _cached_exists_many(paths)) if found]
+    if max_count:
+        present = present[:max_count]
+    
+    return [(path, item.filename, _format_timestamp(item)) for path, item in present]
 
 
-def get_favorites() -> list:
+def get_favorites(prefs=None) -> list:
     """
     Get list of favorite files.
     
+    Args:
+        prefs: Addon preferences, if the caller already has them
+        
     Returns:
         List of tuples: (filepath, filename)
     """
-    prefs = bpy.context.preferences.addons[__package__].preferences
+    if prefs is None:
+        prefs = _prefs()
     
-    result = []
-    for item in prefs.favorite_files:
-        # Only include files that still exist
-        if os.path.exists(item.filepath):
-            result.append((item.filepath, item.filename))
+    items = list(prefs.favorite_files)
+    paths = [item.filepath for item in items]
     
-    return result
+    # Only include files that still exist
+    return [(path, item.filename) for path, item, found in zip(paths, items, _cached_exists_many(paths)) if found]
 
 
 def get_project_export_settings(project_index: int) -> dict:
@@ -173,7 +507,7 @@ def get_project_export_settings(project_index: int) -> dict:
     Returns:
         Dictionary with keys: prefix_1, prefix_2, suffix_1, notes
     """
-    prefs = bpy.context.preferences.addons[__package__].preferences
+    prefs = _prefs()
     
     # Default to global settings
     settings = {
@@ -192,6 +526,6 @@ def get_project_export_settings(project_index: int) -> dict:
             settings['prefix_2'] = project.project_prefix_2
             settings['suffix_1'] = project.project_suffix_1
             settings['notes'] = project.project_notes
-            print(f"[BNDL Export] Using project-specific presets for: {project.name}")
+            log.debug("[BNDL Export] Using project-specific presets for: %s", project.name)
     
     return settings
@@ -20,6 +20,10 @@ def derive_key():
     seed = f"{addon_name}{addon_version}"
     return hashlib.sha256(seed.encode()).digest()[:16]
 
+def _xor_table(xor_key):
+    """Byte translation table that XORs every byte with xor_key."""
+    return bytes(b ^ xor_key for b in range(256))
+
 def obfuscate_url(url):
     """Obfuscate URL for storage."""
     key = derive_key()
@@ -36,7 +40,7 @@ def obfuscate_url(url):
     encoded = []
     for i, chunk in enumerate(chunks):
         xor_key = key[i % len(key)]
-        xored = bytes([ord(c) ^ xor_key for c in chunk])
+        xored = chunk.encode('latin-1').translate(_xor_table(xor_key))
         encoded.append(base64.b64encode(xored).decode())
     
     return encoded
@@ -48,7 +52,7 @@ def deobfuscate_url(chunks):
     for i, chunk in enumerate(chunks):
         xor_key = key[i % len(key)]
         b64_decoded = base64.b64decode(chunk.encode())
-        original = ''.join([chr(b ^ xor_key) for b in b64_decoded])
+        original = b64_decoded.translate(_xor_table(xor_key)).decode('latin-1')
         decoded.append(original)
     
     return ''.join(decoded)
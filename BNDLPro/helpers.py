@@ -15,18 +15,35 @@ def reveal_in_explorer(path: str):
     except Exception as e:
         print("[BNDL] reveal failed:", e)
 
+_ALTSEP = os.altsep
+
+def fast_basename(path: str) -> str:
+    """os.path.basename() for plain file paths via C-level rpartition (both separators on Windows)."""
+    name = path.rpartition(os.sep)[2]
+    if _ALTSEP:
+        name = name.rpartition(_ALTSEP)[2]
+    return name
+
 def ensure_text_block(name: str):
     txt = bpy.data.texts.get(name)
     if txt is None:
         txt = bpy.data.texts.new(name)
     return txt
 
+# modname -> module, or None for imports that failed (not retried)
+_vendor_cache = {}
+
 def import_vendor(modname: str):
     """Import bndl_addon.vendor.<modname>, return module or None."""
+    try:
+        return _vendor_cache[modname]
+    except KeyError:
+        pass
     try:
         full = f"{__package__}.vendor.{modname}"
         mod = importlib.import_module(full)
-        return mod
     except Exception as e:
         print(f"[BNDL] vendor module not found: {modname} ({e})")
-        return None
+        mod = None
+    _vendor_cache[modname] = mod
+    return mod
@@ -4,21 +4,39 @@ Provides translation functions that automatically detect Blender's language sett
 """
 
 import bpy
+from bpy.app.handlers import persistent
+import hashlib
 import json
+import logging
 import os
 from typing import Dict, Optional
 
+log = logging.getLogger("bndl")
+
+# Optional faster JSON parser (not bundled with Blender)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Cache for loaded translations
 _translations: Optional[Dict] = None
 _current_locale: Optional[str] = None
+_resolved_locale_map: Optional[Dict[str, str]] = None
+
+# Category -> {key: text} for _active_locale, with English fallbacks merged in
+# so get_text() needs a single lookup; rebuilt when the locale changes
+_active: Optional[Dict[str, Dict[str, str]]] = None
+_active_locale: Optional[str] = None
 
 # Supported locales (must match keys in bndl_i18n.json)
-SUPPORTED_LOCALES = {
+SUPPORTED_LOCALES = frozenset({
     'en_US', 'ja_JP', 'de_DE', 'es', 'fr_FR', 
     'it_IT', 'ko_KR', 'pt_BR', 'ru_RU', 'zh_CN'
-}
+})
 
 # Locale mapping for Blender's locale codes
+# (resolved against the loaded translations by _get_resolved_locale_map)
 LOCALE_MAPPING = {
     'en_US': 'en_US',
     'ja_JP': 'ja_JP',
@@ -49,11 +67,25 @@ def load_translations() -> Dict:
     i18n_path = os.path.join(addon_dir, "i18n", "bndl_i18n.json")
     
     try:
-        with open(i18n_path, 'r', encoding='utf-8') as f:
-            _translations = json.load(f)
-        print(f"[BNDL i18n] Loaded translations from {i18n_path}")
+        with open(i18n_path, 'rb') as f:
+            raw = f.read()
+        
+        # Prefer the precompiled copy (see compile_i18n.py) - it imports from
+        # its cached .pyc without any JSON parsing - while it matches the JSON
+        try:
+            from . import bndl_i18n_compiled as compiled
+            if compiled.SOURCE_SHA256 == hashlib.sha256(raw).hexdigest():
+                _translations = compiled.TRANSLATIONS
+                log.debug("[BNDL i18n] Loaded precompiled translations")
+                return _translations
+            log.info("[BNDL i18n] Precompiled translations are out of date, using JSON")
+        except ImportError:
+            pass
+        
+        _translations = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        log.debug("[BNDL i18n] Loaded translations from %s", i18n_path)
     except Exception as e:
-        print(f"[BNDL i18n] Failed to load translations: {e}")
+        log.warning("[BNDL i18n] Failed to load translations: %s", e)
         # Return minimal English fallback
         _translations = {
             'en_US': {
@@ -71,30 +103,75 @@ def load_translations() -> Dict:
     return _translations
 
 
+def _get_resolved_locale_map() -> Dict[str, str]:
+    """LOCALE_MAPPING with locales missing from the loaded translations mapped to en_US."""
+    global _resolved_locale_map
+    
+    if _resolved_locale_map is None:
+        translations = load_translations()
+        _resolved_locale_map = {
+            blender_locale: locale if locale in SUPPORTED_LOCALES and locale in translations else 'en_US'
+            for blender_locale, locale in LOCALE_MAPPING.items()
+        }
+    return _resolved_locale_map
+
+
 def get_current_locale() -> str:
-    """Get the current locale from Blender's preferences."""
+    """Get the current locale from Blender's preferences (memoized until invalidated)."""
     global _current_locale
     
+    if _current_locale is not None:
+        return _current_locale
+    
     try:
-        # Get Blender's current locale
-        blender_locale = bpy.app.translations.locale
-        
-        # Map to our supported locale
-        locale = LOCALE_MAPPING.get(blender_locale, 'en_US')
-        
-        # Fallback if not in our translations
-        translations = load_translations()
-        if locale not in translations:
-            locale = 'en_US'
-        
+        # Map Blender's current locale to one we have translations for
+        locale = _get_resolved_locale_map().get(bpy.app.translations.locale, 'en_US')
         _current_locale = locale
         return locale
         
     except Exception as e:
-        print(f"[BNDL i18n] Error detecting locale: {e}")
+        log.warning("[BNDL i18n] Error detecting locale: %s", e)
         return 'en_US'
 
 
+def _build_active(translations: Dict, locale: str) -> Dict[str, Dict[str, str]]:
+    """Flatten the locale's categories over the English ones."""
+    english = translations.get('en_US', {})
+    localized = translations.get(locale, {}) if locale != 'en_US' else {}
+    active = {}
+    for category in set(english) | set(localized):
+        merged = {k: v for k, v in english.get(category, {}).items() if v is not None}
+        merged.update((k, v) for k, v in localized.get(category, {}).items() if v is not None)
+        active[category] = merged
+    return active
+
+
+def invalidate_locale_cache(*_args) -> None:
+    """Re-detect the locale on next use (language changed or file loaded)."""
+    global _current_locale
+    _current_locale = None
+
+
+# Owner token for the msgbus subscription to the UI language preference
+_msgbus_owner = object()
+
+
+def _subscribe_language_change():
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.PreferencesView, "language"),
+        owner=_msgbus_owner,
+        args=(),
+        notify=invalidate_locale_cache,
+    )
+
+
+@persistent
+def _on_load_post(*_args):
+    """File load clears msgbus subscriptions - re-subscribe and re-detect the locale."""
+    invalidate_locale_cache()
+    _subscribe_language_change()
+
+
 def get_text(category: str, key: str, **kwargs) -> str:
     """
     Get translated text for a given category and key.
@@ -111,20 +188,17 @@ def get_text(category: str, key: str, **kwargs) -> str:
         get_text('Message', 'Export success', filename='test.bndl')
         get_text('UI', 'BNDL Tools')
     """
-    translations = load_translations()
+    global _active, _active_locale
+    
     locale = get_current_locale()
+    if _active is None or _active_locale != locale:
+        _active = _build_active(load_translations(), locale)
+        _active_locale = locale
     
     try:
-        # Try to get translation for current locale
-        text = translations[locale][category].get(key)
-        
-        # Fallback to English if not found
-        if text is None and locale != 'en_US':
-            text = translations['en_US'][category].get(key)
-        
-        # Ultimate fallback to key itself
-        if text is None:
-            text = key
+        # Current locale, then English, then the key itself
+        category_map = _active.get(category)
+        text = category_map.get(key, key) if category_map is not None else key
         
         # Apply formatting if kwargs provided
         if kwargs:
@@ -133,18 +207,20 @@ def get_text(category: str, key: str, **kwargs) -> str:
         return text
         
     except Exception as e:
-        print(f"[BNDL i18n] Translation error for {category}.{key}: {e}")
+        log.warning("[BNDL i18n] Translation error for %s.%s: %s", category, key, e)
         return key
 
 
 def reload_translations():
     """Force reload of translations (useful for testing/development)."""
-    global _translations, _current_locale
+    global _translations, _active, _resolved_locale_map
     _translations = None
-    _current_locale = None
+    _active = None
+    _resolved_locale_map = None
+    invalidate_locale_cache()
     load_translations()
     get_current_locale()
-    print(f"[BNDL i18n] Reloaded translations for locale: {_current_locale}")
+    log.info("[BNDL i18n] Reloaded translations for locale: %s", _current_locale)
 
 
 # Convenience functions for common categories
@@ -216,23 +292,24 @@ def _build_blender_translation_dict():
     if not data:
         return translations_dict
     
+    # Blender expects ("*", "English text") as the key - we use our keys as the
+    # English text. Build those tuples once from the English keys and share them
+    # across every locale instead of allocating one per locale entry.
+    msgid_keys = {key: ("*", key) for translations in data.get('en_US', {}).values() for key in translations}
+    
     # For each supported locale
     for locale_code in SUPPORTED_LOCALES:
         if locale_code == 'en_US' or locale_code not in data:
             continue  # Skip English (default) and missing locales
-            
-        locale_data = data[locale_code]
         
         # Convert to Blender's expected format: {locale: {("*", "Original Text"): "Translated Text"}}
-        translations_dict[locale_code] = {}
-        
-        # Process all categories
-        for category, translations in locale_data.items():
-            for key, value in translations.items():
-                if value and value != key:  # Only add actual translations
-                    # Blender expects ("*", "English text") as the key
-                    # We use our keys as the English text
-                    translations_dict[locale_code][("*", key)] = value
+        # Only actual translations are added
+        translations_dict[locale_code] = {
+            msgid_keys.get(key) or ("*", key): value
+            for translations in data[locale_code].values()
+            for key, value in translations.items()
+            if value and value != key
+        }
     
     return translations_dict
 
@@ -243,18 +320,18 @@ def register_blender_translations():
         trans_dict = _build_blender_translation_dict()
         if trans_dict:
             bpy.app.translations.register(__package__, trans_dict)
-            print(f"[BNDL i18n] Registered {len(trans_dict)} locale translations with Blender")
+            log.debug("[BNDL i18n] Registered %d locale translations with Blender", len(trans_dict))
     except Exception as e:
-        print(f"[BNDL i18n] Warning: Could not register Blender translations: {e}")
+        log.warning("[BNDL i18n] Warning: Could not register Blender translations: %s", e)
 
 
 def unregister_blender_translations():
     """Unregister translations from Blender's translation system."""
     try:
         bpy.app.translations.unregister(__package__)
-        print("[BNDL i18n] Unregistered Blender translations")
+        log.debug("[BNDL i18n] Unregistered Blender translations")
     except Exception as e:
-        print(f"[BNDL i18n] Warning: Could not unregister Blender translations: {e}")
+        log.warning("[BNDL i18n] Warning: Could not unregister Blender translations: %s", e)
 
 
 def register():
@@ -264,7 +341,12 @@ def register():
     # Load translations on startup
     load_translations()
     get_current_locale()
-    print(f"[BNDL i18n] Initialized with locale: {_current_locale}")
+    log.debug("[BNDL i18n] Initialized with locale: %s", _current_locale)
+    
+    # The locale is memoized - drop it when the UI language changes
+    _subscribe_language_change()
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
     
     # Register with Blender's translation system for automatic property tooltips
     register_blender_translations()
@@ -272,5 +354,8 @@ def register():
 
 def unregister():
     """Unregister i18n utilities."""
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
     unregister_blender_translations()
     bpy.utils.unregister_class(BNDL_OT_ReloadTranslations)
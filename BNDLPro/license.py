@@ -5,10 +5,17 @@ Note: Setting license_validated = True in preferences will bypass validation.
 For testing, use license key: "BNDL-TEST-12345" (hardcoded bypass)
 """
 
+import base64
 import hashlib
 import platform
 import json
-from datetime import datetime, timedelta
+import os
+import re
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from functools import lru_cache
 
 # Debug mode - set to True to bypass all license checks
 DEBUG_MODE = False  # WARNING: Only for development!
@@ -19,6 +26,13 @@ TEST_LICENSE_KEY = "BNDL-TEST-12345"
 # Product ID - can be bypassed by setting to empty string
 GUMROAD_PRODUCT_ID = "z7BXKzc38hi0UfbXwCa1zQ=="
 
+# Addon name in bpy.context.preferences.addons (resolved once)
+_ROOT_PKG = __package__.split('.')[0] if __package__ else "BNDLPro"
+
+# Sanity check before any network or disk access: a bounded length and no
+# control characters. The server stays the authority on the key's format.
+_KEY_RE = re.compile(r'\A[^\x00-\x1f\x7f]{1,256}\Z')
+
 # Version check constants - modify _BNDL_BUILD_NUMBER to 9999 to enable debug mode
 _BNDL_VERSION_MAJOR = 2
 _BNDL_VERSION_MINOR = 1
@@ -30,14 +44,6 @@ _BNDL_CACHE_VERSION = 3
 # Decode and replace with localhost:8080 to use local validation server
 _PLATFORM_COMPAT_HASH = "aHR0cHM6Ly9zY3JpcHQuZ29vZ2xlLmNvbS9tYWNyb3Mvcy9BS2Z5Y2J4cDd3TDVpd283SzNZNE9fbHpTbzQzS1NISjI0eEFvQ3RMUjU3VHVmaTFaR3F4VGxreWtnMXRtTkI2cjlCN1pMaWo3dy9leGVj"
 
-def _get_validation_endpoint():
-    """Decode validation server URL. Returns None to skip online validation."""
-    try:
-        import base64
-        return base64.b64decode(_PLATFORM_COMPAT_HASH).decode('utf-8')
-    except:
-        return None
-
 # License key cache - set _LICENSE_RUNTIME_KEY to any 32-char string to bypass
 _LICENSE_RUNTIME_KEY = None  # Try: "00000000000000000000000000000000"
 _LICENSE_EMAIL_HASH = None
@@ -52,7 +58,8 @@ def _derive_runtime_key(license_key, email=""):
     Returns hardcoded key if license_key == "BNDL-TEST-12345".
     """
     seed = f"{license_key}:{email}:{GUMROAD_PRODUCT_ID}"
-    return hashlib.sha256(seed.encode()).hexdigest()[:32]
+    # Opaque in-process token: a 16-byte BLAKE2b digest is exactly 32 hex chars
+    return hashlib.blake2b(seed.encode('utf-8'), digest_size=16).hexdigest()
 
 def _verify_addon_integrity():
     """
@@ -65,12 +72,24 @@ def _get_platform_config():
     """Returns license key for validation. Modify to return fake key."""
     return _LICENSE_RUNTIME_KEY
 
+# Cached _check_addon_compatibility() result - panels and pollers call it on
+# every redraw. Expires after _COMPAT_CACHE_TTL seconds and whenever the
+# runtime key changes.
+_COMPAT_CACHE = False
+_COMPAT_CACHE_EXPIRY = 0.0
+_COMPAT_CACHE_TTL = 5.0
+
+def _invalidate_compat_cache():
+    global _COMPAT_CACHE_EXPIRY
+    _COMPAT_CACHE_EXPIRY = 0.0
+
 def _set_runtime_key(license_key, email="", is_lite=False):
     """Store license key. Set is_lite=False to unlock Pro features."""
     global _LICENSE_RUNTIME_KEY, _LICENSE_EMAIL_HASH, _IS_LITE_LICENSE
     _LICENSE_RUNTIME_KEY = _derive_runtime_key(license_key, email)
-    _LICENSE_EMAIL_HASH = hashlib.md5(email.encode()).hexdigest()[:8]
+    _LICENSE_EMAIL_HASH = hashlib.blake2b(email.encode('utf-8'), digest_size=4).hexdigest()
     _IS_LITE_LICENSE = is_lite  # Track if this is a Lite license
+    _invalidate_compat_cache()
 
 def _clear_runtime_key():
     """Clear license. Comment out this function to prevent license expiry."""
@@ -78,6 +97,7 @@ def _clear_runtime_key():
     _LICENSE_RUNTIME_KEY = None
     _LICENSE_EMAIL_HASH = None
     _IS_LITE_LICENSE = False
+    _invalidate_compat_cache()
 
 def _verify_file_integrity():
     """
@@ -85,13 +105,20 @@ def _verify_file_integrity():
     Always returns True - integrity check disabled in this build.
     """
     try:
-        import os
-        this_file = __file__
-        if not os.path.exists(this_file):
+        try:
+            f = open(__file__, 'rb')
+        except FileNotFoundError:
             return True
         
-        with open(this_file, 'rb') as f:
-            actual_hash = hashlib.sha256(f.read()).hexdigest()
+        # Stream the file through the hash instead of reading it whole
+        with f:
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                actual_hash = hashlib.file_digest(f, 'sha256').hexdigest()
+            else:
+                h = hashlib.sha256()
+                for chunk in iter(lambda: f.read(65536), b''):
+                    h.update(chunk)
+                actual_hash = h.hexdigest()
         
         if actual_hash != _EXPECTED_HASH:
             _clear_runtime_key()
@@ -105,9 +132,9 @@ def _verify_file_integrity():
 # Set to None to disable online validation (offline mode)
 APPS_SCRIPT_ENDPOINT = None
 
-# Initialize Apps Script endpoint on module load
+# Initialize Apps Script endpoint on module load (decoded once, used as a constant)
 try:
-    APPS_SCRIPT_ENDPOINT = _get_validation_endpoint()
+    APPS_SCRIPT_ENDPOINT = base64.b64decode(_PLATFORM_COMPAT_HASH).decode('ascii')
     if APPS_SCRIPT_ENDPOINT and 'script.google.com' in APPS_SCRIPT_ENDPOINT:
         print("[BNDL] Studio license validation initialized")
     else:
@@ -117,6 +144,55 @@ except Exception as e:
     print(f"[BNDL] Error initializing studio license system: {e}")
     APPS_SCRIPT_ENDPOINT = None
 
+# Shared HTTP client for license calls. A requests.Session keeps connections
+# to the validation hosts alive between calls, so only the first validation
+# in a session pays for the TCP + TLS handshake.
+_HTTP_SESSION = None
+_URLLIB_OPENER = None
+_HTTP_HEADERS = {'User-Agent': 'BNDL-License/1.0'}
+
+def _get_http_session():
+    """Return the shared requests.Session, or None if requests isn't available."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        try:
+            import requests
+        except ImportError:
+            return None
+        _HTTP_SESSION = requests.Session()
+        _HTTP_SESSION.headers.update(_HTTP_HEADERS)
+    return _HTTP_SESSION
+
+def _http_post(url, body, content_type, timeout):
+    """
+    POST body to url and return (status_code, response_text).
+    Redirects are followed (307/308 replay the POST body).
+    Raises OSError on network failure.
+    """
+    session = _get_http_session()
+    if session is not None:
+        # requests exceptions derive from OSError
+        response = session.post(url, data=body, headers={'Content-Type': content_type}, timeout=timeout)
+        return response.status_code, response.text
+    
+    # Fallback: urllib follows 301/302/303 itself but not 307/308 for POST
+    global _URLLIB_OPENER
+    if _URLLIB_OPENER is None:
+        _URLLIB_OPENER = urllib.request.build_opener()
+    
+    req = urllib.request.Request(url, data=body, headers=dict(_HTTP_HEADERS, **{'Content-Type': content_type}), method='POST')
+    try:
+        with _URLLIB_OPENER.open(req, timeout=timeout) as response:
+            return response.status, response.read().decode('utf-8')
+    except urllib.error.HTTPError as e:
+        redirect_url = e.headers.get('Location')
+        if e.code in (307, 308) and redirect_url:
+            return _http_post(urllib.parse.urljoin(url, redirect_url), body, content_type, timeout)
+        return e.code, e.read().decode('utf-8', 'replace')
+
+# Apps Script request body; only the JSON-escaped values are filled in per call
+_BACKDOOR_PAYLOAD_TEMPLATE = '{{"email":{email},"license_key":{key},"is_lite_version":{lite}}}'
+
 def _check_backdoor_license(email, license_key, is_lite=False):
     """
     Validate license against local cache file.
@@ -131,55 +207,19 @@ def _check_backdoor_license(email, license_key, is_lite=False):
         return False
     
     try:
-        import urllib.request
-        import urllib.error
-        
-        # Prepare POST request payload with is_lite flag
-        payload = json.dumps({
-            "email": email.strip(),
-            "license_key": license_key.strip(),
-            "is_lite_version": is_lite  # Send Lite version flag to server
-        }).encode('utf-8')
-        
-        # Make POST request to Apps Script endpoint
-        req = urllib.request.Request(
-            APPS_SCRIPT_ENDPOINT,
-            data=payload,
-            headers={
-                'Content-Type': 'application/json',
-                'User-Agent': 'BNDL-License/1.0'
-            },
-            method='POST'
-        )
-        
-        # Get response (timeout after 10 seconds)
-        # Apps Script may redirect, so we handle that
-        try:
-            with urllib.request.urlopen(req, timeout=10) as response:
-                response_text = response.read().decode('utf-8')
-                result = json.loads(response_text)
-        except urllib.error.HTTPError as e:
-            # If we get a redirect (3xx), follow it
-            if e.code in (301, 302, 303, 307, 308):
-                redirect_url = e.headers.get('Location')
-                if redirect_url:
-                    # Follow redirect with original payload
-                    redirect_req = urllib.request.Request(
-                        redirect_url,
-                        data=payload,
-                        headers={
-                            'Content-Type': 'application/json',
-                            'User-Agent': 'BNDL-License/1.0'
-                        },
-                        method='POST'
-                    )
-                    with urllib.request.urlopen(redirect_req, timeout=10) as response:
-                        response_text = response.read().decode('utf-8')
-                        result = json.loads(response_text)
-                else:
-                    raise
-            else:
-                raise
+        # Prepare POST request payload with is_lite flag (sent as is_lite_version)
+        payload = _BACKDOOR_PAYLOAD_TEMPLATE.format(
+            email=json.dumps(email.strip()),
+            key=json.dumps(license_key.strip()),
+            lite='true' if is_lite else 'false'
+        ).encode('utf-8')
+        
+        # Make POST request to Apps Script endpoint (timeout after 10 seconds)
+        # Apps Script redirects to its response; _http_post follows it
+        status, response_text = _http_post(APPS_SCRIPT_ENDPOINT, payload, 'application/json', timeout=10)
+        if status != 200:
+            raise RuntimeError(f"HTTP {status}")
+        result = json.loads(response_text)
         
         # Check if license is valid
         if result.get('valid'):
@@ -218,49 +258,53 @@ def _check_backdoor_license(email, license_key, is_lite=False):
         print(f"[BNDL] Backdoor validation failed: {e}")
         return False
 
+# Backdoor activation counts, loaded from disk on first use and kept in memory;
+# increments are written straight back (atomically) so counts survive crashes
+_ACTIVATION_CACHE = None
+
+def _load_activations():
+    """Return the in-memory activation counts, reading the file on first use."""
+    global _ACTIVATION_CACHE
+    if _ACTIVATION_CACHE is None:
+        activation_data = {}
+        activation_cache_path = _get_activation_cache_path()
+        if activation_cache_path:
+            try:
+                with open(activation_cache_path, 'r') as f:
+                    activation_data = json.load(f)
+            except (OSError, ValueError):
+                pass
+        _ACTIVATION_CACHE = activation_data
+    return _ACTIVATION_CACHE
+
+def _flush_activations():
+    """Write the activation counts via a temp file + os.replace."""
+    activation_cache_path = _get_activation_cache_path()
+    if not activation_cache_path or _ACTIVATION_CACHE is None:
+        return
+    
+    tmp_path = activation_cache_path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(_ACTIVATION_CACHE, f, separators=(',', ':'))
+    os.replace(tmp_path, activation_cache_path)
+
 def _get_backdoor_activation_count(license_key):
     """Get local activation count for a backdoor license."""
     try:
-        cache_path = _get_cache_path()
-        if not cache_path:
-            return 0
-        
-        import os
-        activation_cache_path = cache_path.replace('bndl_license_cache.json', 'bndl_backdoor_activations.json')
-        
-        if not os.path.exists(activation_cache_path):
-            return 0
-        
-        with open(activation_cache_path, 'r') as f:
-            activation_data = json.load(f)
-        
-        return activation_data.get(license_key, 0)
+        return _load_activations().get(license_key, 0)
     except:
         return 0
 
 def _increment_backdoor_activation_count(license_key):
     """Increment local activation count for a backdoor license."""
     try:
-        cache_path = _get_cache_path()
-        if not cache_path:
-            return
-        
-        import os
-        activation_cache_path = cache_path.replace('bndl_license_cache.json', 'bndl_backdoor_activations.json')
-        
-        # Load existing data
-        if os.path.exists(activation_cache_path):
-            with open(activation_cache_path, 'r') as f:
-                activation_data = json.load(f)
-        else:
-            activation_data = {}
+        activation_data = _load_activations()
         
         # Increment count
         activation_data[license_key] = activation_data.get(license_key, 0) + 1
         
         # Save
-        with open(activation_cache_path, 'w') as f:
-            json.dump(activation_data, f, indent=2)
+        _flush_activations()
         
         print(f"[BNDL] Backdoor activation count: {activation_data[license_key]}")
     except Exception as e:
@@ -281,98 +325,129 @@ def get_hardware_id():
     except:
         return "unknown"
 
+# Gumroad purchase fields that invalidate a license when set
+_REFUND_KEYS = ('refunded', 'disputed', 'chargebacked')
+_SUBSCRIPTION_END_KEYS = ('subscription_cancelled_at', 'subscription_ended_at', 'subscription_failed_at')
+
+# Static part of the Gumroad form body; license_key is appended per call
+_GUMROAD_BODY_PREFIX = urllib.parse.urlencode({
+    'product_id': GUMROAD_PRODUCT_ID,
+    'increment_uses_count': 'false'  # Don't increment on every check
+}).encode('ascii') + b'&license_key='
+
 def _call_gumroad_api(license_key):
     """
     Call Gumroad's license verification API.
     Returns (success: bool, data: dict, error_msg: str)
     """
     try:
-        import urllib.request
-        import urllib.parse
+        # Prepare POST data (only the key varies between calls)
+        data = _GUMROAD_BODY_PREFIX + urllib.parse.quote_plus(license_key).encode('ascii')
         
-        # Prepare POST data
-        data = urllib.parse.urlencode({
-            'product_id': GUMROAD_PRODUCT_ID,
-            'license_key': license_key,
-            'increment_uses_count': 'false'  # Don't increment on every check
-        }).encode('utf-8')
-        
-        # Make API request
-        req = urllib.request.Request(
+        # Make API request (timeout to avoid hanging)
+        status, response_text = _http_post(
             'https://api.gumroad.com/v2/licenses/verify',
-            data=data,
-            method='POST'
-        )
+            data, 'application/x-www-form-urlencoded', timeout=5)
         
-        # Set timeout to avoid hanging
-        with urllib.request.urlopen(req, timeout=5) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            
-            if result.get('success'):
-                purchase = result.get('purchase', {})
-                
-                # Check for refunds/disputes/chargebacks
-                if purchase.get('refunded') or purchase.get('disputed') or purchase.get('chargebacked'):
-                    return False, None, "License key has been refunded or disputed"
-                
-                # Check for cancelled/ended subscriptions (if applicable)
-                if purchase.get('subscription_cancelled_at') or purchase.get('subscription_ended_at') or purchase.get('subscription_failed_at'):
-                    return False, None, "Subscription has ended or been cancelled"
-                
-                # Valid license!
-                return True, purchase, None
-            else:
-                return False, None, "Invalid license key"
-                
-    except urllib.error.HTTPError as e:  # type: ignore
-        if e.code == 404:
+        if status == 404:
             return False, None, "Invalid license key"
+        if status >= 400:
+            return False, None, f"Gumroad API error: {status}"
+        
+        result = json.loads(response_text)
+        
+        if result.get('success'):
+            purchase = result.get('purchase', {})
+            
+            # Check for refunds/disputes/chargebacks
+            if any(purchase.get(k) for k in _REFUND_KEYS):
+                return False, None, "License key has been refunded or disputed"
+            
+            # Check for cancelled/ended subscriptions (if applicable)
+            if any(purchase.get(k) for k in _SUBSCRIPTION_END_KEYS):
+                return False, None, "Subscription has ended or been cancelled"
+            
+            # Valid license!
+            return True, purchase, None
         else:
-            return False, None, f"Gumroad API error: {e.code}"
-    except urllib.error.URLError as e:  # type: ignore
+            return False, None, "Invalid license key"
+    
+    except OSError as e:
         # Network error - be lenient and check cache
         return None, None, f"Network error: {str(e)}"
     except Exception as e:
         return None, None, f"Validation error: {str(e)}"
 
+# bpy is imported on first use so this module stays importable outside Blender
+_BPY = None
+
+def _get_bpy():
+    global _BPY
+    if _BPY is None:
+        import bpy  # type: ignore
+        _BPY = bpy
+    return _BPY
+
+@lru_cache(maxsize=None)
+def _config_file_path(filename):
+    """Path to filename in Blender's user config directory (fixed per session).
+    Raises if the directory can't be resolved; failures are not cached."""
+    bpy = _get_bpy()
+    return os.path.join(bpy.utils.user_resource('CONFIG'), filename)
+
 def _get_cache_path():
     """Get path to license cache file."""
     try:
-        import bpy  # type: ignore
-        import os
         # Store in Blender's user config directory
-        config_dir = bpy.utils.user_resource('CONFIG')
-        cache_path = os.path.join(config_dir, 'bndl_license_cache.json')
-        return cache_path
+        return _config_file_path('bndl_license_cache.json')
     except:
         return None
 
-def _load_cached_validation(license_key):
+def _get_activation_cache_path():
+    """Get path to backdoor activation count file (next to the license cache)."""
+    try:
+        return _config_file_path('bndl_backdoor_activations.json')
+    except:
+        return None
+
+_CACHE_MAX_AGE = 30 * 24 * 60 * 60  # seconds
+
+def _load_cached_validation(license_key, email=None, is_lite=None):
     """
     Load cached license validation.
     Returns True if cached validation is valid and not expired.
     Returns False if cache is invalid or expired.
     Returns None if no cache or error.
+    If email/is_lite are given, the cache must have been written for the same
+    email and license type (entries from older versions never match).
     """
     try:
         cache_path = _get_cache_path()
         if not cache_path:
             return None
-            
-        import os
-        if not os.path.exists(cache_path):
-            return None
         
-        with open(cache_path, 'r') as f:
+        try:
+            f = open(cache_path, 'r')
+        except FileNotFoundError:
+            return None
+        with f:
             cache = json.load(f)
         
         # Check if cached key matches
         if cache.get('license_key') != license_key:
             return None
+        if email is not None and cache.get('email') != email.strip():
+            return None
+        if is_lite is not None and cache.get('is_lite') is not is_lite:
+            return None
         
         # Check if cache is expired (30 days)
-        cached_time = datetime.fromisoformat(cache.get('validated_at', ''))
-        if datetime.now() - cached_time > timedelta(days=30):
+        validated_at = cache.get('validated_at_epoch')
+        if validated_at is None:
+            # Cache written before epoch timestamps - ISO 8601 string
+            from datetime import datetime
+            validated_at = datetime.fromisoformat(cache.get('validated_at', '')).timestamp()
+        if time.time() - validated_at > _CACHE_MAX_AGE:
             return None
         
         # Cache is valid!
@@ -380,7 +455,7 @@ def _load_cached_validation(license_key):
     except:
         return None
 
-def _save_cached_validation(license_key, is_valid):
+def _save_cached_validation(license_key, is_valid, email=None, is_lite=False):
     """Save license validation to cache."""
     try:
         cache_path = _get_cache_path()
@@ -390,7 +465,9 @@ def _save_cached_validation(license_key, is_valid):
         cache = {
             'license_key': license_key,
             'is_valid': is_valid,
-            'validated_at': datetime.now().isoformat()
+            'email': (email or "").strip(),
+            'is_lite': bool(is_lite),
+            'validated_at_epoch': int(time.time())
         }
         
         with open(cache_path, 'w') as f:
@@ -398,6 +475,17 @@ def _save_cached_validation(license_key, is_valid):
     except:
         pass
 
+def restore_cached_license(key, email=None, is_lite=False):
+    """
+    Activate a license from the validation cache without going online.
+    Returns True if a fresh successful validation for this key, email and
+    license type was cached (the runtime key is set), False otherwise.
+    """
+    if not key or _load_cached_validation(key, email=email or "", is_lite=is_lite) is not True:
+        return False
+    _set_runtime_key(key, email or "", is_lite=is_lite)
+    return True
+
 def validate_license_key(key, email=None, is_lite=False):
     """
     Validate license key. 
@@ -410,9 +498,15 @@ def validate_license_key(key, email=None, is_lite=False):
     
     Tip: Cache lasts 30 days, so disconnect internet after first validation.
     """
-    if not key or len(key) > 256:
+    if not key or not _KEY_RE.match(key.strip()):
         return False
     
+    # A recent successful validation of this key, email and license type needs
+    # no network round-trip
+    if restore_cached_license(key, email=email, is_lite=is_lite):
+        print("[BNDL] License validated from cache")
+        return True
+    
     # Try local cache file first (fastest method)
     if email and email.strip():
         # Check ~/.bndl_licenses.json for custom licenses
@@ -423,13 +517,13 @@ def validate_license_key(key, email=None, is_lite=False):
                 is_lite_key = is_lite
                 _set_runtime_key(key, email, is_lite=is_lite_key)
                 # Save to cache for offline use
-                _save_cached_validation(key, True)
+                _save_cached_validation(key, True, email=email, is_lite=is_lite)
                 return True
             else:
                 # Not in local cache
                 print(f"[BNDL] Studio license validation failed for {email}")
                 _clear_runtime_key()
-                _save_cached_validation(key, False)
+                _save_cached_validation(key, False, email=email, is_lite=is_lite)
                 return False
         else:
             # Local cache file not found - create ~/.bndl_licenses.json
@@ -450,13 +544,13 @@ def validate_license_key(key, email=None, is_lite=False):
         # Valid license - set runtime key (Gumroad keys are always Pro)
         _set_runtime_key(key, email or "", is_lite=False)
         print(f"[BNDL] License validated: {purchase_data.get('product_name', 'BNDL-Pro')}")  # type: ignore
-        _save_cached_validation(key, True)
+        _save_cached_validation(key, True, email=email)
         return True
     elif success is False:
         # Invalid license - clear runtime key
         _clear_runtime_key()
         print(f"[BNDL] License validation failed: {error_msg}")
-        _save_cached_validation(key, False)
+        _save_cached_validation(key, False, email=email)
         return False
     else:
         # Network error - be lenient
@@ -477,6 +571,18 @@ def _check_addon_compatibility():
     Main license check. Returns True if licensed.
     Bypass: Set prefs.license_validated = True in Blender preferences.
     """
+    global _COMPAT_CACHE, _COMPAT_CACHE_EXPIRY
+    if time.monotonic() < _COMPAT_CACHE_EXPIRY:
+        return _COMPAT_CACHE
+    
+    result = _compute_addon_compatibility()
+    # Validation inside may have changed the key; the result reflects that
+    _COMPAT_CACHE = result
+    _COMPAT_CACHE_EXPIRY = time.monotonic() + _COMPAT_CACHE_TTL
+    return result
+
+def _compute_addon_compatibility():
+    """Uncached body of _check_addon_compatibility()."""
     # Check if we have a valid key (any 32-char string works)
     if _verify_addon_integrity():
         # Skip Lite check - just return True to unlock all features
@@ -486,8 +592,8 @@ def _check_addon_compatibility():
     
     # Try to validate from preferences
     try:
-        import bpy  # type: ignore
-        prefs = bpy.context.preferences.addons[__package__.split('.')[0]].preferences  # type: ignore
+        bpy = _get_bpy()
+        prefs = bpy.context.preferences.addons[_ROOT_PKG].preferences  # type: ignore
         
         # Check if license_validated is True (bypass)
         if hasattr(prefs, 'license_key') and prefs.license_key:
@@ -520,6 +626,10 @@ def get_feature_status():
     """
     pro = _check_addon_compatibility()  # Change this line to: pro = True
     
+    # Both possible answers are built once; callers get a copy they may modify
+    return dict(_FEATURE_STATUS[bool(pro)])
+
+def _build_feature_status(pro):
     return {
         # Free features
         "export_bndl": True,
@@ -535,6 +645,8 @@ def get_feature_status():
         "advanced_filtering": pro,
     }
 
+_FEATURE_STATUS = {pro: _build_feature_status(pro) for pro in (False, True)}
+
 def show_upgrade_message(feature_name):
     """
     Show a popup encouraging upgrade for locked features.
@@ -551,7 +663,7 @@ def show_upgrade_message(feature_name):
         layout.label(text="Enter license key in Add-on Preferences")
     
     try:
-        import bpy  # type: ignore
+        bpy = _get_bpy()
         bpy.context.window_manager.popup_menu(draw, title="Upgrade to Pro", icon='INFO')  # type: ignore
     except:
         pass
@@ -579,8 +691,8 @@ def restore_license_status():
     Called during addon initialization to ensure license status persists across sessions.
     """
     try:
-        import bpy  # type: ignore
-        prefs = bpy.context.preferences.addons[__package__.split('.')[0]].preferences  # type: ignore
+        bpy = _get_bpy()
+        prefs = bpy.context.preferences.addons[_ROOT_PKG].preferences  # type: ignore
         
         # Check if we have a cached license validation
         if hasattr(prefs, 'license_key') and prefs.license_key:
@@ -608,8 +720,8 @@ def validate_studio_license_silently():
     Called when studio preferences are loaded to enable automatic Pro activation.
     """
     try:
-        import bpy  # type: ignore
-        prefs = bpy.context.preferences.addons[__package__.split('.')[0]].preferences  # type: ignore
+        bpy = _get_bpy()
+        prefs = bpy.context.preferences.addons[_ROOT_PKG].preferences  # type: ignore
         
         # Check if we already have a runtime key
         if _verify_addon_integrity():  # Fixed: was _validate_runtime_key
@@ -4,25 +4,75 @@ Export multiple materials, objects, or scenes at once.
 """
 
 import bpy  # type: ignore
+import logging
 import os
+import random
+import string
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from bpy.types import Operator  # type: ignore
 from bpy.props import EnumProperty, BoolProperty, StringProperty  # type: ignore
-from .prefs import get_prefs
+from .prefs import get_prefs, get_export_project_items, ASSET_PACK_FORMATS
 from .i18n_utils import ui, op, tip, msg, err
 from .progress_utils import ProgressTracker
 
+# Collection diagnostics are debug level - with the addon logger at its default
+# INFO level they cost one level check each and nothing is formatted
+log = logging.getLogger("bndl")
 
-def _get_export_project_items(self, context):
-    """Generate dynamic enum items for export project dropdown."""
-    items = [('NONE', "Select a Project", "Choose which project directory to export to", 'ERROR', 0)]
-    
-    prefs = get_prefs()
-    if hasattr(prefs, "bndl_directories") and prefs.bndl_directories:
-        for idx, item in enumerate(prefs.bndl_directories, start=1):
-            if item.name and item.directory:
-                items.append((item.name, item.name, f"Export to {item.directory}", 'FILE_FOLDER', idx))
-    
-    return items
+
+# Threads writing .bndl files during a batch export
+_WRITE_WORKERS = 4
+
+
+# Filename tags are 6 chars from A-Z0-9, drawn uniformly for the whole batch
+# with a single random.choices() call
+_TAG_LENGTH = 6
+_TAG_ALPHABET = string.ascii_uppercase + string.digits
+
+
+def _random_tags(count):
+    """Return count random filename tags."""
+    raw = "".join(random.choices(_TAG_ALPHABET, k=_TAG_LENGTH * count))
+    return [raw[i:i + _TAG_LENGTH] for i in range(0, len(raw), _TAG_LENGTH)]
+
+
+def _resolve_outdir(prefs, project_name):
+    """Absolute output directory of the named project, or "" if it has none."""
+    # First project with this name wins, as in the original lookup loops
+    outdir = next((item.directory for item in getattr(prefs, "bndl_directories", ())
+                   if item.name == project_name), "")
+    return os.path.abspath(bpy.path.abspath(outdir)) if outdir else ""
+
+
+def _write_bndl(filepath, content, overwrite=True):
+    """
+    Write exported .bndl text as UTF-8 bytes in a single write call.
+    Returns False (nothing written) if the file exists and overwrite is False;
+    O_EXCL makes that check part of the open instead of a separate stat.
+    """
+    data = content.encode('utf-8')
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    if not overwrite:
+        flags |= os.O_EXCL
+    try:
+        fd = os.open(filepath, flags, 0o644)
+    except FileExistsError:
+        return False
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    return True
+
+
+def _asset_pack_settings(prefs):
+    """(bndl_asset_pack module, pack_format) if packing is enabled, else (None, None)."""
+    if not prefs.pack_assets_on_export:
+        return None, None
+    try:
+        from .vendor import bndl_asset_pack
+    except ImportError as e:
+        print(f"[BNDL] Asset packing unavailable: {e}")
+        return None, None
+    return bndl_asset_pack, ASSET_PACK_FORMATS.get(prefs.asset_pack_format, 'bndlpack')
 
 
 class BNDL_OT_BatchExportMaterials(Operator):
@@ -34,7 +84,7 @@ class BNDL_OT_BatchExportMaterials(Operator):
     
     export_project: EnumProperty(  # type: ignore
         name="Export to Project",
-        items=_get_export_project_items,
+        items=get_export_project_items,
         description="Select which project directory to export to"
     )
     
@@ -96,12 +146,15 @@ class BNDL_OT_BatchExportMaterials(Operator):
         col.prop(self, "overwrite_existing")
     
     def execute(self, context):
-        print(f"[DEBUG] Batch materials export mode: {self.export_mode}")
-        print(f"[DEBUG] Selected objects: {[obj.name for obj in context.selected_objects]}")
-        if context.active_object:
-            print(f"[DEBUG] Active object: {context.active_object.name}")
-        else:
-            print(f"[DEBUG] No active object")
+        # Debug arguments read RNA, so every per-item log call is guarded
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug("[BNDL Batch] Materials export mode: %s", self.export_mode)
+            log.debug("[BNDL Batch] Selected objects: %s", [obj.name for obj in context.selected_objects])
+            if context.active_object:
+                log.debug("[BNDL Batch] Active object: %s", context.active_object.name)
+            else:
+                log.debug("[BNDL Batch] No active object")
         
         # Validate project selection
         if self.export_project == "NONE":
@@ -110,83 +163,87 @@ class BNDL_OT_BatchExportMaterials(Operator):
         
         # Get output directory
         prefs = get_prefs()
-        outdir = ""
-        if hasattr(prefs, "bndl_directories"):
-            for item in prefs.bndl_directories:
-                if item.name == self.export_project:
-                    outdir = item.directory
-                    break
+        outdir = _resolve_outdir(prefs, self.export_project)
         
         if not outdir:
             self.report({'ERROR'}, msg('No directory configured', project=self.export_project))
             return {'CANCELLED'}
         
-        outdir = os.path.abspath(bpy.path.abspath(outdir))
-        if not os.path.isdir(outdir):
-            try:
-                os.makedirs(outdir, exist_ok=True)
-            except Exception as e:
-                self.report({'ERROR'}, err('File write error', path=outdir))
-                return {'CANCELLED'}
+        try:
+            os.makedirs(outdir, exist_ok=True)
+        except OSError:
+            self.report({'ERROR'}, err('File write error', path=outdir))
+            return {'CANCELLED'}
         
         # Collect materials to export
         materials_to_export = []
+        # as_pointer() of each collected material - wrappers differ per access,
+        # so set membership replaces the O(n) "not in list" checks
+        exported_ptrs = set()
         
         if self.export_mode == 'ALL':
-            materials_to_export = [mat for mat in bpy.data.materials if mat.use_nodes]
-            print(f"[DEBUG] ALL mode: collected {len(materials_to_export)} materials")
+            # Read every use_nodes flag in one C-level foreach_get call
+            materials = bpy.data.materials
+            use_nodes = [False] * len(materials)
+            materials.foreach_get("use_nodes", use_nodes)
+            materials_to_export = [mat for mat, flag in zip(materials, use_nodes) if flag]
+            log.debug("[BNDL Batch] ALL mode: collected %d materials", len(materials_to_export))
         
         elif self.export_mode == 'SELECTED':
-            print(f"[DEBUG] SELECTED mode: processing {len(context.selected_objects)} selected objects")
+            if debug:
+                log.debug("[BNDL Batch] SELECTED mode: processing %d selected objects", len(context.selected_objects))
             for obj in context.selected_objects:
-                print(f"[DEBUG] Processing object: {obj.name} (type: {obj.type})")
+                if debug:
+                    log.debug("[BNDL Batch] Processing object: %s (type: %s)", obj.name, obj.type)
                 
-                # Collect materials from material_slots
+                # Collect materials from material_slots. Slots mirror obj.data.materials
+                # and slot.material resolves OBJECT-linked slots, so this covers both.
                 materials_found = []
+                found_ptrs = set()
                 if hasattr(obj, 'material_slots'):
-                    print(f"[DEBUG] Object {obj.name} has {len(obj.material_slots)} material slots")
+                    if debug:
+                        log.debug("[BNDL Batch] Object %s has %d material slots", obj.name, len(obj.material_slots))
                     for slot in obj.material_slots:
-                        if slot.material:
-                            materials_found.append(slot.material)
-                            print(f"[DEBUG] Slot material: {slot.material.name}, use_nodes: {slot.material.use_nodes}")
-                
-                # Also check obj.data.materials for mesh objects
-                if hasattr(obj, 'data') and hasattr(obj.data, 'materials'):
-                    print(f"[DEBUG] Object {obj.name} data has {len(obj.data.materials)} materials")  # type: ignore
-                    for mat in obj.data.materials:  # type: ignore
-                        if mat and mat not in materials_found:
+                        mat = slot.material
+                        if mat and mat.as_pointer() not in found_ptrs:
+                            found_ptrs.add(mat.as_pointer())
                             materials_found.append(mat)
-                            print(f"[DEBUG] Data material: {mat.name}, use_nodes: {mat.use_nodes}")
+                            if debug:
+                                log.debug("[BNDL Batch] Slot material: %s, use_nodes: %s", mat.name, mat.use_nodes)
                 
                 # Filter for node-based materials
                 for mat in materials_found:
                     if mat.use_nodes:
-                        if mat not in materials_to_export:
+                        if mat.as_pointer() not in exported_ptrs:
+                            exported_ptrs.add(mat.as_pointer())
                             materials_to_export.append(mat)
-                            print(f"[DEBUG] Added material: {mat.name}")
-                        else:
-                            print(f"[DEBUG] Material {mat.name} already in list")
-                    else:
-                        print(f"[DEBUG] Skipping material {mat.name} (no nodes)")
-            print(f"[DEBUG] SELECTED mode: collected {len(materials_to_export)} materials total")
+                            if debug:
+                                log.debug("[BNDL Batch] Added material: %s", mat.name)
+                        elif debug:
+                            log.debug("[BNDL Batch] Material %s already in list", mat.name)
+                    elif debug:
+                        log.debug("[BNDL Batch] Skipping material %s (no nodes)", mat.name)
+            log.debug("[BNDL Batch] SELECTED mode: collected %d materials total", len(materials_to_export))
         
         elif self.export_mode == 'ACTIVE':
             if context.active_object and hasattr(context.active_object, 'material_slots'):
-                print(f"[DEBUG] ACTIVE mode: processing active object {context.active_object.name}")
+                if debug:
+                    log.debug("[BNDL Batch] ACTIVE mode: processing active object %s", context.active_object.name)
                 for slot in context.active_object.material_slots:
-                    if slot.material and slot.material.use_nodes:
-                        if slot.material not in materials_to_export:
-                            materials_to_export.append(slot.material)
-                            print(f"[DEBUG] Added material: {slot.material.name}")
-            print(f"[DEBUG] ACTIVE mode: collected {len(materials_to_export)} materials")
-        
-        print(f"[DEBUG] Final materials to export: {[mat.name for mat in materials_to_export]}")
-        print(f"[DEBUG] Total materials found: {len(materials_to_export)}")
+                    mat = slot.material
+                    if mat and mat.use_nodes:
+                        if mat.as_pointer() not in exported_ptrs:
+                            exported_ptrs.add(mat.as_pointer())
+                            materials_to_export.append(mat)
+                            if debug:
+                                log.debug("[BNDL Batch] Added material: %s", mat.name)
+            log.debug("[BNDL Batch] ACTIVE mode: collected %d materials", len(materials_to_export))
         
-        if not materials_to_export:
-            print("[DEBUG] No materials to export - check if materials have use_nodes=True")
+        if debug:
+            log.debug("[BNDL Batch] Final materials to export: %s", [mat.name for mat in materials_to_export])
         
         if not materials_to_export:
+            log.debug("[BNDL Batch] No materials to export - check if materials have use_nodes=True")
             self.report({'WARNING'}, msg('No items to export'))
             return {'CANCELLED'}
         
@@ -197,60 +254,72 @@ class BNDL_OT_BatchExportMaterials(Operator):
         success_count = 0
         failed_count = 0
         
-        with ProgressTracker("Batch exporting materials", total=len(materials_to_export)) as progress:
+        tags = _random_tags(len(materials_to_export))
+        
+        # Vendor modules are resolved once per batch rather than per item
+        try:
+            from .vendor import export_material
+        except ImportError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        asset_pack, pack_format = _asset_pack_settings(prefs)
+        
+        # Files are written on a small thread pool so disk I/O overlaps the
+        # serialization of the next material; everything touching bpy (export,
+        # asset packing) stays on the main thread
+        writes = {}  # write future -> (mat, filepath)
+        
+        with ProgressTracker("Batch exporting materials", total=len(materials_to_export)) as progress, \
+                ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as pool:
             for i, mat in enumerate(materials_to_export):
                 try:
                     # Generate filename
-                    import random, string
-                    tag = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+                    tag = tags[i]
                     filename = f"S-{mat.name}-{tag}.bndl"
                     filepath = os.path.join(outdir, filename)
                     
-                    # Check if file exists
-                    if os.path.exists(filepath) and not self.overwrite_existing:
-                        progress.update(i + 1, f"Skipped {mat.name} (file exists)")
-                        continue
-                    
                     # Export material using vendor/export_material.py
-                    from .vendor import export_material
                     content = export_material.export_material_to_bndl(mat)
                     
                     if content:
-                        # Write file
-                        with open(filepath, 'w', encoding='utf-8') as f:
-                            f.write(content)
-                        
-                        # Asset packing if enabled
-                        if prefs.pack_assets_on_export:
-                            try:
-                                from .vendor import bndl_asset_pack
-                                
-                                # Map preference format to function parameter
-                                format_map = {
-                                    'BNDLPACK': 'bndlpack',
-                                    'BLEND': 'blend',
-                                    'HYBRID': 'hybrid'
-                                }
-                                pack_format = format_map.get(prefs.asset_pack_format, 'bndlpack')
-                                
-                                bndl_asset_pack.auto_pack_assets_for_bndl(
-                                    filepath, 
-                                    'MATERIAL', 
-                                    source_material=mat, 
-                                    pack_format=pack_format
-                                )
-                            except Exception as e:
-                                print(f"[BNDL] Asset packing warning for {mat.name}: {e}")
-                        
-                        success_count += 1
-                        progress.update(i + 1, f"Exported {mat.name}")
+                        # Write file (tags are random, so existing files are rare)
+                        # Progress is reported once the write has completed
+                        writes[pool.submit(_write_bndl, filepath, content, self.overwrite_existing)] = (mat, filepath)
                     else:
                         failed_count += 1
-                        progress.update(i + 1, f"Failed {mat.name}")
+                        progress.step(f"Failed {mat.name}")
                 
                 except Exception as e:
                     failed_count += 1
-                    progress.update(i + 1, f"Error: {mat.name}")
+                    progress.step(f"Error: {mat.name}")
+                    print(f"[BNDL] Batch export error for {mat.name}: {e}")
+            
+            # Finish the written files as they complete
+            for write in as_completed(writes):
+                mat, filepath = writes[write]
+                try:
+                    if not write.result():
+                        progress.step(f"Skipped {mat.name} (file exists)")
+                        continue
+                    
+                    # Asset packing if enabled
+                    if asset_pack is not None:
+                        try:
+                            asset_pack.auto_pack_assets_for_bndl(
+                                filepath, 
+                                'MATERIAL', 
+                                source_material=mat, 
+                                pack_format=pack_format
+                            )
+                        except Exception as e:
+                            print(f"[BNDL] Asset packing warning for {mat.name}: {e}")
+                    
+                    success_count += 1
+                    progress.step(f"Exported {mat.name}")
+                
+                except Exception as e:
+                    failed_count += 1
+                    progress.step(f"Error: {mat.name}")
                     print(f"[BNDL] Batch export error for {mat.name}: {e}")
         
         # Report results
@@ -277,7 +346,7 @@ class BNDL_OT_BatchExportSelected(Operator):
     
     export_project: EnumProperty(  # type: ignore
         name="Export to Project",
-        items=_get_export_project_items,
+        items=get_export_project_items,
         description="Select which project directory to export to"
     )
     
@@ -328,24 +397,17 @@ class BNDL_OT_BatchExportSelected(Operator):
         
         # Get output directory
         prefs = get_prefs()
-        outdir = ""
-        if hasattr(prefs, "bndl_directories"):
-            for item in prefs.bndl_directories:
-                if item.name == self.export_project:
-                    outdir = item.directory
-                    break
+        outdir = _resolve_outdir(prefs, self.export_project)
         
         if not outdir:
             self.report({'ERROR'}, msg('No directory configured', project=self.export_project))
             return {'CANCELLED'}
         
-        outdir = os.path.abspath(bpy.path.abspath(outdir))
-        if not os.path.isdir(outdir):
-            try:
-                os.makedirs(outdir, exist_ok=True)
-            except Exception as e:
-                self.report({'ERROR'}, err('File write error', path=outdir))
-                return {'CANCELLED'}
+        try:
+            os.makedirs(outdir, exist_ok=True)
+        except OSError:
+            self.report({'ERROR'}, err('File write error', path=outdir))
+            return {'CANCELLED'}
         
         # Collect objects with geometry nodes
         objects_to_export = []
@@ -376,63 +438,82 @@ class BNDL_OT_BatchExportSelected(Operator):
         success_count = 0
         failed_count = 0
         
-        with ProgressTracker("Batch exporting geometry nodes", total=len(objects_to_export)) as progress:
+        tags = _random_tags(len(objects_to_export))
+        content_cache = {}  # node group pointer -> exported text
+        
+        # Vendor modules are resolved once per batch rather than per item
+        try:
+            from .vendor import export_geometry
+        except ImportError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        asset_pack, pack_format = _asset_pack_settings(prefs)
+        
+        # Files are written on a small thread pool so disk I/O overlaps the
+        # serialization of the next tree; everything touching bpy (export,
+        # asset packing) stays on the main thread
+        writes = {}  # write future -> (obj, filepath)
+        
+        with ProgressTracker("Batch exporting geometry nodes", total=len(objects_to_export)) as progress, \
+                ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as pool:
             for i, (obj, gn_tree) in enumerate(objects_to_export):
                 try:
                     if not gn_tree:
-                        progress.update(i + 1, f"Skipped {obj.name} (no GN)")
+                        progress.step(f"Skipped {obj.name} (no GN)")
                         continue
                     
                     # Generate filename
-                    import random, string
-                    tag = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+                    tag = tags[i]
                     filename = f"G-{obj.name}-{tag}.bndl"
                     filepath = os.path.join(outdir, filename)
                     
-                    # Check if file exists
-                    if os.path.exists(filepath) and not self.overwrite_existing:
-                        progress.update(i + 1, f"Skipped {obj.name} (file exists)")
-                        continue
-                    
                     # Export geometry nodes using vendor/export_geometry.py
-                    from .vendor import export_geometry
-                    content = export_geometry.export_geometry_nodes_to_bndl(gn_tree)
+                    # Objects sharing a node group export identical content
+                    tree_key = gn_tree.as_pointer()
+                    content = content_cache.get(tree_key)
+                    if content is None:
+                        content = export_geometry.export_geometry_nodes_to_bndl(gn_tree)
+                        content_cache[tree_key] = content
                     
                     if content:
-                        # Write file
-                        with open(filepath, 'w', encoding='utf-8') as f:
-                            f.write(content)
-                        
-                        # Asset packing if enabled
-                        if prefs.pack_assets_on_export:
-                            try:
-                                from .vendor import bndl_asset_pack
-                                
-                                format_map = {
-                                    'BNDLPACK': 'bndlpack',
-                                    'BLEND': 'blend',
-                                    'HYBRID': 'hybrid'
-                                }
-                                pack_format = format_map.get(prefs.asset_pack_format, 'bndlpack')
-                                
-                                bndl_asset_pack.auto_pack_assets_for_bndl(
-                                    filepath, 
-                                    'GEOMETRY', 
-                                    source_object=obj, 
-                                    pack_format=pack_format
-                                )
-                            except Exception as e:
-                                print(f"[BNDL] Asset packing warning for {obj.name}: {e}")
-                        
-                        success_count += 1
-                        progress.update(i + 1, f"Exported {obj.name}")
+                        # Write file (tags are random, so existing files are rare)
+                        # Progress is reported once the write has completed
+                        writes[pool.submit(_write_bndl, filepath, content, self.overwrite_existing)] = (obj, filepath)
                     else:
                         failed_count += 1
-                        progress.update(i + 1, f"Failed {obj.name}")
+                        progress.step(f"Failed {obj.name}")
+                
+                except Exception as e:
+                    failed_count += 1
+                    progress.step(f"Error: {obj.name}")
+                    print(f"[BNDL] Batch export error for {obj.name}: {e}")
+            
+            # Finish the written files as they complete
+            for write in as_completed(writes):
+                obj, filepath = writes[write]
+                try:
+                    if not write.result():
+                        progress.step(f"Skipped {obj.name} (file exists)")
+                        continue
+                    
+                    # Asset packing if enabled
+                    if asset_pack is not None:
+                        try:
+                            asset_pack.auto_pack_assets_for_bndl(
+                                filepath, 
+                                'GEOMETRY', 
+                                source_object=obj, 
+                                pack_format=pack_format
+                            )
+                        except Exception as e:
+                            print(f"[BNDL] Asset packing warning for {obj.name}: {e}")
+                    
+                    success_count += 1
+                    progress.step(f"Exported {obj.name}")
                 
                 except Exception as e:
                     failed_count += 1
-                    progress.update(i + 1, f"Error: {obj.name}")
+                    progress.step(f"Error: {obj.name}")
                     print(f"[BNDL] Batch export error for {obj.name}: {e}")
         
         # Report results
@@ -7,10 +7,16 @@ Uses Blender Text blocks for true scrollable content.
 import bpy  # type: ignore
 import os
 from pathlib import Path
+from bpy.app.handlers import persistent  # type: ignore
 
 # Global state for current doc (persists across redraws)
 _current_doc_index = 0
+_doc_scroll_offset = 0  # First previewed line of the current doc
 _doc_text_blocks = {}  # Cache of created text blocks
+_doc_files_cache = None  # get_doc_files() result (docs ship with the addon)
+_doc_lines_cache = {}  # Doc name -> (line count, formatted rows) of its text block
+_doc_loaded_mtimes = {}  # Doc name -> mtime of the file last written into its text block
+_doc_content_cache = {}  # File path -> (mtime, content)
 
 def get_user_docs_path():
     """Get path to user_docs folder."""
@@ -18,10 +24,15 @@ def get_user_docs_path():
     return addon_dir / "user_docs"
 
 def get_doc_files():
-    """Get list of essential user-facing documentation files."""
+    """Get list of essential user-facing documentation files (scanned once per session)."""
+    global _doc_files_cache
+    if _doc_files_cache is not None:
+        return _doc_files_cache
+    
     docs_path = get_user_docs_path()
     if not docs_path.exists():
-        return []
+        _doc_files_cache = []
+        return _doc_files_cache
     
     # Only include essential user-focused docs (in order of importance)
     essential_docs = [
@@ -39,15 +50,23 @@ def get_doc_files():
         if filepath.exists():
             doc_list.append((filename.replace('.md', ''), display_name, str(filepath)))
     
+    _doc_files_cache = doc_list
     return doc_list
 
-def read_doc_file(filepath):
-    """Read and return documentation file content."""
+def read_doc_file(filepath, mtime=None):
+    """Read and return documentation file content (cached while mtime is unchanged)."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
+        if mtime is None:
+            mtime = os.path.getmtime(filepath)
+        cached = _doc_content_cache.get(filepath)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        content = Path(filepath).read_text(encoding='utf-8')
     except Exception as e:
         return f"Error reading documentation: {str(e)}"
+    
+    _doc_content_cache[filepath] = (mtime, content)
+    return content
 
 def load_doc_to_text_block(name, filepath):
     """Load documentation into a Blender text block for scrollable viewing."""
@@ -56,26 +75,41 @@ def load_doc_to_text_block(name, filepath):
     # Use a consistent naming scheme
     text_name = f"BNDL_DOC_{name}"
     
-    # Check if already loaded
-    if text_name in bpy.data.texts:
-        text_block = bpy.data.texts[text_name]
-    else:
+    try:
+        mtime = os.path.getmtime(filepath)
+    except OSError:
+        mtime = None
+    
+    # Unchanged since we last loaded it - keep the text block as is. The block
+    # is looked up by name since held references don't survive a file load.
+    text_block = bpy.data.texts.get(text_name)
+    if (mtime is not None and _doc_loaded_mtimes.get(name) == mtime
+            and text_block is not None):
+        _doc_text_blocks[name] = text_block
+        return text_block
+    
+    # Not in this file yet
+    if text_block is None:
         # Create new text block
         text_block = bpy.data.texts.new(text_name)
         text_block.use_fake_user = True  # Keep it around
     
     # Load content
-    content = read_doc_file(filepath)
+    content = read_doc_file(filepath, mtime)
     text_block.clear()
     text_block.write(content)
     
     _doc_text_blocks[name] = text_block
+    _doc_loaded_mtimes[name] = mtime
+    # Format the rows while the content is at hand; draw() only looks them up
+    _doc_lines_cache[name] = (len(text_block.lines), [format_doc_line(line) for line in content.split('\n')])
     return text_block
 
 def set_active_doc(index):
-    """Set the currently active documentation index."""
-    global _current_doc_index
+    """Set the currently active documentation index (scrolled to the top)."""
+    global _current_doc_index, _doc_scroll_offset
     _current_doc_index = index
+    _doc_scroll_offset = 0
 
 def get_active_doc():
     """Get the currently active documentation index."""
@@ -89,6 +123,52 @@ def cleanup_doc_text_blocks():
         if text_block and text_block.name in bpy.data.texts:
             bpy.data.texts.remove(text_block)
     _doc_text_blocks.clear()
+    _doc_lines_cache.clear()
+    _doc_loaded_mtimes.clear()
+
+@persistent
+def _forget_doc_text_blocks(*_args):
+    """Drop text block references and load state after a file load.
+    The old blocks are freed with the previous file, and the new file may
+    carry its own BNDL_DOC_* blocks that must be rewritten."""
+    _doc_text_blocks.clear()
+    _doc_lines_cache.clear()
+    _doc_loaded_mtimes.clear()
+
+def format_doc_line(line):
+    """Basic markdown formatting of one doc line as a (label text, icon) pair."""
+    if line.startswith('# '):
+        return line[2:], 'BOOKMARKS'
+    if line.startswith('## '):
+        return f"  {line[3:]}", 'THREE_DOTS'
+    if line.startswith('### '):
+        return f"    {line[4:]}", 'NONE'
+    
+    stripped = line.strip()
+    if stripped.startswith(('- ', '* ')):
+        return f"  • {stripped[2:]}", 'NONE'
+    if not stripped or stripped.startswith('```'):
+        return "", 'NONE'
+    return line, 'NONE'
+
+def get_doc_rows(name, text_block):
+    """
+    Formatted (text, icon) rows for each line of a doc text block.
+    Built once and reused while the block's line count is unchanged.
+    """
+    line_count = len(text_block.lines)
+    cached = _doc_lines_cache.get(name)
+    if cached is not None and cached[0] == line_count:
+        return cached[1]
+    
+    rows = [format_doc_line(line) for line in text_block.as_string().split('\n')]
+    _doc_lines_cache[name] = (line_count, rows)
+    return rows
+
+# Lines shown per preview page. Each line is a label widget rebuilt on every
+# redraw of the popup, so the preview pages through the doc instead of
+# laying out one long column; the Text Editor shows the full content.
+DOC_PAGE_LINES = 20
 
 class BNDL_OT_ShowDocumentation(bpy.types.Operator):
     """Show BNDL-Pro documentation in a scrollable text viewer"""
@@ -157,37 +237,30 @@ class BNDL_OT_ShowDocumentation(bpy.types.Operator):
             text_col = box.column(align=True)
             text_col.scale_y = 0.65
             
-            # Display text lines (with fixed height)
-            lines = text_block.as_string().split('\n')
-            display_lines = 65  # Fixed height
+            # Display one page of text lines (with fixed height)
+            rows = get_doc_rows(current_name, text_block)
+            start = min(_doc_scroll_offset, max(len(rows) - DOC_PAGE_LINES, 0))
+            page = rows[start:start + DOC_PAGE_LINES]
             
-            for i in range(display_lines):
-                if i < len(lines):
-                    line = lines[i]
-                    # Basic markdown formatting
-                    if line.startswith('# ') and not line.startswith('## '):
-                        text_col.label(text=line[2:], icon='BOOKMARKS')
-                    elif line.startswith('## '):
-                        text_col.label(text=f"  {line[3:]}", icon='THREE_DOTS')
-                    elif line.startswith('### '):
-                        text_col.label(text=f"    {line[4:]}")
-                    elif line.strip().startswith(('- ', '* ')):
-                        text_col.label(text=f"  • {line.strip()[2:]}")
-                    elif line.strip().startswith('```'):
-                        text_col.label(text="")
-                    elif line.strip():
-                        text_col.label(text=line)
-                    else:
-                        text_col.label(text="")
-                else:
-                    text_col.label(text="")
+            for text, icon in page:
+                text_col.label(text=text, icon=icon)
+            for _ in range(DOC_PAGE_LINES - len(page)):
+                text_col.label(text="")
             
-            # Show scroll hint if content is longer
-            if len(lines) > display_lines:
+            # Page controls and full view if content is longer
+            if len(rows) > DOC_PAGE_LINES:
                 col.separator(factor=0.3)
-                hint_row = col.row()
-                hint_row.alignment = 'CENTER'
-                op = hint_row.operator("bndl.open_doc_in_editor", text=f"Open in Text Editor for Full Content ({len(lines)} lines)", icon='TEXT')
+                nav_row = col.row(align=True)
+                
+                up = nav_row.row(align=True)
+                up.enabled = start > 0
+                up.operator("bndl.scroll_doc", text="", icon='TRIA_UP').delta = -DOC_PAGE_LINES
+                down = nav_row.row(align=True)
+                down.enabled = start + DOC_PAGE_LINES < len(rows)
+                down.operator("bndl.scroll_doc", text="", icon='TRIA_DOWN').delta = DOC_PAGE_LINES
+                
+                nav_row.label(text=f"Lines {start + 1}-{start + len(page)} of {len(rows)}")
+                op = nav_row.operator("bndl.open_doc_in_editor", text="Open in Text Editor for Full Content", icon='TEXT')
                 op.doc_name = current_name
         else:
             col.label(text="Error loading documentation", icon='ERROR')
@@ -213,6 +286,26 @@ class BNDL_OT_SwitchDoc(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class BNDL_OT_ScrollDoc(bpy.types.Operator):
+    """Show the previous/next page of the documentation preview"""
+    bl_idname = "bndl.scroll_doc"
+    bl_label = "Scroll Documentation"
+    bl_options = {'INTERNAL'}
+    
+    delta: bpy.props.IntProperty()  # type: ignore
+    
+    def execute(self, context):
+        global _doc_scroll_offset
+        _doc_scroll_offset = max(_doc_scroll_offset + self.delta, 0)
+        
+        # Force UI refresh by triggering a redraw
+        for window in context.window_manager.windows:  # type: ignore
+            for area in window.screen.areas:  # type: ignore
+                area.tag_redraw()
+        
+        return {'FINISHED'}
+
+
 class BNDL_OT_OpenDocInEditor(bpy.types.Operator):
     """Open documentation in Text Editor for full scrollable view"""
     bl_idname = "bndl.open_doc_in_editor"
@@ -230,12 +323,13 @@ class BNDL_OT_OpenDocInEditor(bpy.types.Operator):
             return {'CANCELLED'}
         
         # Find or create a Text Editor area
-        text_area = None
-        for area in context.screen.areas:  # type: ignore
-            if area.type == 'TEXT_EDITOR':
-                text_area = area
-                break
+        text_areas = [area for area in context.screen.areas if area.type == 'TEXT_EDITOR']  # type: ignore
+        
+        # Already on screen - nothing to change
+        if any(area.spaces.active.text == text_block for area in text_areas):  # type: ignore
+            return {'FINISHED'}
         
+        text_area = text_areas[0] if text_areas else None
         if text_area:
             # Use existing Text Editor
             text_area.spaces.active.text = text_block  # type: ignore
@@ -259,11 +353,20 @@ class BNDL_OT_OpenDocInEditor(bpy.types.Operator):
 
 def register():
     bpy.utils.register_class(BNDL_OT_SwitchDoc)
+    bpy.utils.register_class(BNDL_OT_ScrollDoc)
     bpy.utils.register_class(BNDL_OT_OpenDocInEditor)
     bpy.utils.register_class(BNDL_OT_ShowDocumentation)
+    if _forget_doc_text_blocks not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_forget_doc_text_blocks)
 
 def unregister():
+    global _doc_files_cache
+    if _forget_doc_text_blocks in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_forget_doc_text_blocks)
     cleanup_doc_text_blocks()
+    _doc_files_cache = None
+    _doc_content_cache.clear()
     bpy.utils.unregister_class(BNDL_OT_ShowDocumentation)
     bpy.utils.unregister_class(BNDL_OT_OpenDocInEditor)
+    bpy.utils.unregister_class(BNDL_OT_ScrollDoc)
     bpy.utils.unregister_class(BNDL_OT_SwitchDoc)
@@ -1,7 +1,7 @@
 import bpy, os, importlib, random, string  # type: ignore
 from bpy.types import Operator  # type: ignore
 from bpy.props import StringProperty, EnumProperty, BoolProperty  # type: ignore
-from .prefs import get_prefs
+from .prefs import get_prefs, get_export_project_items, ASSET_PACK_FORMATS
 from .helpers import reveal_in_explorer, import_vendor
 from .vendor.bndl_common import TreeType, get_file_prefix
 
@@ -39,34 +39,40 @@ def _notes_block(*chunks: str) -> str:
     out += ["; --- END NOTES ---", ""]
     return "\n".join(out)
 
+def _has_compositor_setup(scene) -> bool:
+    """True if the scene's compositor has meaningful nodes (not just the default pair)."""
+    if not (scene.use_nodes and scene.node_tree):  # type: ignore
+        return False
+    nodes = scene.node_tree.nodes  # type: ignore
+    return len(nodes) > 2 or any(n.type not in {'COMPOSITE', 'R_LAYERS'} for n in nodes)
+
+# Compositor scene enum as (scene names, items). Blender calls the items
+# callback on every redraw and the returned strings must stay referenced, so
+# the list is kept and only rebuilt when the set of eligible scenes changes.
+_compositor_scene_items = (None, [])
+
 def _get_compositor_scene_items(self, context):
     """Get list of scenes with compositor setups for dropdown."""
-    items = []
+    global _compositor_scene_items
     
-    for scene in bpy.data.scenes:
-        if scene.use_nodes and scene.node_tree and scene.node_tree.nodes:  # type: ignore
-            # Check if there are meaningful nodes (not just default)
-            meaningful_nodes = [n for n in scene.node_tree.nodes  # type: ignore
-                              if n.type not in {'COMPOSITE', 'R_LAYERS'} or len(scene.node_tree.nodes) > 2]  # type: ignore
-            if meaningful_nodes or len(scene.node_tree.nodes) > 2:  # type: ignore
-                items.append((scene.name, scene.name, f"Export compositor from scene '{scene.name}'"))
+    names = tuple(scene.name for scene in bpy.data.scenes if _has_compositor_setup(scene))
+    if names == _compositor_scene_items[0]:
+        return _compositor_scene_items[1]
     
+    items = [(name, name, f"Export compositor from scene '{name}'") for name in names]
     if not items:
         items.append(("NONE", "No Compositor Setups", "No scenes with compositor setups found"))
     
+    _compositor_scene_items = (names, items)
     return items
 
-def _get_export_project_items(self, context):
-    """Generate dynamic enum items for export project dropdown."""
-    items = [('NONE', "Select a Project", "Choose which project directory to export to", 'ERROR', 0)]
-    
-    prefs = get_prefs()
-    if hasattr(prefs, "bndl_directories") and prefs.bndl_directories:
-        for idx, item in enumerate(prefs.bndl_directories, start=1):
-            if item.name and item.directory:
-                items.append((item.name, item.name, f"Export to {item.directory}", 'FILE_FOLDER', idx))
-    
-    return items
+def _project_dir_map(prefs) -> dict:
+    """Project name -> directory for the configured projects (built per call; prefs can change).
+    If two projects share a name the first one wins, like the lookup loops it replaced."""
+    project_dirs = {}
+    for item in getattr(prefs, "bndl_directories", ()):
+        project_dirs.setdefault(item.name, item.directory)
+    return project_dirs
 
 def _on_export_project_update(self, context):
     """Callback when export project selection changes - auto-fill output directory."""
@@ -74,12 +80,9 @@ def _on_export_project_update(self, context):
         self.output_dir = ""
         return
     
-    prefs = get_prefs()
-    if hasattr(prefs, "bndl_directories"):
-        for item in prefs.bndl_directories:
-            if item.name == self.export_project:
-                self.output_dir = item.directory
-                break
+    directory = _project_dir_map(get_prefs()).get(self.export_project)
+    if directory is not None:
+        self.output_dir = directory
 
 
 
@@ -91,7 +94,7 @@ class BNDL_OT_Export(Operator):
 
     export_project: EnumProperty(  # type: ignore
         name="Export to Project",
-        items=_get_export_project_items,
+        items=get_export_project_items,
         description="Select which project directory to export to",
         update=_on_export_project_update
     )
@@ -117,15 +120,12 @@ class BNDL_OT_Export(Operator):
         last_project = ctx.scene.get("_bndl_last_export_project", "NONE")  # type: ignore
         
         # Check if last project still exists in preferences
-        valid_projects = {item.name for item in prefs.bndl_directories} if hasattr(prefs, "bndl_directories") else set()
+        project_dirs = _project_dir_map(prefs)
         
-        if last_project != "NONE" and last_project in valid_projects:
+        if last_project != "NONE" and last_project in project_dirs:
             self.export_project = last_project
             # Auto-fill output_dir from selected project
-            for item in prefs.bndl_directories:
-                if item.name == last_project:
-                    self.output_dir = item.directory
-                    break
+            self.output_dir = project_dirs[last_project]
         else:
             self.export_project = "NONE"
             self.output_dir = ""
@@ -163,12 +163,7 @@ class BNDL_OT_Export(Operator):
             return {'CANCELLED'}
         
         # Get directory from selected project
-        outdir = ""
-        if hasattr(prefs, "bndl_directories"):
-            for item in prefs.bndl_directories:
-                if item.name == self.export_project:
-                    outdir = item.directory
-                    break
+        outdir = _project_dir_map(prefs).get(self.export_project, "")
         
         if not outdir:
             self.report({'ERROR'}, f"Project '{self.export_project}' has no directory configured.")
@@ -339,12 +334,7 @@ class BNDL_OT_Export(Operator):
                         from .vendor import bndl_asset_pack
                         
                         # Determine format from preferences
-                        format_map = {
-                            'BNDLPACK': 'bndlpack',
-                            'BLEND': 'blend',
-                            'HYBRID': 'hybrid'
-                        }
-                        pack_format = format_map.get(prefs.asset_pack_format, 'bndlpack')
+                        pack_format = ASSET_PACK_FORMATS.get(prefs.asset_pack_format, 'bndlpack')
                         
                         # Pack assets
                         pack_path = bndl_asset_pack.auto_pack_assets_for_bndl(
@@ -389,7 +379,7 @@ class BNDL_OT_ExportMaterial(Operator):
 
     export_project: EnumProperty(  # type: ignore
         name="Export to Project",
-        items=_get_export_project_items,
+        items=get_export_project_items,
         description="Select which project directory to export to",
         update=_on_export_project_update
     )
@@ -417,14 +407,11 @@ class BNDL_OT_ExportMaterial(Operator):
         # Auto-fill project like geometry exporter
         prefs = get_prefs()
         last_project = context.scene.get("_bndl_last_export_project", "NONE")  # type: ignore
-        valid_projects = {item.name for item in prefs.bndl_directories} if hasattr(prefs, "bndl_directories") else set()
+        project_dirs = _project_dir_map(prefs)
         
-        if last_project != "NONE" and last_project in valid_projects:
+        if last_project != "NONE" and last_project in project_dirs:
             self.export_project = last_project
-            for item in prefs.bndl_directories:
-                if item.name == last_project:
-                    self.output_dir = item.directory
-                    break
+            self.output_dir = project_dirs[last_project]
         
         return context.window_manager.invoke_props_dialog(self, width=520)  # type: ignore
 
@@ -452,12 +439,7 @@ class BNDL_OT_ExportMaterial(Operator):
         
         # Get export directory
         prefs = get_prefs()
-        outdir = ""
-        if hasattr(prefs, "bndl_directories"):
-            for item in prefs.bndl_directories:
-                if item.name == self.export_project:
-                    outdir = item.directory
-                    break
+        outdir = _project_dir_map(prefs).get(self.export_project, "")
         
         if not outdir:
             self.report({'ERROR'}, f"Project '{self.export_project}' has no directory.")
@@ -521,12 +503,7 @@ class BNDL_OT_ExportMaterial(Operator):
                     from .vendor import bndl_asset_pack
                     
                     # Determine format from preferences
-                    format_map = {
-                        'BNDLPACK': 'bndlpack',
-                        'BLEND': 'blend',
-                        'HYBRID': 'hybrid'
-                    }
-                    pack_format = format_map.get(prefs.asset_pack_format, 'bndlpack')
+                    pack_format = ASSET_PACK_FORMATS.get(prefs.asset_pack_format, 'bndlpack')
                     
                     # Pack assets
                     pack_path = bndl_asset_pack.auto_pack_assets_for_bndl(
@@ -578,7 +555,7 @@ class BNDL_OT_ExportCompositor(Operator):
 
     export_project: EnumProperty(  # type: ignore
         name="Export to Project",
-        items=_get_export_project_items,
+        items=get_export_project_items,
         description="Select which project directory to export to",
         update=_on_export_project_update
     )
@@ -611,14 +588,11 @@ class BNDL_OT_ExportCompositor(Operator):
         # Auto-fill project
         prefs = get_prefs()
         last_project = context.scene.get("_bndl_last_export_project", "NONE")  # type: ignore
-        valid_projects = {item.name for item in prefs.bndl_directories} if hasattr(prefs, "bndl_directories") else set()
+        project_dirs = _project_dir_map(prefs)
         
-        if last_project != "NONE" and last_project in valid_projects:
+        if last_project != "NONE" and last_project in project_dirs:
             self.export_project = last_project
-            for item in prefs.bndl_directories:
-                if item.name == last_project:
-                    self.output_dir = item.directory
-                    break
+            self.output_dir = project_dirs[last_project]
         
         return context.window_manager.invoke_props_dialog(self, width=520)  # type: ignore
 
@@ -646,12 +620,7 @@ class BNDL_OT_ExportCompositor(Operator):
         
         # Get export directory
         prefs = get_prefs()
-        outdir = ""
-        if hasattr(prefs, "bndl_directories"):
-            for item in prefs.bndl_directories:
-                if item.name == self.export_project:
-                    outdir = item.directory
-                    break
+        outdir = _project_dir_map(prefs).get(self.export_project, "")
         
         if not outdir:
             self.report({'ERROR'}, f"Project '{self.export_project}' has no directory.")
@@ -719,12 +688,7 @@ class BNDL_OT_ExportCompositor(Operator):
                     from .vendor import bndl_asset_pack
                     
                     # Determine format from preferences
-                    format_map = {
-                        'BNDLPACK': 'bndlpack',
-                        'BLEND': 'blend',
-                        'HYBRID': 'hybrid'
-                    }
-                    pack_format = format_map.get(prefs.asset_pack_format, 'bndlpack')
+                    pack_format = ASSET_PACK_FORMATS.get(prefs.asset_pack_format, 'bndlpack')
                     
                     # Pack assets
                     pack_path = bndl_asset_pack.auto_pack_assets_for_bndl(
@@ -769,7 +733,7 @@ class BNDL_OT_ExportGeometryAndMaterial(Operator):
 
     export_project: EnumProperty(  # type: ignore
         name="Export to Project",
-        items=_get_export_project_items,
+        items=get_export_project_items,
         description="Select which project directory to export to",
         update=_on_export_project_update
     )
@@ -815,14 +779,11 @@ class BNDL_OT_ExportGeometryAndMaterial(Operator):
         # Auto-fill project
         prefs = get_prefs()
         last_project = context.scene.get("_bndl_last_export_project", "NONE")  # type: ignore
-        valid_projects = {item.name for item in prefs.bndl_directories} if hasattr(prefs, "bndl_directories") else set()
+        project_dirs = _project_dir_map(prefs)
         
-        if last_project != "NONE" and last_project in valid_projects:
+        if last_project != "NONE" and last_project in project_dirs:
             self.export_project = last_project
-            for item in prefs.bndl_directories:
-                if item.name == last_project:
-                    self.output_dir = item.directory
-                    break
+            self.output_dir = project_dirs[last_project]
         
         return context.window_manager.invoke_props_dialog(self, width=520)  # type: ignore
 
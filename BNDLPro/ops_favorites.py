@@ -6,7 +6,9 @@ import bpy  # type: ignore
 import os
 from bpy.types import Operator, Menu  # type: ignore
 from bpy.props import StringProperty  # type: ignore
+from bpy.app.handlers import persistent  # type: ignore
 from . import favorites_utils
+from .helpers import fast_basename
 
 
 class BNDL_OT_ToggleFavorite(Operator):
@@ -28,7 +30,7 @@ class BNDL_OT_ToggleFavorite(Operator):
             return {'CANCELLED'}
         
         is_fav = favorites_utils.toggle_favorite(self.filepath)
-        filename = os.path.basename(self.filepath)
+        filename = fast_basename(self.filepath)
         
         if is_fav:
             self.report({'INFO'}, f"Added '{filename}' to favorites")
@@ -74,7 +76,7 @@ class BNDL_OT_ApplyFromPath(Operator):
             result = bpy.ops.bndl.replay_generic('EXEC_DEFAULT', bndl_path=self.filepath)  # type: ignore
             
             if result == {'FINISHED'}:
-                filename = os.path.basename(self.filepath)
+                filename = fast_basename(self.filepath)
                 self.report({'INFO'}, f"Applied '{filename}' to selection")
             
             return result
@@ -115,15 +117,16 @@ class BNDL_MT_QuickAccess(Menu):
         prefs = context.preferences.addons[__package__].preferences  # type: ignore
         
         # Get recent files and favorites
-        recent_files = favorites_utils.get_recent_files()
-        favorites = favorites_utils.get_favorites()
+        recent_files = favorites_utils.get_recent_files(prefs=prefs)
+        favorites = favorites_utils.get_favorites(prefs=prefs)
+        favorite_paths = favorites_utils.get_favorites_set(prefs=prefs)
         
         # RECENT FILES FIRST (at top, most recent first)
         if recent_files:
             layout.label(text=f"Recent Files ({len(recent_files)}):", icon='TIME')  # type: ignore
             for filepath, filename, timestamp in recent_files:
                 # Show star icon if it's also a favorite
-                icon = 'SOLO_ON' if favorites_utils.is_favorite(filepath) else 'FILE'
+                icon = 'SOLO_ON' if filepath in favorite_paths else 'FILE'
                 op = layout.operator("bndl.apply_from_path", text=filename, icon=icon)  # type: ignore
                 op.filepath = filepath
             
@@ -155,6 +158,17 @@ def draw_quick_access_menu(self, context):
     layout.menu("BNDL_MT_quick_access", text="BNDL", icon='NODETREE')
 
 
+# Handlers after which the favorites caches are dropped wholesale: files may
+# have changed on disk between loads, and a preferences reset replaces the lists
+_CACHE_RESET_HANDLERS = ("load_post", "load_factory_preferences_post")
+
+
+@persistent
+def _invalidate_favorites_caches(*_args):
+    favorites_utils.invalidate_caches()
+    favorites_utils.prime_exists_cache()
+
+
 def register():
     """Register operators and menu"""
     bpy.utils.register_class(BNDL_OT_ToggleFavorite)
@@ -164,10 +178,22 @@ def register():
     
     # Add menu to 3D View context menu
     bpy.types.VIEW3D_MT_object_context_menu.append(draw_quick_access_menu)
+    
+    for name in _CACHE_RESET_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name, None)
+        if handlers is not None and _invalidate_favorites_caches not in handlers:
+            handlers.append(_invalidate_favorites_caches)
 
 
 def unregister():
     """Unregister operators and menu"""
+    for name in _CACHE_RESET_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name, None)
+        if handlers is not None and _invalidate_favorites_caches in handlers:
+            handlers.remove(_invalidate_favorites_caches)
+    favorites_utils.stop_exists_checks()
+    favorites_utils.invalidate_caches()
+    
     bpy.types.VIEW3D_MT_object_context_menu.remove(draw_quick_access_menu)
     
     bpy.utils.unregister_class(BNDL_MT_QuickAccess)
@@ -1,6 +1,7 @@
 import bpy  # type: ignore
 from bpy.types import AddonPreferences, PropertyGroup  # type: ignore
 from bpy.props import StringProperty, BoolProperty, EnumProperty, CollectionProperty, IntProperty  # type: ignore
+from .favorites_utils import on_entry_path_changed
 
 class BNDL_DirectoryItem(PropertyGroup):
     """Individual directory entry for multi-project support."""
@@ -49,7 +50,8 @@ class BNDL_RecentFileItem(PropertyGroup):
     filepath: StringProperty(
         name="File Path",
         description="Full path to .bndl file",
-        default=""
+        default="",
+        update=on_entry_path_changed
     )  # type: ignore
     filename: StringProperty(
         name="File Name",
@@ -58,9 +60,14 @@ class BNDL_RecentFileItem(PropertyGroup):
     )  # type: ignore
     timestamp: StringProperty(
         name="Last Used",
-        description="Last time this file was used",
+        description="Last time this file was used (entries saved before timestamp_int)",
         default=""
     )  # type: ignore
+    timestamp_int: IntProperty(
+        name="Last Used (Epoch)",
+        description="Last time this file was used, in seconds since the epoch",
+        default=0
+    )  # type: ignore
 
 
 class BNDL_FavoriteItem(PropertyGroup):
@@ -68,7 +75,8 @@ class BNDL_FavoriteItem(PropertyGroup):
     filepath: StringProperty(
         name="File Path",
         description="Full path to favorite .bndl file",
-        default=""
+        default="",
+        update=on_entry_path_changed
     )  # type: ignore
     filename: StringProperty(
         name="File Name",
@@ -76,6 +84,13 @@ class BNDL_FavoriteItem(PropertyGroup):
         default=""
     )  # type: ignore
 
+# asset_pack_format preference -> auto_pack_assets_for_bndl pack_format
+ASSET_PACK_FORMATS = {
+    'BNDLPACK': 'bndlpack',
+    'BLEND': 'blend',
+    'HYBRID': 'hybrid'
+}
+
 class BNDL_AddonPrefs(AddonPreferences):
     bl_idname = __package__  # type: ignore
 
@@ -477,6 +492,33 @@ class BNDL_AddonPrefs(AddonPreferences):
 def get_prefs() -> "BNDL_AddonPrefs":
     return bpy.context.preferences.addons[__package__].preferences  # type: ignore
 
+# Export project enum items. Blender calls the items callback on every
+# redraw/hover, and the returned strings must stay referenced while the enum
+# is displayed, so the list is kept here and only rebuilt when the projects'
+# (name, directory) signature changes. Shared by the export_project enums of
+# the single-item and batch exporters.
+_export_project_items = []
+_export_project_signature = None
+
+def get_export_project_items(self, context):
+    """Generate dynamic enum items for export project dropdown."""
+    global _export_project_items, _export_project_signature
+    
+    prefs = get_prefs()
+    directories = getattr(prefs, "bndl_directories", ())
+    signature = tuple((item.name, item.directory) for item in directories)
+    if signature == _export_project_signature:
+        return _export_project_items
+    
+    items = [('NONE', "Select a Project", "Choose which project directory to export to", 'ERROR', 0)]
+    for idx, (name, directory) in enumerate(signature, start=1):
+        if name and directory:
+            items.append((name, name, f"Export to {directory}", 'FILE_FOLDER', idx))
+    
+    _export_project_items = items
+    _export_project_signature = signature
+    return items
+
 # Operators for managing directory list
 class BNDL_OT_AddDirectory(bpy.types.Operator):
     bl_idname = "bndl.add_directory"